@@ -0,0 +1 @@
+"""Performance benchmarks, run them with `python -m benchmarks.<name>`."""
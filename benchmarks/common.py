@@ -0,0 +1,205 @@
+"""Shared helpers for the benchmark suite."""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINES = Path(__file__).resolve().parent / "baselines"
+
+Results = Dict[str, float]
+
+
+def timeit(func: Callable[[], Any], repeat: int = 5, number: int = 1, setup: Optional[Callable] = None) -> float:
+    """Best wall time of a single call in seconds, with the garbage collector disabled like `timeit` does."""
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - start) / number)
+        finally:
+            gc.enable()
+    return min(timings)
+
+
+def run_python(code: str, repeat: int = 5) -> List[dict]:
+    """Run `code` in fresh interpreters, the code must print a json object as its last line."""
+    results = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT, text=True)
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return results
+
+
+def median_of(results: List[dict], key: str) -> float:
+    return statistics.median(result[key] for result in results)
+
+
+@contextmanager
+def mock_kubernetes() -> Iterator[Dict[str, mock.MagicMock]]:
+    """Mock the kubernetes ApiClient, discoverer and config loaders, same as `tests/conftest.py`."""
+    import kubernetes_dynamic._kubernetes as k8s
+
+    with ExitStack() as stack:
+        patch = stack.enter_context
+        discoverer = patch(mock.patch.object(k8s.dynamic, "LazyDiscoverer"))
+        api_client = patch(mock.patch.object(k8s, "ApiClient", autospec=True))
+        api_client.return_value.configuration = mock.MagicMock()
+        patch(mock.patch.object(k8s.InClusterConfigLoader, "__init__", return_value=None))
+        patch(mock.patch.object(k8s.InClusterConfigLoader, "load_and_set", side_effect=k8s.ConfigException))
+        patch(mock.patch.object(k8s.KubeConfigLoader, "__init__", return_value=None))
+        patch(mock.patch.object(k8s.KubeConfigLoader, "load_and_set", autospec=True))
+        patch(mock.patch.object(k8s.KubeConfigLoader, "set_active_context", autospec=True))
+        patch(mock.patch.object(k8s, "_get_kube_config_loader", autospec=True))
+        yield {"discoverer": discoverer, "api_client": api_client}
+
+
+def fake_resource(client: Any, kind: str = "Pod", api_version: str = "v1", name: str = "pods") -> Any:
+    """A discovered core resource, as returned by the discoverer for `K8sClient.get_api`."""
+    from kubernetes_dynamic import _kubernetes
+
+    return _kubernetes.dynamic.Resource(
+        prefix="api",
+        api_version=api_version,
+        kind=kind,
+        namespaced=True,
+        name=name,
+        preferred=True,
+        client=client,
+        verbs=["get", "list", "watch"],
+    )
+
+
+def fake_response(data: bytes) -> mock.MagicMock:
+    """urllib3 response stand-in, as returned by `ApiClient.call_api` with `_preload_content=False`."""
+    response = mock.MagicMock(data=data)
+    response.__bool__.return_value = True
+    return response
+
+
+def pod(index: int, namespace: str = "default") -> dict:
+    """A realistic pod definition."""
+    name = f"pod-{index}"
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": f"00000000-0000-0000-0000-{index:012d}",
+            "resourceVersion": str(1000 + index),
+            "creationTimestamp": "2023-01-01T00:00:00Z",
+            "labels": {"app": "bench", "pod-template-hash": "abcdef"},
+            "annotations": {"kubernetes.io/psp": "restricted"},
+            "ownerReferences": [
+                {"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": "bench-abcdef", "uid": "1", "controller": True}
+            ],
+            "managedFields": [
+                {
+                    "manager": "kube-controller-manager",
+                    "operation": "Update",
+                    "apiVersion": "v1",
+                    "time": "2023-01-01T00:00:00Z",
+                    "fieldsType": "FieldsV1",
+                    "fieldsV1": {"f:metadata": {"f:labels": {".": {}, "f:app": {}}}, "f:spec": {"f:containers": {}}},
+                }
+            ],
+        },
+        "spec": {
+            "nodeName": f"node-{index % 50}",
+            "containers": [
+                {
+                    "name": "app",
+                    "image": "registry.local/app:1.0.0",
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "env": [{"name": f"ENV_{i}", "value": str(i)} for i in range(10)],
+                    "resources": {"limits": {"cpu": "1", "memory": "1Gi"}, "requests": {"cpu": "100m"}},
+                    "volumeMounts": [{"name": "data", "mountPath": "/data"}],
+                }
+            ],
+            "volumes": [{"name": "data", "emptyDir": {}}],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": "10.0.0.1",
+            "conditions": [{"type": "Ready", "status": "True", "lastTransitionTime": "2023-01-01T00:00:00Z"}],
+            "containerStatuses": [
+                {"name": "app", "ready": True, "restartCount": 0, "image": "registry.local/app:1.0.0", "state": {}}
+            ],
+        },
+    }
+
+
+def pod_list(count: int) -> dict:
+    return {
+        "kind": "PodList",
+        "apiVersion": "v1",
+        "metadata": {"resourceVersion": "1000"},
+        "items": [pod(index) for index in range(count)],
+    }
+
+
+def environment() -> Dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform()}
+
+
+def compare(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    """List the results that are worse than the baseline by more than `tolerance` (relative).
+
+    Results are lower-is-better, except rates named `*_per_second`.
+    """
+    regressions = []
+    for key, value in results.items():
+        reference = baseline.get(key)
+        if not reference:
+            continue
+        if key.endswith("_per_second"):
+            if value < reference / (1 + tolerance):
+                regressions.append(f"{key}: {value:.6g} < {reference:.6g} ({(value / reference - 1) * 100:.1f}%)")
+        elif value > reference * (1 + tolerance):
+            regressions.append(f"{key}: {value:.6g} > {reference:.6g} (+{(value / reference - 1) * 100:.1f}%)")
+    return regressions
+
+
+def main(name: str, collect: Callable[[], Results], argv: Optional[List[str]] = None) -> int:
+    """Command line entrypoint shared by every benchmark module."""
+    parser = argparse.ArgumentParser(f"benchmarks.{name}")
+    parser.add_argument("--output", "-o", type=Path, help="Write results as json to this file.")
+    parser.add_argument(
+        "--baseline", "-b", type=Path, default=BASELINES / f"{name}.json", help="Baseline json to compare against."
+    )
+    parser.add_argument("--tolerance", "-t", type=float, default=0.25, help="Allowed relative slowdown.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    args = parser.parse_args(argv)
+
+    results = collect()
+    document = {"benchmark": name, "environment": environment(), "results": results}
+    text = json.dumps(document, indent=2, sort_keys=True)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(text + "\n")
+        return 0
+    if not args.baseline.exists():
+        return 0
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
@@ -0,0 +1,42 @@
+"""Lookups in an informer cache of 10k pods: an index against a linear scan like `K8sClient.find` does."""
+from __future__ import annotations
+
+import sys
+
+from .common import Results, main, pod_list, timeit
+
+ITEMS = 10000
+LOOKUPS = 100
+
+
+def collect() -> Results:
+    from kubernetes_dynamic.client import serialize_object
+    from kubernetes_dynamic.informer import Store, index_by_node_name
+    from kubernetes_dynamic.models.pod import V1Pod
+
+    pods = serialize_object(pod_list(ITEMS), V1Pod, lazy=True)
+    store = Store({"node": index_by_node_name})
+    store.replace(pods, "1000")
+    nodes = [f"node-{index % 50}" for index in range(LOOKUPS)]
+
+    def scan():
+        for node in nodes:
+            [pod for pod in store.list() if pod.spec.nodeName == node]
+
+    def indexed():
+        for node in nodes:
+            store.by_index("node", node)
+
+    def update():
+        for pod in pods.data[:LOOKUPS]:
+            store.update(pod)
+
+    return {
+        f"scan_{LOOKUPS}_lookups_{ITEMS}_pods_seconds": timeit(scan, repeat=3),
+        f"by_index_{LOOKUPS}_lookups_{ITEMS}_pods_seconds": timeit(indexed, repeat=3),
+        f"indexed_update_{LOOKUPS}_pods_seconds": timeit(update, repeat=3),
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main("informer_index", collect))
@@ -0,0 +1,33 @@
+"""Response decoding of large PodList payloads with every installed JSON backend."""
+from __future__ import annotations
+
+import json
+import sys
+
+from kubernetes_dynamic import json_codec
+
+from .common import Results, main, pod_list, timeit
+
+SIZES = (1000, 5000)
+
+
+def collect() -> Results:
+    results: Results = {}
+    previous = json_codec.backend()
+    try:
+        for size in SIZES:
+            data = json.dumps(pod_list(size)).encode()
+            results[f"payload_{size}_pods_mib"] = len(data) / 2**20
+            for backend in json_codec.BACKENDS:
+                try:
+                    json_codec.set_backend(backend)
+                except ImportError:
+                    continue
+                results[f"loads_{size}_pods_{backend}_seconds"] = timeit(lambda: json_codec.loads(data))
+    finally:
+        json_codec.set_backend(previous)
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("json_decoding", collect))
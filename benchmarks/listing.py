@@ -0,0 +1,51 @@
+"""Paginated list latency with a simulated network round trip, with and without prefetching."""
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+from .common import Results, fake_resource, fake_response, main, mock_kubernetes, pod, timeit
+
+PAGES = 10
+PAGE_SIZE = 200
+LATENCY = 0.05
+
+
+def pages() -> list:
+    result = []
+    for number in range(PAGES):
+        data = {
+            "kind": "PodList",
+            "apiVersion": "v1",
+            "metadata": {"resourceVersion": "1000", "continue": str(number + 1) if number + 1 < PAGES else None},
+            "items": [pod(number * PAGE_SIZE + index) for index in range(PAGE_SIZE)],
+        }
+        result.append(json.dumps(data).encode())
+    return result
+
+
+def collect() -> Results:
+    from kubernetes_dynamic import K8sClient
+
+    responses = pages()
+
+    def call_api(path, method, path_params, query_params, *args, **kwargs):
+        time.sleep(LATENCY)
+        token = dict(query_params).get("continue")
+        return fake_response(responses[int(token) if token else 0])
+
+    results = {"network_bound_seconds": LATENCY * PAGES}
+    with mock_kubernetes() as mocks:
+        client = K8sClient()
+        mocks["discoverer"].return_value.get.return_value = fake_resource(client)
+        client.client.call_api.side_effect = call_api
+        for prefetch in (0, 1, 2):
+            results[f"list_{PAGES}x{PAGE_SIZE}_prefetch_{prefetch}_seconds"] = timeit(
+                lambda: sum(1 for _ in client.pods.iterate(page_size=PAGE_SIZE, prefetch=prefetch)), repeat=3
+            )
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("listing", collect))
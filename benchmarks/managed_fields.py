@@ -0,0 +1,120 @@
+"""Memory held by a 10k item PodList depending on what happens to managedFields."""
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from kubernetes_dynamic import json_codec
+
+from .common import Results, main, pod_list
+
+ITEMS = 10000
+MODES = ("keep", "drop", "defer")
+
+
+def managed_fields() -> list:
+    """Entries like those written by kubectl, the controller manager and the kubelet for a running pod."""
+
+    def entry(manager: str, operation: str, fields: dict, subresource=None) -> dict:
+        value = {
+            "manager": manager,
+            "operation": operation,
+            "apiVersion": "v1",
+            "time": "2023-01-01T00:00:00Z",
+            "fieldsType": "FieldsV1",
+            "fieldsV1": fields,
+        }
+        if subresource:
+            value["subresource"] = subresource
+        return value
+
+    container = {
+        ".": {},
+        "f:image": {},
+        "f:imagePullPolicy": {},
+        "f:name": {},
+        "f:ports": {'.': {}, 'k:{"containerPort":8080,"protocol":"TCP"}': {".": {}, "f:containerPort": {}}},
+        "f:resources": {".": {}, "f:limits": {".": {}, "f:memory": {}}, "f:requests": {".": {}, "f:cpu": {}}},
+        "f:terminationMessagePath": {},
+        "f:terminationMessagePolicy": {},
+        "f:volumeMounts": {".": {}, 'k:{"mountPath":"/etc/config"}': {".": {}, "f:mountPath": {}, "f:name": {}}},
+    }
+    condition = {".": {}, "f:lastProbeTime": {}, "f:lastTransitionTime": {}, "f:status": {}, "f:type": {}}
+    return [
+        entry(
+            "kube-controller-manager",
+            "Update",
+            {
+                "f:metadata": {
+                    "f:generateName": {},
+                    "f:labels": {".": {}, "f:app": {}, "f:pod-template-hash": {}},
+                    "f:ownerReferences": {".": {}, 'k:{"uid":"0000"}': {}},
+                },
+                "f:spec": {
+                    "f:containers": {'k:{"name":"app"}': container},
+                    "f:dnsPolicy": {},
+                    "f:enableServiceLinks": {},
+                    "f:restartPolicy": {},
+                    "f:schedulerName": {},
+                    "f:securityContext": {},
+                    "f:terminationGracePeriodSeconds": {},
+                    "f:volumes": {".": {}, 'k:{"name":"config"}': {".": {}, "f:configMap": {}, "f:name": {}}},
+                },
+            },
+        ),
+        entry(
+            "kubelet",
+            "Update",
+            {
+                "f:status": {
+                    "f:conditions": {
+                        f'k:{{"type":"{name}"}}': condition
+                        for name in ("ContainersReady", "Initialized", "PodScheduled", "Ready")
+                    },
+                    "f:containerStatuses": {},
+                    "f:hostIP": {},
+                    "f:phase": {},
+                    "f:podIP": {},
+                    "f:podIPs": {".": {}, 'k:{"ip":"10.0.0.1"}': {".": {}, "f:ip": {}}},
+                    "f:startTime": {},
+                }
+            },
+            "status",
+        ),
+        entry("kubectl-client-side-apply", "Update", {"f:metadata": {"f:annotations": {".": {}}}}),
+    ]
+
+
+def retained_mib(payload: bytes, **kwargs) -> float:
+    """Memory still allocated by the decoded and built objects."""
+    from kubernetes_dynamic.client import serialize_object
+    from kubernetes_dynamic.models.pod import V1Pod
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        items = serialize_object(json_codec.loads(payload), V1Pod, **kwargs)
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del items
+    return size / 2**20
+
+
+def collect() -> Results:
+    data = pod_list(ITEMS)
+    for item in data["items"]:
+        item["metadata"]["managedFields"] = managed_fields()
+    payload = json.dumps(data).encode()
+    results: Results = {"payload_mib": len(payload) / 2**20}
+    for mode in MODES:
+        results[f"trusted_{ITEMS}_pods_{mode}_mib"] = retained_mib(payload, trusted=True, managed_fields=mode)
+        results[f"lazy_{ITEMS}_pods_{mode}_mib"] = retained_mib(payload, lazy=True, managed_fields=mode)
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("managed_fields", collect))
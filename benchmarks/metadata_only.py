@@ -0,0 +1,46 @@
+"""Payload size and parse time of full PodLists versus metadata-only PartialObjectMetadataLists."""
+from __future__ import annotations
+
+import json
+import sys
+
+from kubernetes_dynamic import json_codec
+
+from .common import Results, main, pod_list, timeit
+
+ITEMS = 2000
+
+
+def partial_object_metadata_list(data: dict) -> dict:
+    """What the apiserver returns for the same list with `as=PartialObjectMetadataList`."""
+    return {
+        "kind": "PartialObjectMetadataList",
+        "apiVersion": "meta.k8s.io/v1",
+        "metadata": data["metadata"],
+        "items": [
+            {"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1", "metadata": item["metadata"]}
+            for item in data["items"]
+        ],
+    }
+
+
+def collect() -> Results:
+    from kubernetes_dynamic.client import serialize_object
+    from kubernetes_dynamic.models.partial_object_metadata import V1PartialObjectMetadata
+    from kubernetes_dynamic.models.pod import V1Pod
+
+    data = pod_list(ITEMS)
+    results: Results = {}
+    for name, payload, serializer in (
+        ("full", json.dumps(data).encode(), V1Pod),
+        ("metadata_only", json.dumps(partial_object_metadata_list(data)).encode(), V1PartialObjectMetadata),
+    ):
+        results[f"{name}_{ITEMS}_pods_payload_mib"] = len(payload) / 2**20
+        results[f"{name}_{ITEMS}_pods_seconds"] = timeit(
+            lambda: serialize_object(json_codec.loads(payload), serializer), repeat=3
+        )
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("metadata_only", collect))
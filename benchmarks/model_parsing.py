@@ -0,0 +1,41 @@
+"""Building models from a decoded 10k item PodList, validated versus trusted versus lazy."""
+from __future__ import annotations
+
+import copy
+import sys
+
+from .common import Results, main, pod_list, timeit
+
+ITEMS = 10000
+
+
+def collect() -> Results:
+    from kubernetes_dynamic.client import serialize_object
+    from kubernetes_dynamic.models.pod import V1Pod
+    from kubernetes_dynamic.models.resource_value import ResourceValue
+
+    data = pod_list(ITEMS)
+    results: Results = {}
+    for serializer in (V1Pod, ResourceValue):
+        for trusted in (False, True):
+            copies = []
+            results[f"{serializer.__name__}_{ITEMS}_{'trusted' if trusted else 'validated'}_seconds"] = timeit(
+                lambda: serialize_object(copies.pop(), serializer, trusted),
+                repeat=3,
+                setup=lambda: copies.append(copy.deepcopy(data)),
+            )
+
+    def read_lazy():
+        # a typical controller only reads a few fields
+        for pod in serialize_object(copies.pop(), V1Pod, lazy=True):
+            pod.metadata.name, pod.metadata.labels, pod.status.phase
+
+    copies = []
+    results[f"V1Pod_{ITEMS}_lazy_seconds"] = timeit(
+        read_lazy, repeat=3, setup=lambda: copies.append(copy.deepcopy(data))
+    )
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("model_parsing", collect))
@@ -0,0 +1,85 @@
+"""Startup cost: cold import, memory after import, client construction and the first request."""
+from __future__ import annotations
+
+import json
+import sys
+
+from .common import (
+    Results,
+    fake_resource,
+    fake_response,
+    main,
+    median_of,
+    mock_kubernetes,
+    pod_list,
+    run_python,
+    timeit,
+)
+
+RSS = """
+def rss_mib():
+    import os
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+"""
+
+COLD_IMPORT = (
+    RSS
+    + """
+import json, time
+before = rss_mib()
+start = time.perf_counter()
+import kubernetes_dynamic
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "rss_mib": rss_mib() - before}))
+"""
+)
+
+FIRST_GET = """
+import json, time
+import kubernetes_dynamic
+from benchmarks.common import fake_resource, fake_response, mock_kubernetes, pod_list
+
+data = json.dumps(pod_list(100)).encode()
+with mock_kubernetes() as mocks:
+    start = time.perf_counter()
+    client = kubernetes_dynamic.K8sClient()
+    init = time.perf_counter() - start
+    mocks["discoverer"].return_value.get.return_value = fake_resource(client)
+    client.client.call_api.return_value = fake_response(data)
+    start = time.perf_counter()
+    client.pods.get()
+    print(json.dumps({"init_seconds": init, "get_seconds": time.perf_counter() - start}))
+"""
+
+
+def collect() -> Results:
+    cold_import = run_python(COLD_IMPORT)
+    first_get = run_python(FIRST_GET)
+
+    from kubernetes_dynamic import K8sClient
+
+    data = json.dumps(pod_list(100)).encode()
+    with mock_kubernetes() as mocks:
+        client_init = timeit(K8sClient, repeat=20)
+        client = K8sClient()
+        mocks["discoverer"].return_value.get.return_value = fake_resource(client)
+        client.client.call_api.return_value = fake_response(data)
+        warm_get = timeit(client.pods.get, repeat=10)
+
+    return {
+        "cold_import_seconds": median_of(cold_import, "seconds"),
+        "cold_import_rss_mib": median_of(cold_import, "rss_mib"),
+        "cold_client_init_seconds": median_of(first_get, "init_seconds"),
+        "cold_first_get_100_pods_seconds": median_of(first_get, "get_seconds"),
+        "client_init_seconds": client_init,
+        "get_100_pods_seconds": warm_get,
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main("startup", collect))
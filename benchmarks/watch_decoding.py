@@ -0,0 +1,42 @@
+"""Decoding throughput of a high-churn watch stream: MODIFIED events of pods, as the apiserver sends them."""
+from __future__ import annotations
+
+import json
+import sys
+
+from .common import Results, main, pod, timeit
+
+EVENTS = 2000
+
+
+def event_lines(count: int) -> list:
+    lines = []
+    for index in range(count):
+        obj = pod(index % 100)
+        obj["metadata"]["resourceVersion"] = str(10000 + index)
+        lines.append(json.dumps({"type": "MODIFIED", "object": obj}).encode())
+    return lines
+
+
+def collect() -> Results:
+    from kubernetes_dynamic.events import GENERATION_CHANGED, Watch
+    from kubernetes_dynamic.models.pod import V1Pod
+
+    lines = event_lines(EVENTS)
+    results: Results = {}
+    cases = (
+        ("validated", {}),
+        ("trusted", {"trusted": True}),
+        ("lazy", {"lazy": True}),
+        # status-only churn: all but the first event of every pod are dropped before decoding
+        ("generation_changed", {"predicates": [GENERATION_CHANGED]}),
+    )
+    for name, options in cases:
+        seconds = timeit(lambda: list(Watch(None, V1Pod, **options)._parse_response_iter(lines)), repeat=3)
+        results[f"watch_{name}_{EVENTS}_events_seconds"] = seconds
+        results[f"watch_{name}_events_per_second"] = EVENTS / seconds
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("watch_decoding", collect))
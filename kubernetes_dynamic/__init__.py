@@ -10,23 +10,32 @@
     "ResourceApi",
     "Event",
     "EventType",
+    "EventBuffer",
     "Watch",
+    "Informer",
+    "WatchHub",
+    "WorkQueue",
+    "shared_client",
+    "set_shared_client",
+    "reset_shared_clients",
 ]
 
 from . import exceptions, models
-from .client import K8sClient
+from .client import K8sClient, reset_shared_clients, set_shared_client, shared_client
 from .config import K8sConfig
-from .events import Event, EventType, Watch
+from .events import Event, EventBuffer, EventType, Watch
+from .informer import Informer
 from .models.resource_item import CheckResult, ResourceItem
 from .models.resource_value import ResourceValue
 from .resource_api import ResourceApi
+from .watch_hub import WatchHub
+from .workqueue import WorkQueue
 
 cl: K8sClient
 
 
 def __getattr__(name: str):
+    # not cached in the module, so `reset_shared_clients` and `set_shared_client` apply to `kubernetes_dynamic.cl`
     if name == "cl":
-        global cl
-        cl = K8sClient()
-        return cl
+        return shared_client()
     raise AttributeError(name)
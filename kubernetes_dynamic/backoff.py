@@ -0,0 +1,51 @@
+"""Capped exponential backoff with jitter, for retrying requests without all clients retrying in lockstep."""
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+from .exceptions import ApiException
+
+# statuses worth retrying: too many requests and server errors
+RETRIABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+class Backoff:
+    def __init__(self, initial: float = 0.5, maximum: float = 30.0, factor: float = 2.0, jitter: float = 0.5):
+        """Delays growing from `initial` by `factor` on every failure, up to `maximum` seconds.
+
+        Args:
+            initial: First delay in seconds.
+            maximum: Cap of the delays, including the jitter.
+            factor: Growth of the delay per failure.
+            jitter: Each delay is randomly increased by up to this fraction of itself.
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self.failures = 0
+
+    def delay(self, failures: Optional[int] = None) -> float:
+        """Delay after `failures` consecutive failures, the current number by default."""
+        failures = self.failures if failures is None else failures
+        delay = self.initial * self.factor ** max(failures - 1, 0)
+        return min(self.maximum, delay * (1 + self.jitter * random.random()))
+
+    def next(self) -> float:
+        """Count a failure and return the delay before the next attempt."""
+        self.failures += 1
+        return self.delay()
+
+    def reset(self) -> None:
+        """Start over after a success."""
+        self.failures = 0
+
+
+def retry_after(error: ApiException) -> Optional[float]:
+    """Seconds from the Retry-After header of an error response, if any."""
+    value = (error.headers or {}).get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
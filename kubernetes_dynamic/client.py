@@ -1,23 +1,29 @@
 from __future__ import annotations
 
-import json
+import inspect
+import math
 import re
+import threading
+import time
+import typing
 from pathlib import Path
 from types import NoneType
-from typing import Any, Callable, List, Optional, Type, TypeVar, overload
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, overload
 
 import pydantic
 import yaml
 
 import kubernetes_dynamic.models as models
 
-from . import _kubernetes
+from . import _kubernetes, concurrency, json_codec
 from .config import K8sConfig
-from .events import Event, Watch
+from .events import HTTP_STATUS_GONE, MANAGED_FIELDS_MODES, Event, EventBuffer, EventType, Watch, _pop_managed_fields
 from .exceptions import (
+    ApiException,
     ConfigException,
     ConflictError,
     EventTimeoutError,
+    GoneError,
     InvalidParameter,
     NotFoundError,
     ResourceNotUniqueError,
@@ -29,13 +35,61 @@
 from .models.resource_value import ResourceValue
 from .resource_api import ResourceApi
 
+if typing.TYPE_CHECKING:
+    from .informer import Informer
+    from .watch_hub import Subscription, WatchHub
+
 T = TypeVar("T", bound=ResourceItem)
 
 
 MISSING = object()
 
-
-def serialize_object(data, serializer: Type = None) -> ResourceItem | ItemList[ResourceItem]:
+# falls back to full objects when the server does not support metadata-only responses
+METADATA_ONLY_ACCEPT = "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1,application/json"
+METADATA_ONLY_LIST_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+TABLE_ACCEPT = "application/json;as=Table;g=meta.k8s.io;v=v1"
+
+# request options and their query parameters
+QUERY_OPTIONS = {
+    "_continue": "continue",
+    "pretty": "pretty",
+    "include_uninitialized": "includeUninitialized",
+    "field_selector": "fieldSelector",
+    "label_selector": "labelSelector",
+    "limit": "limit",
+    "resource_version": "resourceVersion",
+    "timeout_seconds": "timeoutSeconds",
+    "watch": "watch",
+    "allow_watch_bookmarks": "allowWatchBookmarks",
+    "send_initial_events": "sendInitialEvents",
+    "resource_version_match": "resourceVersionMatch",
+    "grace_period_seconds": "gracePeriodSeconds",
+    "propagation_policy": "propagationPolicy",
+    "orphan_dependents": "orphanDependents",
+    "dry_run": "dryRun",
+    "field_manager": "fieldManager",
+    "force_conflicts": "force",
+}
+
+_shared_clients: Dict[Tuple[Optional[str], Optional[str]], K8sClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def serialize_object(
+    data, serializer: Type = None, trusted: bool = False, lazy: bool = False, managed_fields: str = "keep"
+) -> ResourceItem | ItemList[ResourceItem]:
+    """Build models from a decoded response.
+
+    Args:
+        data: Decoded response.
+        serializer: Model type, detected from kind and apiVersion by default.
+        trusted: Skip validation, the data is known to be schema valid. See `ResourceValue.from_trusted`.
+        lazy: Build fields on first access, implies `trusted`.
+        managed_fields: What to do with `metadata.managedFields`: "keep" them, "drop" them, or "defer" them,
+            keeping them as encoded JSON which is decoded when the field is first accessed.
+    """
+    if managed_fields not in MANAGED_FIELDS_MODES:
+        raise InvalidParameter(f"Invalid managed_fields value: {managed_fields}")
     kind = data["kind"]
     is_list = False
     if kind.endswith("List") and "items" in data:
@@ -47,28 +101,54 @@ def serialize_object(data, serializer: Type = None) -> ResourceItem | ItemList[R
     obj_type = serializer or get_type(kind, api_version, ResourceItem)
 
     if not is_list:
-        return pydantic.parse_obj_as(obj_type, data)
+        raw_managed_fields = _pop_managed_fields(data, managed_fields)
+        if trusted or lazy:
+            obj = obj_type.from_trusted(data, lazy)
+        else:
+            obj = pydantic.parse_obj_as(obj_type, data)
+        if raw_managed_fields is not None:
+            obj.metadata.defer_field("managedFields", raw_managed_fields)
+        return obj
 
     for item in data["items"]:
         item.setdefault("apiVersion", api_version)
         item.setdefault("kind", kind)
-    items = pydantic.parse_obj_as(List[obj_type], data["items"])
+    raw_managed_fields = [_pop_managed_fields(item, managed_fields) for item in data["items"]]
+    if trusted or lazy:
+        items = [obj_type.from_trusted(item, lazy) for item in data["items"]]
+    else:
+        items = pydantic.parse_obj_as(List[obj_type], data["items"])
+    if managed_fields == "defer":
+        for item, raw in zip(items, raw_managed_fields):
+            if raw is not None:
+                item.metadata.defer_field("managedFields", raw)
     return ItemList(items, metadata=data["metadata"])
 
 
+def object_key(item: ResourceValue) -> str:
+    """Storage key of an object, lists are ordered by it."""
+    metadata = item.metadata or {}
+    namespace = metadata.get("namespace")
+    name = metadata.get("name") or ""
+    return f"{namespace}/{name}" if namespace else name
+
+
 def meta_request(func):
     """Handles parsing response structure and translating API Exceptions"""
 
     def inner(self, *args, **kwargs):
         serialize = kwargs.pop("serialize", True)
         serializer = kwargs.pop("serializer", ResourceValue)
+        trusted = kwargs.pop("trusted", self.trusted)
+        lazy = kwargs.pop("lazy", self.lazy)
+        managed_fields = kwargs.pop("managed_fields", self.managed_fields)
         response = func(self, *args, **kwargs)
         if not response:
             return None
         if not serialize:
             return response
-        data = json.loads(response.data)
-        return serialize_object(data, serializer)
+        data = json_codec.loads(response.data)
+        return serialize_object(data, serializer, trusted, lazy, managed_fields)
 
     return inner
 
@@ -135,11 +215,41 @@ def __init__(
         context: Optional[str] = None,
         cache_file=None,
         discoverer=None,
+        trusted: bool = False,
+        lazy: bool = False,
+        managed_fields: str = "keep",
     ):
+        """Kubernetes client.
+
+        Args:
+            api_client: Use an existing ApiClient.
+            config_file: Kube config file to load.
+            config_dict: Load the kube config from dict instead of a file.
+            context: Kube context to use.
+            cache_file: Discovery cache file.
+            discoverer: Discoverer class.
+            trusted: Build models from responses without validation, can be overridden per call with `trusted=`.
+            lazy: Build model fields from responses on first access, implies `trusted`, can be overridden per call
+                with `lazy=`.
+            managed_fields: "keep", "drop" or "defer" `metadata.managedFields` of responses, see `serialize_object`,
+                can be overridden per call with `managed_fields=`.
+        """
+        if managed_fields not in MANAGED_FIELDS_MODES:
+            raise InvalidParameter(f"Invalid managed_fields value: {managed_fields}")
         discoverer = discoverer or _kubernetes.dynamic.LazyDiscoverer
+        self.trusted = trusted
+        self.lazy = lazy
+        self.managed_fields = managed_fields
         self.config = self.get_config(config_file, config_dict=config_dict, context=context)
         self.client = api_client or _kubernetes.ApiClient(configuration=self.config.configuration)
         self.configuration = self.client.configuration
+        self._api_cache: Dict[tuple, Tuple[ResourceApi, Type]] = {}
+        self._api_cache_discovery: Any = None
+        self._informers: Dict[tuple, Informer] = {}
+        self._informers_lock = threading.Lock()
+        self._listers: Dict[Tuple[str, str], Informer] = {}
+        self._watch_hubs: Dict[tuple, WatchHub] = {}
+        self._watch_hubs_lock = threading.Lock()
         self.__discoverer = discoverer(self, cache_file)
 
     @property
@@ -253,6 +363,17 @@ def get_api(
             filter_dict["kind"] = kind
         if name:
             filter_dict["name"] = name
+        key = (object_type, tuple(sorted(filter_dict.items())))
+        discovery = getattr(self.resources, "_cache", None)
+        if discovery is not self._api_cache_discovery:
+            # discovery was refreshed, the resolved resources may be stale
+            self._api_cache.clear()
+            self._api_cache_discovery = discovery
+        cached = self._api_cache.get(key)
+        if cached is not None:
+            api, resource_type = cached
+            api._resource_type = resource_type
+            return api
         try:
             api = self.resources.get(**filter_dict)
         except ResourceNotUniqueError:
@@ -262,8 +383,14 @@ def get_api(
                 if r.preferred and isinstance(r, _kubernetes.dynamic.Resource)
             ][0]
         api._resource_type = object_type or get_type(str(api.kind), str(api.api_version), ResourceItem)  # type: ignore
+        self._api_cache[key] = (api, api._resource_type)
         return api  # type: ignore
 
+    def invalidate_cache(self):
+        """Refresh api discovery and forget the resolved resource apis."""
+        self._api_cache.clear()
+        self.resources.invalidate_cache()
+
     def __getattr__(self, name: str) -> ResourceApi[ResourceItem]:
         if name.startswith("_"):
             raise AttributeError(name)
@@ -301,11 +428,100 @@ def serialize_body(self, body):
             return body.to_dict()
         return body or {}
 
-    def read(self, resource: ResourceApi, name=None, namespace=MISSING, **kwargs):
+    def read(
+        self,
+        resource: ResourceApi,
+        name=None,
+        namespace=MISSING,
+        page_size=None,
+        prefetch=0,
+        metadata_only=False,
+        **kwargs,
+    ):
+        """Read an object or list a collection.
+
+        With `metadata_only`, the server only returns the metadata of the objects, which are parsed
+        into `V1PartialObjectMetadata` items.
+
+        In lister mode, see `enable_lister`, reads the cache can answer are served from it.
+        """
+        if self._listers and not (page_size or metadata_only):
+            cached = self._read_cached(resource, name, namespace, kwargs)
+            if cached is not MISSING:
+                return cached
+        if page_size and not name:
+            items: ItemList = ItemList([], metadata={})
+            pages = self._iterate_pages(
+                resource, namespace, page_size, prefetch=prefetch, metadata_only=metadata_only, **kwargs
+            )
+            for page in pages:
+                items.extend(page)
+                items.metadata = page.metadata
+            return items
         namespace = self.ensure_namespace_param(resource, namespace)
         path = resource.path(name=name, namespace=namespace)
+        if metadata_only:
+            self._metadata_only_params(kwargs, METADATA_ONLY_ACCEPT if name else METADATA_ONLY_LIST_ACCEPT)
         return self.request("get", path, **kwargs)
 
+    def _read_cached(self, resource: ResourceApi, name, namespace, kwargs: dict):
+        """Object or list from the lister of the resource, MISSING when it cannot answer the read."""
+        lister = self._listers.get((resource.group_version, resource.kind))
+        if lister is None or lister.stopped or not lister.has_synced:
+            return MISSING
+        if set(kwargs) - {"label_selector", "field_selector"}:
+            return MISSING
+        selectors = (format_selector(kwargs.get("label_selector")), format_selector(kwargs.get("field_selector")))
+        if selectors != (lister.label_selector, lister.field_selector):
+            return MISSING
+        if self.ensure_namespace_param(resource, namespace) != lister.namespace:
+            return MISSING
+        if name is None:
+            return ItemList(lister.list(), metadata={"resourceVersion": lister.resource_version})
+        item = lister.get(name, lister.namespace)
+        if item is None:
+            raise NotFoundError(ApiException(status=404, reason=f"{resource.kind} {name} not found in cache"))
+        return item
+
+    def enable_lister(
+        self, resource: ResourceApi, namespace=MISSING, wait: bool = True, timeout: Optional[float] = None, **kwargs
+    ) -> Informer:
+        """Serve `get`, `read` and `find` of a resource from the cache of its shared informer.
+
+        Reads of the informer namespace and selectors without other options are answered from the cache once
+        it has synced, other reads still go to the server. Lists carry the resource version the cache is up to
+        date with in `metadata.resourceVersion`. Cached objects are shared, copy them before changing them.
+
+        Args:
+            resource: Resource to cache.
+            namespace: Namespace of namespaced resources.
+            wait: Wait until the cache has synced, see `wait_for_sync`.
+            timeout: Seconds to wait at most.
+            kwargs: Passed to `informer`.
+        """
+        informer = self.informer(resource, namespace, **kwargs)
+        self._listers[(resource.group_version, resource.kind)] = informer
+        if wait:
+            informer.wait_for_sync(timeout)
+        return informer
+
+    def disable_lister(self, resource: ResourceApi) -> None:
+        """Send reads of a resource to the server again, the informer keeps running."""
+        self._listers.pop((resource.group_version, resource.kind), None)
+
+    def wait_for_sync(self, resource: ResourceApi, timeout: Optional[float] = None) -> bool:
+        """Block until the lister cache of a resource is loaded, returns False on timeout."""
+        lister = self._listers.get((resource.group_version, resource.kind))
+        if lister is None:
+            raise InvalidParameter(f"No lister enabled for {resource.kind}")
+        return lister.wait_for_sync(timeout)
+
+    @staticmethod
+    def _metadata_only_params(kwargs: dict, accept: str):
+        """Request metadata-only responses and parse them into `V1PartialObjectMetadata`."""
+        kwargs["header_params"] = {**kwargs.get("header_params", {}), "Accept": accept}
+        kwargs.setdefault("serializer", models.V1PartialObjectMetadata)
+
     def get(self, resource: ResourceApi, name=None, namespace=MISSING, **kwargs):
         try:
             return self.read(resource, name, namespace, **kwargs)
@@ -322,6 +538,144 @@ def find(self, resource: ResourceApi, pattern, namespace=MISSING, **kwargs):
                 items.append(item)
         return items
 
+    def iterate(
+        self,
+        resource: ResourceApi,
+        namespace=MISSING,
+        page_size: int = 500,
+        label_selector=None,
+        field_selector=None,
+        on_expired: str = "restart",
+        prefetch: int = 0,
+        **kwargs,
+    ):
+        """Iterate over a collection page by page, following `metadata.continue`.
+
+        Only a single page is kept in memory, or `prefetch + 1` pages when prefetching: then the next pages
+        are requested and decoded on a background thread while the current one is parsed.
+
+        When the continue token expires (410 Gone) during the listing, `on_expired` decides what happens:
+
+        - "restart": list again from a fresh snapshot, skipping the objects up to the last yielded one.
+          Lists are ordered by key (namespace/name), so nothing is yielded twice, but objects created or
+          deleted in the meantime may or may not be seen.
+        - "raise": re-raise the error.
+        """
+        for page in self._iterate_pages(
+            resource, namespace, page_size, label_selector, field_selector, on_expired, prefetch, **kwargs
+        ):
+            yield from page
+
+    def _iterate_pages(
+        self,
+        resource: ResourceApi,
+        namespace=MISSING,
+        page_size: int = 500,
+        label_selector=None,
+        field_selector=None,
+        on_expired: str = "restart",
+        prefetch: int = 0,
+        metadata_only: bool = False,
+        **kwargs,
+    ) -> Iterator[ItemList]:
+        if on_expired not in ("restart", "raise"):
+            raise InvalidParameter(f"Invalid on_expired value: {on_expired}")
+        namespace = self.ensure_namespace_param(resource, namespace)
+        if metadata_only:
+            self._metadata_only_params(kwargs, METADATA_ONLY_LIST_ACCEPT)
+        serializer = kwargs.pop("serializer", ResourceValue)
+        trusted = kwargs.pop("trusted", self.trusted)
+        lazy = kwargs.pop("lazy", self.lazy)
+        managed_fields = kwargs.pop("managed_fields", self.managed_fields)
+        path = resource.path(namespace=namespace)
+        params = dict(
+            label_selector=format_selector(label_selector),
+            field_selector=format_selector(field_selector),
+            **kwargs,
+        )
+        last_key = None
+        skip_until = None
+        while True:
+            pages = self._list_pages(path, page_size, **params)
+            if prefetch:
+                pages = concurrency.prefetch(pages, prefetch, name=f"kubernetes-dynamic-list-{resource.kind}")
+            received = False
+            try:
+                for data in pages:
+                    received = True
+                    page = serialize_object(data, serializer, trusted, lazy, managed_fields)
+                    if skip_until is not None:
+                        page.data = [item for item in page if object_key(item) > skip_until]
+                        skip_until = None if page else skip_until
+                    if page:
+                        last_key = object_key(page[-1])
+                    yield page
+                return
+            except ApiException as e:
+                if e.status != HTTP_STATUS_GONE or not received or on_expired == "raise":
+                    raise
+                skip_until = last_key
+            finally:
+                pages.close()
+
+    def _list_pages(self, path: str, page_size: int, **params) -> Iterator[dict]:
+        """Request and decode the pages of a list."""
+        token = None
+        while True:
+            response = self.request("get", path, limit=page_size, _continue=token, serialize=False, **params)
+            data = json_codec.loads(response.data)
+            yield data
+            token = data.get("metadata", {}).get("continue")
+            if not token:
+                return
+
+    def table(
+        self,
+        resource: ResourceApi,
+        name=None,
+        namespace=MISSING,
+        label_selector=None,
+        field_selector=None,
+        include_object: Optional[str] = "None",
+        page_size: Optional[int] = None,
+        **kwargs,
+    ) -> models.V1Table:
+        """Server side table of a collection or an object, the columns shown by `kubectl get`.
+
+        Args:
+            include_object: What the rows include besides the cells: "None", "Metadata" or "Object",
+                `None` leaves it to the server (Metadata).
+            page_size: Request the rows in pages of this size, they are merged into one table.
+        """
+        namespace = self.ensure_namespace_param(resource, namespace)
+        path = resource.path(name=name, namespace=namespace)
+        query_params = list(kwargs.pop("query_params", []))
+        if include_object:
+            query_params.append(("includeObject", include_object))
+        kwargs["header_params"] = {**kwargs.get("header_params", {}), "Accept": TABLE_ACCEPT}
+        kwargs.setdefault("serializer", models.V1Table)
+        table: Optional[models.V1Table] = None
+        token = None
+        while True:
+            page = self.request(
+                "get",
+                path,
+                label_selector=format_selector(label_selector),
+                field_selector=format_selector(field_selector),
+                limit=page_size,
+                _continue=token,
+                query_params=list(query_params),
+                **kwargs,
+            )
+            if table is None:
+                table = page
+            else:
+                table.rows.extend(page.rows)
+                table.metadata = page.metadata
+            token = page.metadata.get("continue") if page_size else None
+            if not token:
+                return table
+
     def create(self, resource: ResourceApi, body=None, namespace=MISSING, **kwargs):
         body = self.serialize_body(body)
         namespace = self.ensure_namespace_param(resource, namespace, body)
@@ -387,12 +741,33 @@ def watch(
         resource_version=None,
         timeout=None,
         watcher=None,
+        metadata_only=False,
+        send_initial_events=False,
+        reconnect=False,
+        deadline=None,
+        backoff=None,
+        predicates=None,
+        managed_fields=None,
     ):
+        """Watch a collection, with `metadata_only` the events only contain `V1PartialObjectMetadata` objects.
+
+        With `send_initial_events` the watch starts with ADDED events for the existing objects. With `reconnect`
+        it survives connection and server errors until `deadline` seconds have passed, `timeout` then applies
+        to each request. See `Watch.stream`. With `predicates`, MODIFIED events which changed nothing of
+        interest are dropped, see `Watch`; a supplied `watcher` applies its own predicates. `managed_fields`
+        overrides the mode of the client for the objects of the events.
+        """
+        if watcher and predicates:
+            raise InvalidParameter("Pass the predicates to the Watch supplied as watcher.")
         namespace = self.ensure_namespace_param(resource, namespace)
         if name:
             field_selector = field_selector or ""
             field_selector += f",metadata.name={name}"
-        watcher = watcher or Watch(self.client, resource._resource_type)
+        kwargs: Dict[str, Any] = {}
+        if metadata_only:
+            self._metadata_only_params(kwargs, METADATA_ONLY_ACCEPT)
+            kwargs.pop("serializer")
+        watcher = watcher or self._new_watcher(resource, metadata_only, predicates, managed_fields)
         if watcher and not resource_version:
             resource_version = watcher.resource_version
         return watcher.stream(
@@ -404,8 +779,128 @@ def watch(
             resource_version=resource_version,
             serialize=False,
             timeout_seconds=timeout,
+            send_initial_events=send_initial_events,
+            reconnect=reconnect,
+            deadline=deadline,
+            backoff=backoff,
+            **kwargs,
         )
 
+    def _new_watcher(
+        self, resource: ResourceApi, metadata_only: bool = False, predicates=None, managed_fields=None, **kwargs
+    ) -> Watch:
+        """Watch decoding the objects of `resource` like the other requests of the client, see `Watch`."""
+        return_type = models.V1PartialObjectMetadata if metadata_only else resource._resource_type
+        return Watch(
+            self.client,
+            return_type,
+            trusted=self.trusted,
+            lazy=self.lazy,
+            predicates=predicates,
+            managed_fields=managed_fields or self.managed_fields,
+            **kwargs,
+        )
+
+    def watch_in_background(
+        self,
+        resource: ResourceApi,
+        namespace=MISSING,
+        *args,
+        max_queued: int = 1000,
+        overflow: str = "block",
+        callback: Optional[Callable[[Event], None]] = None,
+        **kwargs,
+    ) -> EventBuffer:
+        """Watch a collection on a background thread, see `watch` for the arguments.
+
+        Events are read and decoded into a bounded `EventBuffer` independently of the consumer, so a slow
+        consumer does not stall the connection. When the buffer is full, `overflow` decides between blocking
+        the reader, dropping the oldest event or coalescing the events of each object. Iterate the returned
+        buffer, or pass `callback` to be called with every event from another thread. Closing the buffer
+        ends the watch.
+        """
+        arguments = inspect.signature(self.watch).bind(resource, namespace, *args, **kwargs).arguments
+        watcher = arguments.get("watcher") or self._new_watcher(
+            resource, arguments.get("metadata_only", False), arguments.get("predicates")
+        )
+        arguments["watcher"] = watcher
+        events = EventBuffer(max_queued, overflow)
+        events.read(self.watch(**arguments), name=f"kubernetes-dynamic-watch-{resource.kind}", watcher=watcher)
+        if callback:
+            events.dispatch(callback, name=f"kubernetes-dynamic-watch-callback-{resource.kind}")
+        return events
+
+    def informer(
+        self,
+        resource: ResourceApi,
+        namespace=MISSING,
+        label_selector=None,
+        field_selector=None,
+        start: bool = True,
+        **kwargs,
+    ) -> Informer:
+        """Get the shared informer of a collection, see `kubernetes_dynamic.informer`.
+
+        Informers are shared per resource, namespace and selectors, so the collection is listed and watched
+        only once however many consumers use it. `kwargs` are passed to `Informer` when it is created.
+        """
+        from .informer import Informer
+
+        namespace = self.ensure_namespace_param(resource, namespace)
+        label_selector = format_selector(label_selector)
+        field_selector = format_selector(field_selector)
+        key = (resource.group_version, resource.kind, resource._resource_type, namespace)
+        key += (label_selector, field_selector)
+        with self._informers_lock:
+            informer = self._informers.get(key)
+            if informer is None or informer.stopped:
+                informer = Informer(self, resource, namespace, label_selector, field_selector, **kwargs)
+                self._informers[key] = informer
+        if start:
+            informer.start()
+        return informer
+
+    def stop_informers(self, timeout: Optional[float] = None) -> None:
+        """Stop and forget every shared informer of this client."""
+        with self._informers_lock:
+            informers = list(self._informers.values())
+            self._informers.clear()
+        for informer in informers:
+            informer.stop(timeout)
+
+    def subscribe(
+        self,
+        resource: ResourceApi,
+        namespace=MISSING,
+        label_selector=None,
+        field_selector=None,
+        callback: Optional[Callable[[Event], None]] = None,
+        max_queued: int = 1000,
+        overflow: str = "error",
+        **kwargs,
+    ) -> Subscription:
+        """Subscribe to the events of a collection through its shared watch hub, see `kubernetes_dynamic.watch_hub`.
+
+        Hubs are shared per resource, namespace and selectors, so the collection is watched and its events are
+        decoded only once however many subscribers there are. The upstream watch stops when the last subscriber
+        closes its subscription. `kwargs` are passed to `WatchHub` when it is created.
+        """
+        from .watch_hub import WatchHub
+
+        namespace = self.ensure_namespace_param(resource, namespace)
+        label_selector = format_selector(label_selector)
+        field_selector = format_selector(field_selector)
+        key = (resource.group_version, resource.kind, resource._resource_type, namespace)
+        key += (label_selector, field_selector)
+        with self._watch_hubs_lock:
+            hub = self._watch_hubs.get(key)
+            subscription = hub.subscribe(callback, max_queued, overflow) if hub else None
+            if subscription is None:
+                hub = WatchHub(self, resource, namespace, label_selector, field_selector, **kwargs)
+                self._watch_hubs[key] = hub
+                subscription = hub.subscribe(callback, max_queued, overflow)
+        return subscription
+
     def wait_until(
         self,
         resource: ResourceApi,
@@ -443,6 +938,191 @@ def wait_until(
             raise EventTimeoutError(result.message, last=last)
         raise EventTimeoutError(f"Timed out waiting for check on {self.kind} {name} .", last=last)
 
+    def wait_until_all(
+        self,
+        resource: ResourceApi,
+        items: Optional[Iterable[ResourceItem | str]] = None,
+        *,
+        namespace=MISSING,
+        check: Optional[Callable[[Event], CheckResult]] = None,
+        label_selector=None,
+        field_selector=None,
+        timeout: float = 30,
+    ) -> Dict[str, Event]:
+        """Wait until `check` is true for all `items`, or all objects matching the selectors.
+
+        The objects are checked as listed and then on every event of one watch per namespace, instead of one
+        watch per object, until all checks passed or `timeout` seconds have passed in total. `items` are objects
+        or names in `namespace`; without them, the objects matching the selectors at any time are waited for, so
+        no matching object at all passes right away. `check` defaults to the readiness check of `wait_until_ready`.
+
+        Returns:
+            The last event of each object, by object key ("namespace/name"). Listed objects are reported as ADDED
+            events.
+
+        Raises:
+            EventTimeoutError: With the last `CheckResult` of every object in `results`.
+        """
+        return self._wait_until_many(resource, items, namespace, check, label_selector, field_selector, timeout)
+
+    def wait_until_any(
+        self,
+        resource: ResourceApi,
+        items: Optional[Iterable[ResourceItem | str]] = None,
+        *,
+        namespace=MISSING,
+        check: Optional[Callable[[Event], CheckResult]] = None,
+        label_selector=None,
+        field_selector=None,
+        timeout: float = 30,
+    ) -> Event:
+        """Wait until `check` is true for one of `items`, or one object matching the selectors.
+
+        Returns the event of the object which passed first, of the listed objects the first one passing in list
+        order. See `wait_until_all`.
+        """
+        passed = self._wait_until_many(
+            resource, items, namespace, check, label_selector, field_selector, timeout, wait_all=False
+        )
+        return next(iter(passed.values()))
+
+    def _wait_until_many(
+        self,
+        resource: ResourceApi,
+        items: Optional[Iterable[ResourceItem | str]],
+        namespace,
+        check: Optional[Callable[[Event], CheckResult]],
+        label_selector,
+        field_selector,
+        timeout: float,
+        wait_all: bool = True,
+    ) -> Dict[str, Event]:
+        end = time.monotonic() + timeout
+        check = check or (lambda event: ResourceItem.check_object_is_ready(event.object))
+        label_selector = format_selector(label_selector)
+        field_selector = format_selector(field_selector)
+
+        # objects waited for by key, None for every object matching the selectors
+        wanted: Optional[Dict[str, Optional[str]]] = None
+        namespaces = [self.ensure_namespace_param(resource, namespace)]
+        if items is not None:
+            wanted = {}
+            for item in items:
+                if isinstance(item, str):
+                    item_namespace = self.ensure_namespace_param(resource, namespace)
+                    wanted[f"{item_namespace}/{item}" if item_namespace else item] = item_namespace
+                else:
+                    wanted[object_key(item)] = self.ensure_namespace_param(resource, item.metadata.namespace)
+            namespaces = sorted(set(wanted.values()), key=lambda value: value or "")
+
+        results: Dict[str, CheckResult] = {
+            key: CheckResult(False, f"{resource.kind} {key} not found.") for key in wanted or {}
+        }
+        passed: Dict[str, Event] = {}
+        last: Optional[Event] = None
+
+        def finished() -> bool:
+            return len(passed) == len(results) if wait_all else bool(passed)
+
+        def evaluate(event: Event) -> bool:
+            """Check an event, returns whether the wait is over."""
+            nonlocal last
+            key = object_key(event.object)
+            if wanted is not None and key not in wanted:
+                return False
+            last = event
+            result = check(event)
+            results[key] = result
+            if result:
+                passed[key] = event
+            else:
+                passed.pop(key, None)
+                if wanted is None and event.type == EventType.DELETED.value:
+                    del results[key]
+            return finished()
+
+        # objects of every namespace by key, only touched by the thread watching the namespace
+        known: Dict[Optional[str], Dict[str, ResourceItem]] = {item_namespace: {} for item_namespace in namespaces}
+
+        def relist(item_namespace: Optional[str]) -> Tuple[str, List[Event]]:
+            """List a namespace, returns its resource version and the events since the previous list."""
+            listed = self.read(
+                resource, namespace=item_namespace, label_selector=label_selector, field_selector=field_selector
+            )
+            objects = {object_key(item): item for item in listed}
+            listed_events = [
+                Event.construct(type=EventType.ADDED.value, object=item, raw_object=item.to_dict()) for item in listed
+            ]
+            listed_events += [
+                Event.construct(type=EventType.DELETED.value, object=item, raw_object=item.to_dict())
+                for key, item in known[item_namespace].items()
+                if key not in objects
+            ]
+            known[item_namespace] = objects
+            return listed.metadata.resourceVersion, listed_events
+
+        def namespace_events(item_namespace: Optional[str], resource_version: str) -> Iterator[Event]:
+            while True:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    for event in self.watch(
+                        resource,
+                        item_namespace,
+                        label_selector=label_selector,
+                        field_selector=field_selector,
+                        resource_version=resource_version,
+                        timeout=max(1, math.ceil(remaining)),
+                        watcher=watchers[item_namespace],
+                        reconnect=True,
+                        deadline=remaining,
+                    ):
+                        key = object_key(event.object)
+                        if event.type == EventType.DELETED.value:
+                            known[item_namespace].pop(key, None)
+                        else:
+                            known[item_namespace][key] = event.object
+                        yield event
+                    return
+                except GoneError:
+                    # the events since the resource version are lost, a fresh list catches up with them
+                    resource_version, listed_events = relist(item_namespace)
+                    yield from listed_events
+
+        versions = {}
+        for item_namespace in namespaces:
+            versions[item_namespace], listed_events = relist(item_namespace)
+            for event in listed_events:
+                evaluate(event)
+        done = finished()
+
+        if not done and end > time.monotonic():
+            watchers = {
+                item_namespace: self._new_watcher(resource, resume_on_gone=False) for item_namespace in namespaces
+            }
+            events = concurrency.merge(
+                (namespace_events(item_namespace, versions[item_namespace]) for item_namespace in namespaces),
+                name=f"kubernetes-dynamic-wait-{resource.kind}",
+            )
+            try:
+                for event in events:
+                    if evaluate(event):
+                        done = True
+                        break
+            finally:
+                for watcher in watchers.values():
+                    watcher.stop()
+                events.close()
+
+        if done:
+            # in the order they passed for `wait_until_any`
+            return {key: passed[key] for key in sorted(passed)} if wait_all else passed
+        failed = [result.message or key for key, result in sorted(results.items()) if not result]
+        waiting = f"all {len(results)}" if wait_all else "any"
+        message = f"Timed out waiting for {waiting} {resource.kind}: {'; '.join(failed)}"
+        raise EventTimeoutError(message, last=last, results=results)
+
     def stream(self, method, name=None, namespace=MISSING, *args, **kwargs):
         from kubernetes.stream.ws_client import WSResponse, websocket_call
 
@@ -474,26 +1154,9 @@ def request(self, method, path, body=None, **params) -> Any:
 
         path_params = params.get("path_params", {})
         query_params = params.get("query_params", [])
-        options = (
-            "_continue",
-            "pretty",
-            "include_uninitialized",
-            "field_selector",
-            "label_selector",
-            "limit",
-            "resource_version",
-            "timeout_seconds",
-            "watch",
-            "grace_period_seconds",
-            "propagation_policy",
-            "orphan_dependents",
-            "dry_run",
-            "field_manager",
-            "force_conflicts",
-        )
-        for key in options:
+        for key, name in QUERY_OPTIONS.items():
             if params.get(key):
-                query_params.append((key.lstrip("_"), params[key]))
+                query_params.append((name, params[key]))
 
         header_params = params.get("header_params", {})
         form_params = []
@@ -575,3 +1238,34 @@ def _apply(
 
         resource.delete(name=name, namespace=namespace, **kwargs)
         return resource.create(body=body, namespace=namespace, **kwargs)
+
+
+def shared_client(config_file: Optional[str] = None, context: Optional[str] = None) -> K8sClient:
+    """Get the process-wide client for a kube config file and context.
+
+    The client is created on first use and then reused, together with its connection pool and discovery cache.
+    """
+    key = (config_file, context)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = K8sClient(config_file=config_file, context=context)
+        return client
+
+
+def set_shared_client(
+    client: Optional[K8sClient], config_file: Optional[str] = None, context: Optional[str] = None
+) -> None:
+    """Override the process-wide client for a kube config file and context, `None` removes it."""
+    key = (config_file, context)
+    with _shared_clients_lock:
+        if client is None:
+            _shared_clients.pop(key, None)
+        else:
+            _shared_clients[key] = client
+
+
+def reset_shared_clients() -> None:
+    """Forget every process-wide client, the next `shared_client` call creates a new one."""
+    with _shared_clients_lock:
+        _shared_clients.clear()
@@ -0,0 +1,109 @@
+"""Helpers for running blocking kubernetes requests on background threads."""
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+def prefetch(iterable: Iterable[T], depth: int = 1, name: Optional[str] = None) -> Iterator[T]:
+    """Iterate over `iterable` on a background thread, keeping up to `depth` items ready ahead of the consumer.
+
+    Exceptions raised by the iterable are re-raised in the consumer after the items produced before them.
+    Closing the returned generator stops the background thread after its current item.
+    """
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+    items: queue.Queue[Tuple[Any, Optional[BaseException]]] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: Tuple[Any, Optional[BaseException]]) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as e:  # noqa: B902
+            put((None, e))
+            return
+        put((_DONE, None))
+
+    thread = threading.Thread(target=produce, name=name or "kubernetes-dynamic-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def merge(iterables: Iterable[Iterable[T]], name: Optional[str] = None) -> Iterator[T]:
+    """Iterate over several blocking iterables at once, yielding their items in the order they arrive.
+
+    Every iterable but a single one runs on its own background thread. Exceptions raised by any iterable are
+    re-raised in the consumer. Closing the returned generator stops the background threads after their current
+    item and closes their iterables.
+    """
+    iterables = list(iterables)
+    if len(iterables) == 1:
+        yield from iterables[0]
+        return
+    items: queue.Queue[Tuple[Any, Optional[BaseException]]] = queue.Queue(maxsize=len(iterables))
+    stop = threading.Event()
+
+    def put(entry: Tuple[Any, Optional[BaseException]]) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(iterable: Iterable[T]):
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except BaseException as e:  # noqa: B902
+            put((None, e))
+            return
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+        put((_DONE, None))
+
+    for index, iterable in enumerate(iterables):
+        thread_name = f"{name or 'kubernetes-dynamic-merge'}-{index}"
+        threading.Thread(target=produce, args=(iterable,), name=thread_name, daemon=True).start()
+    try:
+        running = len(iterables)
+        while running:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                running -= 1
+                continue
+            yield item
+    finally:
+        stop.set()
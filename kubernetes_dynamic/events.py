@@ -1,15 +1,35 @@
+import collections
 import http
+import itertools
+import logging
+import math
+import threading
+import time
 from enum import Enum
-from typing import Any, Dict, Generic, TypeVar
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, Optional, Sequence, Tuple, TypeVar
 
 import pydantic
+import urllib3
 from urllib3 import HTTPResponse
 
-from kubernetes_dynamic.exceptions import ApiException, api_exception
+from kubernetes_dynamic import json_codec
+from kubernetes_dynamic.backoff import RETRIABLE_STATUSES, Backoff, retry_after
+from kubernetes_dynamic.exceptions import ApiException, InvalidParameter, WatchOverflowError, api_exception
 from kubernetes_dynamic.models.resource_value import ResourceValue
 
+logger = logging.getLogger(__name__)
+
 HTTP_STATUS_GONE = http.HTTPStatus.GONE
 
+# annotation of the bookmark which ends the initial events of a watch with `send_initial_events`
+INITIAL_EVENTS_END_ANNOTATION = "k8s.io/initial-events-end"
+
+# what an `EventBuffer` does with an event when it is full
+OVERFLOW_POLICIES = ("block", "drop_oldest", "coalesce", "error")
+
+# what is done with `metadata.managedFields` of the objects of responses
+MANAGED_FIELDS_MODES = ("keep", "drop", "defer")
+
 
 R = TypeVar("R", bound=ResourceValue)
 
@@ -21,12 +41,14 @@ class EventType(Enum):
     * ADDED - when a Kubernetes Event is created
     * MODIFIED - when a Kubernetes Event is modified
     * DELETED - when a Kubernetes Event is deleted
+    * BOOKMARK - the watch reached a resource version, only used to resume watches and not yielded by `Watch`
     """
 
     ADDED = "ADDED"
     MODIFIED = "MODIFIED"
     DELETED = "DELETED"
     ERROR = "ERROR"
+    BOOKMARK = "BOOKMARK"
 
 
 class Event(ResourceValue, Generic[R]):
@@ -44,18 +66,127 @@ def build_extra(cls, values: Dict[str, Any]) -> Dict[str, Any]:  # noqa: B902, N
         return values
 
 
+class FieldChanged:
+    def __init__(self, *paths: str):
+        """Event predicate passing MODIFIED events which changed the value at one of the dotted `paths`.
+
+        ADDED and DELETED events, and the first event seen of an object, always pass.
+        """
+        self.paths = paths
+        self._keys = [tuple(path.split(".")) for path in paths]
+
+    def __repr__(self) -> str:
+        return f"FieldChanged({', '.join(map(repr, self.paths))})"
+
+    def value(self, obj: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Values of the paths in a raw object, compared between the versions of the object."""
+        values = []
+        for keys in self._keys:
+            value: Any = obj
+            for key in keys:
+                value = value.get(key) if isinstance(value, dict) else None
+            values.append(value)
+        return tuple(values)
+
+
+def field_changed(*paths: str) -> FieldChanged:
+    """Predicate passing events which changed the value at one of the dotted `paths`, e.g. "spec.replicas"."""
+    return FieldChanged(*paths)
+
+
+# spec changes, the apiserver increments the generation on changes of spec but not of status
+GENERATION_CHANGED = FieldChanged("metadata.generation")
+LABELS_CHANGED = FieldChanged("metadata.labels")
+ANNOTATIONS_CHANGED = FieldChanged("metadata.annotations")
+
+
+def _raw_key(obj: Dict[str, Any]) -> str:
+    metadata = obj.get("metadata") or {}
+    return f"{metadata.get('namespace') or ''}/{metadata.get('name') or ''}"
+
+
+def _pop_managed_fields(data: dict, managed_fields: str) -> Optional[bytes]:
+    """Remove managedFields from an object unless kept, returns them encoded when deferred."""
+    if managed_fields == "keep":
+        return None
+    metadata = data.get("metadata")
+    raw = metadata.pop("managedFields", None) if isinstance(metadata, dict) else None
+    if raw is None or managed_fields == "drop":
+        return None
+    return json_codec.dumps(raw)
+
+
 class Watch(object):
-    def __init__(self, api_client, return_type=None):
+    def __init__(
+        self,
+        api_client,
+        return_type=None,
+        resume_on_gone=True,
+        on_initial_events_end: Optional[Callable[[Optional[str]], None]] = None,
+        trusted=False,
+        lazy=False,
+        predicates: Optional[Sequence[FieldChanged]] = None,
+        managed_fields: str = "keep",
+    ):
+        """Watch a collection.
+
+        Args:
+            api_client: Kubernetes ApiClient.
+            return_type: Model of the watched objects.
+            resume_on_gone: When the resource version expired (410 Gone), resume once from the current
+                resource version of the collection, events in between are lost. Otherwise raise `GoneError`.
+            on_initial_events_end: Called with the resource version once all initial events of a stream with
+                `send_initial_events` were yielded.
+            trusted: Build the objects without validation, see `ResourceValue.from_trusted`.
+            lazy: Build the fields of the objects on first access, implies `trusted`.
+            predicates: Only yield the MODIFIED events which changed an object according to one of the predicates,
+                e.g. `GENERATION_CHANGED` or `field_changed("spec.replicas")`, compared with the previous event of
+                the same object. Other events are dropped before their objects are built.
+            managed_fields: "keep", "drop" or "defer" `metadata.managedFields` of the objects, see
+                `serialize_object`. Dropped fields are also removed from the raw objects of the events.
+        """
+        if managed_fields not in MANAGED_FIELDS_MODES:
+            raise InvalidParameter(f"Invalid managed_fields value: {managed_fields}")
         from kubernetes_dynamic.models.resource_item import ResourceItem
 
         self._return_type = return_type or ResourceItem
+        self._resume_on_gone = resume_on_gone
+        self._on_initial_events_end = on_initial_events_end
+        self._trusted = trusted
+        self._lazy = lazy
+        self._predicates = tuple(predicates or ())
+        self._managed_fields = managed_fields
+        # values of the predicates by object key, of the last event of every object
+        self._seen: Dict[str, Tuple[Any, ...]] = {}
         self._stop = False
+        self._wakeup = threading.Event()
+        # response of the current request, interrupted by `stop()`
+        self._response: Optional[HTTPResponse] = None
         self._api_client = api_client
         self.resource_version = None
         self.timeout_seconds = None
+        self.initial_events_done = False
 
     def stop(self):
+        """End the current stream, or the next one when none is running."""
         self._stop = True
+        self._wakeup.set()
+        self._interrupt()
+
+    def _interrupt(self):
+        """Unblock a stream waiting for the next event, instead of until its request times out."""
+        resp = self._response
+        if resp is None:
+            return
+        try:
+            # only urllib3 >= 2.3 can shut down a response read by another thread
+            shutdown = getattr(resp, "shutdown", None)
+            if shutdown:
+                shutdown()
+            else:
+                resp.close()
+        except Exception:  # noqa: B902
+            logger.debug("Interrupting the watch response failed", exc_info=True)
 
     def stream(
         self,
@@ -65,44 +196,291 @@ def stream(
         watch=True,
         _preload_content=False,
         timeout_seconds=None,
+        allow_watch_bookmarks=True,
+        send_initial_events=False,
+        reconnect=False,
+        deadline: Optional[float] = None,
+        backoff: Optional[Backoff] = None,
         **kwargs,
     ):
-        self._stop = False
+        """Yield the events of a collection.
+
+        With `send_initial_events`, the watch starts with an ADDED event for every existing object (the
+        watch-list protocol), so no list is needed first. The end of the initial events is reported through
+        `on_initial_events_end` and `initial_events_done`. Servers without support reject such a watch with
+        400 Bad Request or 422 Unprocessable Entity.
+
+        With `reconnect`, the watch survives connection errors, 429 Too Many Requests and 5xx errors by
+        reconnecting after a delay of `backoff` (capped, jittered, exponential), and continues after every
+        request ended by `timeout_seconds`. It resumes from the last seen or bookmarked resource version,
+        until `stop()` is called or `deadline` seconds have passed.
+        """
         self.resource_version = resource_version or self.resource_version
         self.timeout_seconds = timeout_seconds
+        self.initial_events_done = False
+        backoff = backoff or Backoff()
+        end = time.monotonic() + deadline if deadline is not None else None
         retry_after_410 = False
-        while not self._stop:
-            resp: HTTPResponse = func(
-                *args,
-                resource_version=self.resource_version,
-                watch=watch,
-                _preload_content=_preload_content,
-                timeout_seconds=timeout_seconds or 5,
-                **kwargs,
-            )
-            try:
-                yield from self._parse_response_iter(resp)
-            except ApiException as e:
-                if e.status == 410 and not retry_after_410:
-                    self.resource_version = func(*args, **kwargs).metadata.resourceVersion
-                    retry_after_410 = True
+        try:
+            while not self._stop:
+                request_timeout = timeout_seconds or 5
+                if end is not None:
+                    remaining = end - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    request_timeout = max(1, min(request_timeout, math.ceil(remaining)))
+                if send_initial_events and not self.initial_events_done:
+                    # reconnects before the end of the initial events start them over
+                    initial_events = dict(send_initial_events=True, resource_version_match="NotOlderThan")
+                    allow_watch_bookmarks = True
+                else:
+                    initial_events = {}
+                try:
+                    resp: HTTPResponse = func(
+                        *args,
+                        resource_version=self.resource_version,
+                        watch=watch,
+                        _preload_content=_preload_content,
+                        timeout_seconds=request_timeout,
+                        allow_watch_bookmarks=allow_watch_bookmarks,
+                        **initial_events,
+                        **kwargs,
+                    )
+                    self._response = resp
+                    try:
+                        if self._stop:
+                            return
+                        for event in self._parse_response_iter(resp):
+                            backoff.reset()
+                            retry_after_410 = False
+                            yield event
+                    except Exception:
+                        # reading a response interrupted by `stop()` may fail, the stream just ends
+                        if self._stop:
+                            return
+                        raise
+                    finally:
+                        self._response = None
+                        resp.close()
+                        resp.release_conn()
+                    backoff.reset()
+                    retry_after_410 = False
+                except ApiException as e:
+                    if e.status == 410 and self._resume_on_gone and not retry_after_410:
+                        self.resource_version = self._current_resource_version(func, *args, **kwargs)
+                        retry_after_410 = True
+                        continue
+                    if not (reconnect and e.status in RETRIABLE_STATUSES):
+                        raise api_exception(e) from e
+                    self._wait(backoff, end, retry_after(e))
                     continue
-                raise api_exception(e) from e
-            finally:
-                resp.close()
-                resp.release_conn()
-                if timeout_seconds or self.resource_version is None:
+                except (urllib3.exceptions.HTTPError, ConnectionError):
+                    if not reconnect:
+                        raise
+                    self._wait(backoff, end)
+                    continue
+                if not reconnect and (timeout_seconds or self.resource_version is None):
                     self._stop = True
+        finally:
+            # reset at the end rather than the start, so a `stop()` from another thread before the stream
+            # started is not lost
+            self._stop = False
+            self._wakeup.clear()
+
+    def _wait(self, backoff: Backoff, end: Optional[float], minimum: Optional[float] = None):
+        """Sleep before reconnecting, woken up by `stop()`."""
+        delay = max(backoff.next(), minimum or 0)
+        if end is not None:
+            delay = min(delay, max(end - time.monotonic(), 0))
+        self._wakeup.wait(delay)
+
+    def _passes(self, event_type: str, obj: Dict[str, Any]) -> bool:
+        """Whether an event passes the predicates, keeps track of the last values of every object."""
+        key = _raw_key(obj)
+        if event_type == EventType.DELETED.value:
+            self._seen.pop(key, None)
+            return True
+        values = tuple(predicate.value(obj) for predicate in self._predicates)
+        previous = self._seen.get(key)
+        self._seen[key] = values
+        if event_type != EventType.MODIFIED.value or previous is None:
+            return True
+        return any(old != new for old, new in zip(previous, values))
+
+    @staticmethod
+    def _current_resource_version(func, *args, **kwargs) -> str:
+        """Resource version of the collection, a list of a single item is enough to get it."""
+        kwargs = {key: value for key, value in kwargs.items() if key != "header_params"}
+        kwargs.update(serialize=True, limit=1)
+        return func(*args, **kwargs).metadata.resourceVersion
 
     def _parse_response_iter(self, resp: HTTPResponse):
         for line in resp:
-            event = pydantic.parse_raw_as(Event, line)
-            if event.type == EventType.ERROR:
-                raise ApiException(event.object.code)
-
-            event.object = self._return_type(event.object)
-            self.resource_version = event.raw_object.get("metadata", {}).get("resourceVersion")
+            data = json_codec.loads(line)
+            if data.get("type") == EventType.BOOKMARK.value:
+                metadata = data["object"]["metadata"]
+                self.resource_version = metadata["resourceVersion"]
+                if (metadata.get("annotations") or {}).get(INITIAL_EVENTS_END_ANNOTATION) == "true":
+                    self.initial_events_done = True
+                    if self._on_initial_events_end:
+                        self._on_initial_events_end(self.resource_version)
+                continue
+            if data.get("type") == EventType.ERROR.value:
+                status = data.get("object") or {}
+                raise ApiException(status=status.get("code"), reason=status.get("message"))
+            raw_object = data["object"]
+            if self._predicates and not self._passes(data["type"], raw_object):
+                self.resource_version = (raw_object.get("metadata") or {}).get("resourceVersion")
+                continue
+            raw_managed_fields = _pop_managed_fields(raw_object, self._managed_fields)
+            # the object is decoded once into the return type, the event itself needs no validation
+            if self._trusted or self._lazy:
+                obj = self._return_type.from_trusted(raw_object, self._lazy)
+            else:
+                obj = self._return_type(dict(raw_object))
+            if raw_managed_fields is not None:
+                obj.metadata.defer_field("managedFields", raw_managed_fields)
+            event = Event.construct(type=data["type"], object=obj, raw_object=raw_object)
+            self.resource_version = (raw_object.get("metadata") or {}).get("resourceVersion")
             yield event
 
             if self._stop:
                 break
+
+
+class EventBuffer(Generic[R]):
+    def __init__(self, max_queued: int = 1000, overflow: str = "block"):
+        """Bounded queue of events between a thread reading a watch and its consumer.
+
+        Args:
+            max_queued: Number of events queued at most.
+            overflow: What to do with an event when the queue is full: "block" the producer until the consumer
+                caught up, "drop_oldest" queued event, "coalesce" it with a queued event of the same object so
+                only the latest one of every object is kept (blocks when all queued events are of other objects),
+                or end the buffer with a `WatchOverflowError` ("error"). `dropped` counts the events dropped or
+                replaced by a newer one.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise InvalidParameter(f"Invalid overflow value: {overflow}")
+        if max_queued < 1:
+            raise InvalidParameter("max_queued must be at least 1")
+        self.max_queued = max_queued
+        self.overflow = overflow
+        self.dropped = 0
+        self._events: collections.OrderedDict[Hashable, Event[R]] = collections.OrderedDict()
+        self._ids = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._watcher: Optional[Watch] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __enter__(self) -> "EventBuffer[R]":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __iter__(self) -> "EventBuffer[R]":
+        return self
+
+    def __next__(self) -> Event[R]:
+        with self._condition:
+            while not self._events and not self._closed:
+                self._condition.wait()
+            if self._events:
+                _, event = self._events.popitem(last=False)
+                self._condition.notify_all()
+                return event
+            if self._error is not None:
+                raise self._error
+            raise StopIteration
+
+    def close(self) -> None:
+        """Stop receiving events, queued events can still be iterated. Stops the watcher passed to `read`."""
+        self._end()
+        if self._watcher:
+            self._watcher.stop()
+
+    def put(self, event: Event[R], block: bool = True) -> bool:
+        """Queue an event according to the overflow policy, returns False once the buffer is closed.
+
+        With `block=False`, a full buffer which would have to wait for the consumer ("block", or "coalesce" with
+        only other objects queued) ends with a `WatchOverflowError` instead.
+        """
+        key = _raw_key(event.raw_object) if self.overflow == "coalesce" else next(self._ids)
+        with self._condition:
+            while not self._closed:
+                if key in self._events:
+                    self._events[key] = event
+                    self.dropped += 1
+                    return True
+                if len(self._events) < self.max_queued:
+                    self._events[key] = event
+                    self._condition.notify_all()
+                    return True
+                if self.overflow == "drop_oldest":
+                    self._events.popitem(last=False)
+                    self.dropped += 1
+                elif self.overflow == "error" or not block:
+                    self._end(WatchOverflowError(f"More than {self.max_queued} events queued."))
+                else:
+                    self._condition.wait()
+            return False
+
+    def read(
+        self, events: Iterable[Event[R]], name: Optional[str] = None, watcher: Optional[Watch] = None
+    ) -> "EventBuffer[R]":
+        """Queue `events` on a background thread, until they end or the buffer is closed.
+
+        An exception raised by `events` ends the buffer, the consumer gets it after the queued events. Pass the
+        `watcher` streaming `events` so that closing the buffer ends the watch right away, instead of with its
+        next event.
+        """
+        self._watcher = watcher
+
+        def run():
+            iterator = iter(events)
+            try:
+                for event in iterator:
+                    if not self.put(event):
+                        break
+            except Exception as e:  # noqa: B902
+                self._end(e)
+            finally:
+                close = getattr(iterator, "close", None)
+                if close:
+                    close()
+                self._end()
+
+        threading.Thread(target=run, name=name or "kubernetes-dynamic-watch-reader", daemon=True).start()
+        return self
+
+    def dispatch(self, callback: Callable[[Event[R]], None], name: Optional[str] = None) -> "EventBuffer[R]":
+        """Call `callback` with every event on a background thread, exceptions of the callback are logged."""
+
+        def run():
+            try:
+                for event in self:
+                    try:
+                        callback(event)
+                    except Exception:  # noqa: B902
+                        logger.exception("Watch event callback failed")
+            except Exception:  # noqa: B902
+                logger.exception("Watch ended with an error")
+
+        threading.Thread(target=run, name=name or "kubernetes-dynamic-watch-callback", daemon=True).start()
+        return self
+
+    def _end(self, error: Optional[BaseException] = None) -> None:
+        with self._condition:
+            if not self._closed:
+                self._closed = True
+                self._error = error
+                self._condition.notify_all()
@@ -49,8 +49,17 @@ class InvalidParameter(Exception):
 
 
 class EventTimeoutError(TimeoutError):
-    """Used when a waiting for an event times out."""
+    """Used when a waiting for an event times out.
 
-    def __init__(self, *args, last):
+    `last` is the last event received, `results` the last check results by object key when waiting for several
+    objects.
+    """
+
+    def __init__(self, *args, last, results=None):
         super().__init__(*args)
         self.last = last
+        self.results = results
+
+
+class WatchOverflowError(Exception):
+    """Used when a consumer of a watch fell behind by more events than it may queue."""
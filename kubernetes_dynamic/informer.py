@@ -0,0 +1,440 @@
+"""Shared informers: local caches of collections, kept up to date by a watch.
+
+An informer lists a collection once, then watches it from the resource version of the list and applies every
+event to its `Store`. When that resource version expired (410 Gone) the collection is listed again. With
+`watch_list`, the initial state is streamed by a watch with `send_initial_events` instead of listed, which
+avoids holding the whole list in memory at once; servers without support fall back to listing, as do watches
+which end `WATCH_LIST_ATTEMPTS` times in a row before the end of their initial events. Handlers
+are called for every added, updated and deleted object. Use `K8sClient.informer` to share one list and watch
+per resource, namespace and selectors within a process.
+
+Cached objects can be looked up by named indexes, which are kept up to date on every change. An index function
+returns the values an object is found under, see `index_by_namespace`, `index_by_labels`, `index_by_owner_uid`
+and `index_by_node_name`.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import typing
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from .backoff import Backoff
+from .client import object_key
+from .events import Event, EventType, Watch
+from .exceptions import BadRequestError, GoneError, InvalidParameter, UnprocessibleEntityError
+from .models.resource_value import ResourceValue
+
+if typing.TYPE_CHECKING:
+    from .client import K8sClient
+    from .resource_api import ResourceApi
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R", bound=ResourceValue)
+
+# watch-list requests ending before the initial-events-end bookmark, after which the informer lists instead
+WATCH_LIST_ATTEMPTS = 3
+
+Handler = Tuple[
+    Optional[Callable[[R], None]],
+    Optional[Callable[[R, R], None]],
+    Optional[Callable[[R], None]],
+]
+IndexFunc = Callable[[R], List[str]]
+
+
+def index_by_namespace(item: ResourceValue) -> List[str]:
+    namespace = item.metadata.namespace
+    return [namespace] if namespace else []
+
+
+def index_by_labels(item: ResourceValue) -> List[str]:
+    """Every label as "key=value"."""
+    return [f"{key}={value}" for key, value in (item.metadata.labels or {}).items()]
+
+
+def index_by_owner_uid(item: ResourceValue) -> List[str]:
+    return [uid for uid in (owner.get("uid") for owner in item.metadata.ownerReferences or []) if uid]
+
+
+def index_by_node_name(item: ResourceValue) -> List[str]:
+    """`spec.nodeName` of pods."""
+    node_name = (item.get("spec") or {}).get("nodeName")
+    return [node_name] if node_name else []
+
+
+class Store(Generic[R]):
+    """Thread safe objects of a collection by key, "namespace/name" or "name", see `object_key`."""
+
+    def __init__(self, indexers: Optional[Dict[str, IndexFunc]] = None):
+        self._items: Dict[str, R] = {}
+        self._lock = threading.RLock()
+        self._indexers: Dict[str, IndexFunc] = {}
+        # index name -> indexed value -> keys, and index name -> key -> indexed values to update them
+        self._indices: Dict[str, Dict[str, Set[str]]] = {}
+        self._indexed: Dict[str, Dict[str, List[str]]] = {}
+        self.resource_version: Optional[str] = None
+        self.add_indexers(indexers or {})
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def get(self, key: str) -> Optional[R]:
+        return self._items.get(key)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._items)
+
+    def list(self) -> List[R]:
+        with self._lock:
+            return list(self._items.values())
+
+    def add_indexers(self, indexers: Dict[str, IndexFunc]) -> None:
+        """Add named index functions, the cached objects are indexed right away.
+
+        Adding the same function again under the same name does nothing, another function raises
+        `InvalidParameter`.
+        """
+        with self._lock:
+            for name, func in indexers.items():
+                existing = self._indexers.get(name)
+                if existing is func:
+                    continue
+                if existing is not None:
+                    raise InvalidParameter(f"Indexer {name} already exists")
+                self._indexers[name] = func
+                self._indices[name] = {}
+                self._indexed[name] = {}
+                for key, item in self._items.items():
+                    self._index(name, key, item)
+
+    def by_index(self, name: str, value: str) -> List[R]:
+        """Objects found under `value` in the index `name`."""
+        with self._lock:
+            if name not in self._indices:
+                raise InvalidParameter(f"Indexer {name} does not exist")
+            return [self._items[key] for key in self._indices[name].get(value, ())]
+
+    def index_values(self, name: str) -> List[str]:
+        """Indexed values of the index `name`."""
+        with self._lock:
+            if name not in self._indices:
+                raise InvalidParameter(f"Indexer {name} does not exist")
+            return list(self._indices[name])
+
+    def update(self, item: R) -> Optional[R]:
+        """Add or replace an object, returns the previous version."""
+        with self._lock:
+            key = object_key(item)
+            old = self._items.get(key)
+            self._items[key] = item
+            for name in self._indexers:
+                self._unindex(name, key)
+                self._index(name, key, item)
+            return old
+
+    def delete(self, item: R) -> Optional[R]:
+        """Remove an object, returns the removed version."""
+        with self._lock:
+            key = object_key(item)
+            old = self._items.pop(key, None)
+            for name in self._indexers:
+                self._unindex(name, key)
+            return old
+
+    def replace(
+        self, items: Iterable[R], resource_version: Optional[str]
+    ) -> Tuple[List[R], List[Tuple[R, R]], List[R]]:
+        """Replace the content by a fresh list, returns the added, (old, new) updated and deleted objects."""
+        with self._lock:
+            old_items = self._items
+            self._items = {object_key(item): item for item in items}
+            self.resource_version = resource_version
+            for name in self._indexers:
+                self._indices[name] = {}
+                self._indexed[name] = {}
+                for key, item in self._items.items():
+                    self._index(name, key, item)
+            added = []
+            updated = []
+            for key, item in self._items.items():
+                old = old_items.get(key)
+                if old is None:
+                    added.append(item)
+                elif old.metadata.resourceVersion != item.metadata.resourceVersion:
+                    updated.append((old, item))
+            deleted = [item for key, item in old_items.items() if key not in self._items]
+            return added, updated, deleted
+
+    def _index(self, name: str, key: str, item: R):
+        values = self._indexers[name](item)
+        if not values:
+            return
+        index = self._indices[name]
+        for value in values:
+            index.setdefault(value, set()).add(key)
+        self._indexed[name][key] = values
+
+    def _unindex(self, name: str, key: str):
+        index = self._indices[name]
+        for value in self._indexed[name].pop(key, ()):
+            keys = index.get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+
+
+class Informer(Generic[R]):
+    def __init__(
+        self,
+        client: K8sClient,
+        resource: ResourceApi[R],
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        page_size: int = 500,
+        watch_timeout: int = 60,
+        backoff: Optional[Backoff] = None,
+        indexers: Optional[Dict[str, IndexFunc]] = None,
+        watch_list: bool = False,
+    ):
+        """Local cache of a collection, see the module documentation.
+
+        Args:
+            client: Client used to list and watch.
+            resource: Resource to cache.
+            namespace: Namespace of namespaced resources.
+            label_selector: Only cache objects with matching labels.
+            field_selector: Only cache objects with matching fields.
+            page_size: Page size of the initial and the following lists.
+            watch_timeout: Server side timeout of each watch request, the watch then continues from the last
+                resource version. Stopping the informer waits for the current request at most this long.
+            backoff: Delays before listing or watching again after an error, e.g. a connection error.
+            indexers: Named index functions, see `Store.add_indexers`.
+            watch_list: Stream the initial state with a watch instead of listing it, when the server supports it.
+        """
+        self.client = client
+        self.resource = resource
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.page_size = page_size
+        self.watch_timeout = watch_timeout
+        self.backoff = backoff or Backoff()
+        self.watch_list = watch_list
+        self.store: Store[R] = Store(indexers)
+        self._handlers: List[Handler] = []
+        # serializes changes of the store with handler calls, so handlers see changes in order
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watcher: Optional[Watch] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether the initial list was loaded into the store."""
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Block until the initial list was loaded into the store, returns False on timeout."""
+        return self._synced.wait(timeout)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    @property
+    def resource_version(self) -> Optional[str]:
+        """Resource version the store is up to date with."""
+        return self.store.resource_version
+
+    def add_handler(
+        self,
+        on_add: Optional[Callable[[R], None]] = None,
+        on_update: Optional[Callable[[R, R], None]] = None,
+        on_delete: Optional[Callable[[R], None]] = None,
+    ) -> None:
+        """Call `on_add(obj)`, `on_update(old, new)` and `on_delete(obj)` on changes of the collection.
+
+        Handlers are called from the informer thread, one change at a time. When the informer has already
+        synced, `on_add` is called for every cached object first.
+        """
+        with self._lock:
+            self._handlers.append((on_add, on_update, on_delete))
+            if on_add and self.has_synced:
+                for item in self.store.list():
+                    self._call(on_add, item)
+
+    def get(self, name: str, namespace: Optional[str] = None) -> Optional[R]:
+        """Cached object by name."""
+        return self.store.get(f"{namespace}/{name}" if namespace else name)
+
+    def list(self) -> List[R]:
+        """All cached objects."""
+        return self.store.list()
+
+    def add_indexers(self, indexers: Dict[str, IndexFunc]) -> None:
+        """Add named index functions, see `Store.add_indexers`."""
+        self.store.add_indexers(indexers)
+
+    def by_index(self, name: str, value: str) -> List[R]:
+        """Cached objects found under `value` in the index `name`, e.g. `by_index("node", "node-1")`."""
+        return self.store.by_index(name, value)
+
+    def start(self) -> Informer[R]:
+        """Start listing and watching on a background thread, if not running yet."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"kubernetes-dynamic-informer-{self.resource.kind}", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop watching, the store keeps its content."""
+        self._stopped.set()
+        if self._watcher:
+            self._watcher.stop()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _run(self):
+        relist = True
+        watch_list_attempts = 0
+        while not self.stopped:
+            try:
+                if relist and self.watch_list:
+                    relist = not self._watch_list()
+                    watch_list_attempts = watch_list_attempts + 1 if relist else 0
+                    if watch_list_attempts >= WATCH_LIST_ATTEMPTS and not self.stopped:
+                        logger.info(
+                            "Watch-list of %s ended %d times without its initial events, listing instead",
+                            self.resource.kind,
+                            watch_list_attempts,
+                        )
+                        self.watch_list = False
+                    continue
+                if relist:
+                    self._list()
+                    relist = False
+                self._watch()
+                self.backoff.reset()
+            except GoneError:
+                relist = True
+            except Exception as e:  # noqa: B902
+                if relist and self.watch_list and isinstance(e, (BadRequestError, UnprocessibleEntityError)):
+                    logger.info("Watch-list of %s is not supported, listing instead: %s", self.resource.kind, e)
+                    self.watch_list = False
+                    continue
+                logger.exception("Informer of %s failed, retrying", self.resource.kind)
+                self._stopped.wait(self.backoff.next())
+
+    def _list(self):
+        items = self.client.read(
+            self.resource,
+            namespace=self.namespace,
+            page_size=self.page_size,
+            label_selector=self.label_selector,
+            field_selector=self.field_selector,
+            serializer=self.resource._resource_type,
+        )
+        self._replace(items, items.metadata.resourceVersion)
+
+    def _replace(self, items: Iterable[R], resource_version: Optional[str]):
+        with self._lock:
+            added, updated, deleted = self.store.replace(items, resource_version)
+            for item in added:
+                self._dispatch(0, item)
+            for old, item in updated:
+                self._dispatch(1, old, item)
+            for item in deleted:
+                self._dispatch(2, item)
+            self._synced.set()
+
+    def _new_watcher(self, **kwargs) -> Watch:
+        """Watch decoding like the client, a 410 Gone is not resumed but ends in a relist."""
+        return Watch(
+            self.client.client,
+            self.resource._resource_type,
+            resume_on_gone=False,
+            trusted=self.client.trusted,
+            lazy=self.client.lazy,
+            managed_fields=self.client.managed_fields,
+            **kwargs,
+        )
+
+    def _watch_list(self) -> bool:
+        """Stream the initial state and keep watching, returns whether the initial state was complete."""
+        initial: Dict[str, R] = {}
+        self._watcher = self._new_watcher(
+            on_initial_events_end=lambda resource_version: self._replace(initial.values(), resource_version)
+        )
+        for event in self.client.watch(
+            self.resource,
+            self.namespace,
+            label_selector=self.label_selector,
+            field_selector=self.field_selector,
+            timeout=self.watch_timeout,
+            watcher=self._watcher,
+            send_initial_events=True,
+        ):
+            if self._watcher.initial_events_done:
+                self._apply(event)
+            else:
+                initial[object_key(event.object)] = event.object
+            if self.stopped:
+                break
+        if self._watcher.initial_events_done:
+            self.store.resource_version = self._watcher.resource_version or self.store.resource_version
+        return self._watcher.initial_events_done
+
+    def _watch(self):
+        self._watcher = self._new_watcher()
+        try:
+            for event in self.client.watch(
+                self.resource,
+                self.namespace,
+                label_selector=self.label_selector,
+                field_selector=self.field_selector,
+                resource_version=self.store.resource_version,
+                timeout=self.watch_timeout,
+                watcher=self._watcher,
+            ):
+                self._apply(event)
+                if self.stopped:
+                    break
+        finally:
+            # bookmarks advance the resource version without events
+            self.store.resource_version = self._watcher.resource_version or self.store.resource_version
+
+    def _apply(self, event: Event[R]):
+        with self._lock:
+            if event.type == EventType.DELETED.value:
+                old = self.store.delete(event.object)
+                self._dispatch(2, old or event.object)
+            else:
+                old = self.store.update(event.object)
+                if old is None:
+                    self._dispatch(0, event.object)
+                else:
+                    self._dispatch(1, old, event.object)
+            self.store.resource_version = event.object.metadata.resourceVersion or self.store.resource_version
+
+    def _dispatch(self, index: int, *args):
+        for handler in self._handlers:
+            if handler[index]:
+                self._call(handler[index], *args)
+
+    def _call(self, func: Callable, *args):
+        try:
+            func(*args)
+        except Exception:  # noqa: B902
+            logger.exception("Informer handler of %s failed", self.resource.kind)
@@ -0,0 +1,97 @@
+"""Pluggable JSON codec.
+
+Uses `orjson` or `msgspec` when installed and falls back to the standard library `json` module.
+The backend can be selected explicitly with `set_backend`.
+"""
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+Loads = Callable[[Any], Any]
+Dumps = Callable[[Any], bytes]
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if callable(getattr(obj, "to_dict", None)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _load_orjson() -> Tuple[Loads, Dumps]:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default)
+
+    return orjson.loads, dumps
+
+
+def _load_msgspec() -> Tuple[Loads, Dumps]:
+    import msgspec
+
+    encoder = msgspec.json.Encoder(enc_hook=_default)
+    decoder = msgspec.json.Decoder()
+    return decoder.decode, encoder.encode
+
+
+def _load_json() -> Tuple[Loads, Dumps]:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+    return json.loads, dumps
+
+
+_loaders: Dict[str, Callable[[], Tuple[Loads, Dumps]]] = {
+    "orjson": _load_orjson,
+    "msgspec": _load_msgspec,
+    "json": _load_json,
+}
+
+_backend: str = "json"
+_loads: Loads = json.loads
+_dumps: Dumps = _load_json()[1]
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """Select the JSON backend, `None` selects the fastest installed one.
+
+    Raises:
+        ImportError: the requested backend is not installed.
+    """
+    global _backend, _loads, _dumps
+    if name is not None and name not in _loaders:
+        raise ValueError(f"Unknown JSON backend: {name}, use one of {BACKENDS}")
+    for candidate in [name] if name else BACKENDS:
+        try:
+            _loads, _dumps = _loaders[candidate]()
+        except ImportError:
+            if name:
+                raise
+            continue
+        _backend = candidate
+        break
+    return _backend
+
+
+def backend() -> str:
+    """Name of the active backend."""
+    return _backend
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or str."""
+    return _loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as JSON bytes, datetimes are encoded in ISO format."""
+    return _dumps(obj)
+
+
+set_backend()
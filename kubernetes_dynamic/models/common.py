@@ -65,12 +65,15 @@ def __init__(self, initlist, metadata):
 
 
 def get_default(name: str):
-    from . import all
+    from .groups import load_model
 
-    return getattr(all, name)()
+    return load_model(name)()
 
 
 def get_type(kind: str, version: str, default: Any = None):
-    from . import all
+    from .groups import load_kind
 
-    return all.mapping.get(kind, {}).get(version, default)
+    return load_kind(kind, version, default)
+
+
+V1OwnerReference.update_forward_refs()
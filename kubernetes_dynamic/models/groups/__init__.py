@@ -0,0 +1,1024 @@
+"""Generated kubernetes models, split into one module per API group and version.
+
+The modules are imported on first use, so only the groups that are actually needed
+pay the cost of building and resolving their pydantic models.
+"""
+from __future__ import annotations
+
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, Optional, Type
+
+import pydantic
+
+# model name -> module
+MODELS: Dict[str, str] = {
+    "AdmissionregistrationV1ServiceReference": "admissionregistration_v1",
+    "AdmissionregistrationV1WebhookClientConfig": "admissionregistration_v1",
+    "ApiextensionsV1ServiceReference": "apiextensions_v1",
+    "ApiextensionsV1WebhookClientConfig": "apiextensions_v1",
+    "ApiregistrationV1ServiceReference": "apiregistration_v1",
+    "AuthenticationV1TokenRequest": "core_v1",
+    "CoreV1EndpointPort": "core_v1",
+    "CoreV1Event": "core_v1",
+    "CoreV1EventList": "core_v1",
+    "CoreV1EventSeries": "core_v1",
+    "DiscoveryV1EndpointPort": "discovery_v1",
+    "EventsV1Event": "events_v1",
+    "EventsV1EventList": "events_v1",
+    "EventsV1EventSeries": "events_v1",
+    "StorageV1TokenRequest": "storage_v1",
+    "V1Affinity": "core_v1",
+    "V1AggregationRule": "rbac_authorization_v1",
+    "V1alpha1AllocationResult": "resource_v1alpha1",
+    "V1alpha1ClusterCIDR": "networking_v1alpha1",
+    "V1alpha1ClusterCIDRList": "networking_v1alpha1",
+    "V1alpha1ClusterCIDRSpec": "networking_v1alpha1",
+    "V1alpha1MatchResources": "admissionregistration_v1alpha1",
+    "V1alpha1NamedRuleWithOperations": "admissionregistration_v1alpha1",
+    "V1alpha1ParamKind": "admissionregistration_v1alpha1",
+    "V1alpha1ParamRef": "admissionregistration_v1alpha1",
+    "V1alpha1PodScheduling": "resource_v1alpha1",
+    "V1alpha1PodSchedulingList": "resource_v1alpha1",
+    "V1alpha1PodSchedulingSpec": "resource_v1alpha1",
+    "V1alpha1PodSchedulingStatus": "resource_v1alpha1",
+    "V1alpha1ResourceClaim": "resource_v1alpha1",
+    "V1alpha1ResourceClaimConsumerReference": "resource_v1alpha1",
+    "V1alpha1ResourceClaimList": "resource_v1alpha1",
+    "V1alpha1ResourceClaimParametersReference": "resource_v1alpha1",
+    "V1alpha1ResourceClaimSchedulingStatus": "resource_v1alpha1",
+    "V1alpha1ResourceClaimSpec": "resource_v1alpha1",
+    "V1alpha1ResourceClaimStatus": "resource_v1alpha1",
+    "V1alpha1ResourceClaimTemplate": "resource_v1alpha1",
+    "V1alpha1ResourceClaimTemplateList": "resource_v1alpha1",
+    "V1alpha1ResourceClaimTemplateSpec": "resource_v1alpha1",
+    "V1alpha1ResourceClass": "resource_v1alpha1",
+    "V1alpha1ResourceClassList": "resource_v1alpha1",
+    "V1alpha1ResourceClassParametersReference": "resource_v1alpha1",
+    "V1alpha1SelfSubjectReview": "authentication_v1alpha1",
+    "V1alpha1SelfSubjectReviewStatus": "authentication_v1alpha1",
+    "V1alpha1ServerStorageVersion": "internal_apiserver_v1alpha1",
+    "V1alpha1StorageVersion": "internal_apiserver_v1alpha1",
+    "V1alpha1StorageVersionCondition": "internal_apiserver_v1alpha1",
+    "V1alpha1StorageVersionList": "internal_apiserver_v1alpha1",
+    "V1alpha1StorageVersionStatus": "internal_apiserver_v1alpha1",
+    "V1alpha1ValidatingAdmissionPolicy": "admissionregistration_v1alpha1",
+    "V1alpha1ValidatingAdmissionPolicyBinding": "admissionregistration_v1alpha1",
+    "V1alpha1ValidatingAdmissionPolicyBindingList": "admissionregistration_v1alpha1",
+    "V1alpha1ValidatingAdmissionPolicyBindingSpec": "admissionregistration_v1alpha1",
+    "V1alpha1ValidatingAdmissionPolicyList": "admissionregistration_v1alpha1",
+    "V1alpha1ValidatingAdmissionPolicySpec": "admissionregistration_v1alpha1",
+    "V1alpha1Validation": "admissionregistration_v1alpha1",
+    "V1APIGroup": "meta_v1",
+    "V1APIGroupList": "meta_v1",
+    "V1APIResource": "core_v1",
+    "V1APIResourceList": "core_v1",
+    "V1APIService": "apiregistration_v1",
+    "V1APIServiceCondition": "apiregistration_v1",
+    "V1APIServiceList": "apiregistration_v1",
+    "V1APIServiceSpec": "apiregistration_v1",
+    "V1APIServiceStatus": "apiregistration_v1",
+    "V1APIVersions": "meta_v1",
+    "V1AttachedVolume": "core_v1",
+    "V1AWSElasticBlockStoreVolumeSource": "core_v1",
+    "V1AzureDiskVolumeSource": "core_v1",
+    "V1AzureFilePersistentVolumeSource": "core_v1",
+    "V1AzureFileVolumeSource": "core_v1",
+    "V1beta1CSIStorageCapacity": "storage_v1beta1",
+    "V1beta1CSIStorageCapacityList": "storage_v1beta1",
+    "V1beta2FlowDistinguisherMethod": "flowcontrol_apiserver_v1beta2",
+    "V1beta2FlowSchema": "flowcontrol_apiserver_v1beta2",
+    "V1beta2FlowSchemaCondition": "flowcontrol_apiserver_v1beta2",
+    "V1beta2FlowSchemaList": "flowcontrol_apiserver_v1beta2",
+    "V1beta2FlowSchemaSpec": "flowcontrol_apiserver_v1beta2",
+    "V1beta2FlowSchemaStatus": "flowcontrol_apiserver_v1beta2",
+    "V1beta2GroupSubject": "flowcontrol_apiserver_v1beta2",
+    "V1beta2LimitedPriorityLevelConfiguration": "flowcontrol_apiserver_v1beta2",
+    "V1beta2LimitResponse": "flowcontrol_apiserver_v1beta2",
+    "V1beta2NonResourcePolicyRule": "flowcontrol_apiserver_v1beta2",
+    "V1beta2PolicyRulesWithSubjects": "flowcontrol_apiserver_v1beta2",
+    "V1beta2PriorityLevelConfiguration": "flowcontrol_apiserver_v1beta2",
+    "V1beta2PriorityLevelConfigurationCondition": "flowcontrol_apiserver_v1beta2",
+    "V1beta2PriorityLevelConfigurationList": "flowcontrol_apiserver_v1beta2",
+    "V1beta2PriorityLevelConfigurationReference": "flowcontrol_apiserver_v1beta2",
+    "V1beta2PriorityLevelConfigurationSpec": "flowcontrol_apiserver_v1beta2",
+    "V1beta2PriorityLevelConfigurationStatus": "flowcontrol_apiserver_v1beta2",
+    "V1beta2QueuingConfiguration": "flowcontrol_apiserver_v1beta2",
+    "V1beta2ResourcePolicyRule": "flowcontrol_apiserver_v1beta2",
+    "V1beta2ServiceAccountSubject": "flowcontrol_apiserver_v1beta2",
+    "V1beta2Subject": "flowcontrol_apiserver_v1beta2",
+    "V1beta2UserSubject": "flowcontrol_apiserver_v1beta2",
+    "V1beta3FlowDistinguisherMethod": "flowcontrol_apiserver_v1beta3",
+    "V1beta3FlowSchema": "flowcontrol_apiserver_v1beta3",
+    "V1beta3FlowSchemaCondition": "flowcontrol_apiserver_v1beta3",
+    "V1beta3FlowSchemaList": "flowcontrol_apiserver_v1beta3",
+    "V1beta3FlowSchemaSpec": "flowcontrol_apiserver_v1beta3",
+    "V1beta3FlowSchemaStatus": "flowcontrol_apiserver_v1beta3",
+    "V1beta3GroupSubject": "flowcontrol_apiserver_v1beta3",
+    "V1beta3LimitedPriorityLevelConfiguration": "flowcontrol_apiserver_v1beta3",
+    "V1beta3LimitResponse": "flowcontrol_apiserver_v1beta3",
+    "V1beta3NonResourcePolicyRule": "flowcontrol_apiserver_v1beta3",
+    "V1beta3PolicyRulesWithSubjects": "flowcontrol_apiserver_v1beta3",
+    "V1beta3PriorityLevelConfiguration": "flowcontrol_apiserver_v1beta3",
+    "V1beta3PriorityLevelConfigurationCondition": "flowcontrol_apiserver_v1beta3",
+    "V1beta3PriorityLevelConfigurationList": "flowcontrol_apiserver_v1beta3",
+    "V1beta3PriorityLevelConfigurationReference": "flowcontrol_apiserver_v1beta3",
+    "V1beta3PriorityLevelConfigurationSpec": "flowcontrol_apiserver_v1beta3",
+    "V1beta3PriorityLevelConfigurationStatus": "flowcontrol_apiserver_v1beta3",
+    "V1beta3QueuingConfiguration": "flowcontrol_apiserver_v1beta3",
+    "V1beta3ResourcePolicyRule": "flowcontrol_apiserver_v1beta3",
+    "V1beta3ServiceAccountSubject": "flowcontrol_apiserver_v1beta3",
+    "V1beta3Subject": "flowcontrol_apiserver_v1beta3",
+    "V1beta3UserSubject": "flowcontrol_apiserver_v1beta3",
+    "V1Binding": "core_v1",
+    "V1BoundObjectReference": "core_v1",
+    "V1Capabilities": "core_v1",
+    "V1CephFSPersistentVolumeSource": "core_v1",
+    "V1CephFSVolumeSource": "core_v1",
+    "V1CertificateSigningRequest": "certificates_v1",
+    "V1CertificateSigningRequestCondition": "certificates_v1",
+    "V1CertificateSigningRequestList": "certificates_v1",
+    "V1CertificateSigningRequestSpec": "certificates_v1",
+    "V1CertificateSigningRequestStatus": "certificates_v1",
+    "V1CinderPersistentVolumeSource": "core_v1",
+    "V1CinderVolumeSource": "core_v1",
+    "V1ClaimSource": "core_v1",
+    "V1ClientIPConfig": "core_v1",
+    "V1ClusterRole": "rbac_authorization_v1",
+    "V1ClusterRoleBinding": "rbac_authorization_v1",
+    "V1ClusterRoleBindingList": "rbac_authorization_v1",
+    "V1ClusterRoleList": "rbac_authorization_v1",
+    "V1ComponentCondition": "core_v1",
+    "V1ComponentStatus": "core_v1",
+    "V1ComponentStatusList": "core_v1",
+    "V1Condition": "core_v1",
+    "V1ConfigMap": "core_v1",
+    "V1ConfigMapEnvSource": "core_v1",
+    "V1ConfigMapKeySelector": "core_v1",
+    "V1ConfigMapList": "core_v1",
+    "V1ConfigMapNodeConfigSource": "core_v1",
+    "V1ConfigMapProjection": "core_v1",
+    "V1ConfigMapVolumeSource": "core_v1",
+    "V1Container": "core_v1",
+    "V1ContainerImage": "core_v1",
+    "V1ContainerPort": "core_v1",
+    "V1ContainerState": "core_v1",
+    "V1ContainerStateRunning": "core_v1",
+    "V1ContainerStateTerminated": "core_v1",
+    "V1ContainerStateWaiting": "core_v1",
+    "V1ContainerStatus": "core_v1",
+    "V1ControllerRevision": "apps_v1",
+    "V1ControllerRevisionList": "apps_v1",
+    "V1CronJob": "batch_v1",
+    "V1CronJobList": "batch_v1",
+    "V1CronJobSpec": "batch_v1",
+    "V1CronJobStatus": "batch_v1",
+    "V1CrossVersionObjectReference": "autoscaling_v1",
+    "V1CSIDriver": "storage_v1",
+    "V1CSIDriverList": "storage_v1",
+    "V1CSIDriverSpec": "storage_v1",
+    "V1CSINode": "storage_v1",
+    "V1CSINodeDriver": "storage_v1",
+    "V1CSINodeList": "storage_v1",
+    "V1CSINodeSpec": "storage_v1",
+    "V1CSIPersistentVolumeSource": "core_v1",
+    "V1CSIStorageCapacity": "storage_v1",
+    "V1CSIStorageCapacityList": "storage_v1",
+    "V1CSIVolumeSource": "core_v1",
+    "V1CustomResourceColumnDefinition": "apiextensions_v1",
+    "V1CustomResourceConversion": "apiextensions_v1",
+    "V1CustomResourceDefinition": "apiextensions_v1",
+    "V1CustomResourceDefinitionCondition": "apiextensions_v1",
+    "V1CustomResourceDefinitionList": "apiextensions_v1",
+    "V1CustomResourceDefinitionNames": "apiextensions_v1",
+    "V1CustomResourceDefinitionSpec": "apiextensions_v1",
+    "V1CustomResourceDefinitionStatus": "apiextensions_v1",
+    "V1CustomResourceDefinitionVersion": "apiextensions_v1",
+    "V1CustomResourceSubresources": "apiextensions_v1",
+    "V1CustomResourceSubresourceScale": "apiextensions_v1",
+    "V1CustomResourceValidation": "apiextensions_v1",
+    "V1DaemonEndpoint": "core_v1",
+    "V1DaemonSet": "apps_v1",
+    "V1DaemonSetCondition": "apps_v1",
+    "V1DaemonSetList": "apps_v1",
+    "V1DaemonSetSpec": "apps_v1",
+    "V1DaemonSetStatus": "apps_v1",
+    "V1DaemonSetUpdateStrategy": "apps_v1",
+    "V1DeleteOptions": "core_v1",
+    "V1Deployment": "apps_v1",
+    "V1DeploymentCondition": "apps_v1",
+    "V1DeploymentList": "apps_v1",
+    "V1DeploymentSpec": "apps_v1",
+    "V1DeploymentStatus": "apps_v1",
+    "V1DeploymentStrategy": "apps_v1",
+    "V1DownwardAPIProjection": "core_v1",
+    "V1DownwardAPIVolumeFile": "core_v1",
+    "V1DownwardAPIVolumeSource": "core_v1",
+    "V1EmptyDirVolumeSource": "core_v1",
+    "V1Endpoint": "discovery_v1",
+    "V1EndpointAddress": "core_v1",
+    "V1EndpointConditions": "discovery_v1",
+    "V1EndpointHints": "discovery_v1",
+    "V1Endpoints": "core_v1",
+    "V1EndpointSlice": "discovery_v1",
+    "V1EndpointSliceList": "discovery_v1",
+    "V1EndpointsList": "core_v1",
+    "V1EndpointSubset": "core_v1",
+    "V1EnvFromSource": "core_v1",
+    "V1EnvVar": "core_v1",
+    "V1EnvVarSource": "core_v1",
+    "V1EphemeralContainer": "core_v1",
+    "V1EphemeralVolumeSource": "core_v1",
+    "V1EventSource": "core_v1",
+    "V1Eviction": "core_v1",
+    "V1ExecAction": "core_v1",
+    "V1ExternalDocumentation": "apiextensions_v1",
+    "V1FCVolumeSource": "core_v1",
+    "V1FlexPersistentVolumeSource": "core_v1",
+    "V1FlexVolumeSource": "core_v1",
+    "V1FlockerVolumeSource": "core_v1",
+    "V1ForZone": "discovery_v1",
+    "V1GCEPersistentDiskVolumeSource": "core_v1",
+    "V1GitRepoVolumeSource": "core_v1",
+    "V1GlusterfsPersistentVolumeSource": "core_v1",
+    "V1GlusterfsVolumeSource": "core_v1",
+    "V1GroupVersionForDiscovery": "meta_v1",
+    "V1GRPCAction": "core_v1",
+    "V1HorizontalPodAutoscaler": "autoscaling_v1",
+    "V1HorizontalPodAutoscalerList": "autoscaling_v1",
+    "V1HorizontalPodAutoscalerSpec": "autoscaling_v1",
+    "V1HorizontalPodAutoscalerStatus": "autoscaling_v1",
+    "V1HostAlias": "core_v1",
+    "V1HostPathVolumeSource": "core_v1",
+    "V1HTTPGetAction": "core_v1",
+    "V1HTTPHeader": "core_v1",
+    "V1HTTPIngressPath": "networking_v1",
+    "V1HTTPIngressRuleValue": "networking_v1",
+    "V1Ingress": "networking_v1",
+    "V1IngressBackend": "networking_v1",
+    "V1IngressClass": "networking_v1",
+    "V1IngressClassList": "networking_v1",
+    "V1IngressClassParametersReference": "networking_v1",
+    "V1IngressClassSpec": "networking_v1",
+    "V1IngressList": "networking_v1",
+    "V1IngressLoadBalancerIngress": "networking_v1",
+    "V1IngressLoadBalancerStatus": "networking_v1",
+    "V1IngressPortStatus": "networking_v1",
+    "V1IngressRule": "networking_v1",
+    "V1IngressServiceBackend": "networking_v1",
+    "V1IngressSpec": "networking_v1",
+    "V1IngressStatus": "networking_v1",
+    "V1IngressTLS": "networking_v1",
+    "V1IPBlock": "networking_v1",
+    "V1ISCSIPersistentVolumeSource": "core_v1",
+    "V1ISCSIVolumeSource": "core_v1",
+    "V1Job": "batch_v1",
+    "V1JobCondition": "batch_v1",
+    "V1JobList": "batch_v1",
+    "V1JobSpec": "batch_v1",
+    "V1JobStatus": "batch_v1",
+    "V1JobTemplateSpec": "batch_v1",
+    "V1JSONSchemaProps": "apiextensions_v1",
+    "V1KeyToPath": "core_v1",
+    "V1LabelSelector": "core_v1",
+    "V1LabelSelectorRequirement": "core_v1",
+    "V1Lease": "coordination_v1",
+    "V1LeaseList": "coordination_v1",
+    "V1LeaseSpec": "coordination_v1",
+    "V1Lifecycle": "core_v1",
+    "V1LifecycleHandler": "core_v1",
+    "V1LimitRange": "core_v1",
+    "V1LimitRangeItem": "core_v1",
+    "V1LimitRangeList": "core_v1",
+    "V1LimitRangeSpec": "core_v1",
+    "V1ListMeta": "meta_v1",
+    "V1LoadBalancerIngress": "core_v1",
+    "V1LoadBalancerStatus": "core_v1",
+    "V1LocalObjectReference": "core_v1",
+    "V1LocalSubjectAccessReview": "authorization_v1",
+    "V1LocalVolumeSource": "core_v1",
+    "V1ManagedFieldsEntry": "meta_v1",
+    "V1MutatingWebhook": "admissionregistration_v1",
+    "V1MutatingWebhookConfiguration": "admissionregistration_v1",
+    "V1MutatingWebhookConfigurationList": "admissionregistration_v1",
+    "V1Namespace": "core_v1",
+    "V1NamespaceCondition": "core_v1",
+    "V1NamespaceList": "core_v1",
+    "V1NamespaceSpec": "core_v1",
+    "V1NamespaceStatus": "core_v1",
+    "V1NetworkPolicy": "networking_v1",
+    "V1NetworkPolicyEgressRule": "networking_v1",
+    "V1NetworkPolicyIngressRule": "networking_v1",
+    "V1NetworkPolicyList": "networking_v1",
+    "V1NetworkPolicyPeer": "networking_v1",
+    "V1NetworkPolicyPort": "networking_v1",
+    "V1NetworkPolicySpec": "networking_v1",
+    "V1NetworkPolicyStatus": "networking_v1",
+    "V1NFSVolumeSource": "core_v1",
+    "V1Node": "core_v1",
+    "V1NodeAddress": "core_v1",
+    "V1NodeAffinity": "core_v1",
+    "V1NodeCondition": "core_v1",
+    "V1NodeConfigSource": "core_v1",
+    "V1NodeConfigStatus": "core_v1",
+    "V1NodeDaemonEndpoints": "core_v1",
+    "V1NodeList": "core_v1",
+    "V1NodeSelector": "core_v1",
+    "V1NodeSelectorRequirement": "core_v1",
+    "V1NodeSelectorTerm": "core_v1",
+    "V1NodeSpec": "core_v1",
+    "V1NodeStatus": "core_v1",
+    "V1NodeSystemInfo": "core_v1",
+    "V1NonResourceAttributes": "authorization_v1",
+    "V1NonResourceRule": "authorization_v1",
+    "V1ObjectFieldSelector": "core_v1",
+    "V1ObjectMeta": "meta_v1",
+    "V1ObjectReference": "core_v1",
+    "V1Overhead": "node_v1",
+    "V1OwnerReference": "meta_v1",
+    "V1PartialObjectMetadata": "meta_v1",
+    "V1PersistentVolume": "core_v1",
+    "V1PersistentVolumeClaim": "core_v1",
+    "V1PersistentVolumeClaimCondition": "core_v1",
+    "V1PersistentVolumeClaimList": "core_v1",
+    "V1PersistentVolumeClaimSpec": "core_v1",
+    "V1PersistentVolumeClaimStatus": "core_v1",
+    "V1PersistentVolumeClaimTemplate": "core_v1",
+    "V1PersistentVolumeClaimVolumeSource": "core_v1",
+    "V1PersistentVolumeList": "core_v1",
+    "V1PersistentVolumeSpec": "core_v1",
+    "V1PersistentVolumeStatus": "core_v1",
+    "V1PhotonPersistentDiskVolumeSource": "core_v1",
+    "V1Pod": "core_v1",
+    "V1PodAffinity": "core_v1",
+    "V1PodAffinityTerm": "core_v1",
+    "V1PodAntiAffinity": "core_v1",
+    "V1PodCondition": "core_v1",
+    "V1PodDisruptionBudget": "policy_v1",
+    "V1PodDisruptionBudgetList": "policy_v1",
+    "V1PodDisruptionBudgetSpec": "policy_v1",
+    "V1PodDisruptionBudgetStatus": "policy_v1",
+    "V1PodDNSConfig": "core_v1",
+    "V1PodDNSConfigOption": "core_v1",
+    "V1PodFailurePolicy": "batch_v1",
+    "V1PodFailurePolicyOnExitCodesRequirement": "batch_v1",
+    "V1PodFailurePolicyOnPodConditionsPattern": "batch_v1",
+    "V1PodFailurePolicyRule": "batch_v1",
+    "V1PodIP": "core_v1",
+    "V1PodList": "core_v1",
+    "V1PodOS": "core_v1",
+    "V1PodReadinessGate": "core_v1",
+    "V1PodResourceClaim": "core_v1",
+    "V1PodSchedulingGate": "core_v1",
+    "V1PodSecurityContext": "core_v1",
+    "V1PodSpec": "core_v1",
+    "V1PodStatus": "core_v1",
+    "V1PodTemplate": "core_v1",
+    "V1PodTemplateList": "core_v1",
+    "V1PodTemplateSpec": "core_v1",
+    "V1PolicyRule": "rbac_authorization_v1",
+    "V1PortStatus": "core_v1",
+    "V1PortworxVolumeSource": "core_v1",
+    "V1Preconditions": "core_v1",
+    "V1PreferredSchedulingTerm": "core_v1",
+    "V1PriorityClass": "scheduling_v1",
+    "V1PriorityClassList": "scheduling_v1",
+    "V1Probe": "core_v1",
+    "V1ProjectedVolumeSource": "core_v1",
+    "V1QuobyteVolumeSource": "core_v1",
+    "V1RBDPersistentVolumeSource": "core_v1",
+    "V1RBDVolumeSource": "core_v1",
+    "V1ReplicaSet": "apps_v1",
+    "V1ReplicaSetCondition": "apps_v1",
+    "V1ReplicaSetList": "apps_v1",
+    "V1ReplicaSetSpec": "apps_v1",
+    "V1ReplicaSetStatus": "apps_v1",
+    "V1ReplicationController": "core_v1",
+    "V1ReplicationControllerCondition": "core_v1",
+    "V1ReplicationControllerList": "core_v1",
+    "V1ReplicationControllerSpec": "core_v1",
+    "V1ReplicationControllerStatus": "core_v1",
+    "V1ResourceAttributes": "authorization_v1",
+    "V1ResourceClaim": "core_v1",
+    "V1ResourceFieldSelector": "core_v1",
+    "V1ResourceQuota": "core_v1",
+    "V1ResourceQuotaList": "core_v1",
+    "V1ResourceQuotaSpec": "core_v1",
+    "V1ResourceQuotaStatus": "core_v1",
+    "V1ResourceRequirements": "core_v1",
+    "V1ResourceRule": "authorization_v1",
+    "V1Role": "rbac_authorization_v1",
+    "V1RoleBinding": "rbac_authorization_v1",
+    "V1RoleBindingList": "rbac_authorization_v1",
+    "V1RoleList": "rbac_authorization_v1",
+    "V1RoleRef": "rbac_authorization_v1",
+    "V1RollingUpdateDaemonSet": "apps_v1",
+    "V1RollingUpdateDeployment": "apps_v1",
+    "V1RollingUpdateStatefulSetStrategy": "apps_v1",
+    "V1RuleWithOperations": "admissionregistration_v1",
+    "V1RuntimeClass": "node_v1",
+    "V1RuntimeClassList": "node_v1",
+    "V1Scale": "core_v1",
+    "V1ScaleIOPersistentVolumeSource": "core_v1",
+    "V1ScaleIOVolumeSource": "core_v1",
+    "V1ScaleSpec": "core_v1",
+    "V1ScaleStatus": "core_v1",
+    "V1Scheduling": "node_v1",
+    "V1ScopedResourceSelectorRequirement": "core_v1",
+    "V1ScopeSelector": "core_v1",
+    "V1SeccompProfile": "core_v1",
+    "V1Secret": "core_v1",
+    "V1SecretEnvSource": "core_v1",
+    "V1SecretKeySelector": "core_v1",
+    "V1SecretList": "core_v1",
+    "V1SecretProjection": "core_v1",
+    "V1SecretReference": "core_v1",
+    "V1SecretVolumeSource": "core_v1",
+    "V1SecurityContext": "core_v1",
+    "V1SelfSubjectAccessReview": "authorization_v1",
+    "V1SelfSubjectAccessReviewSpec": "authorization_v1",
+    "V1SelfSubjectRulesReview": "authorization_v1",
+    "V1SelfSubjectRulesReviewSpec": "authorization_v1",
+    "V1SELinuxOptions": "core_v1",
+    "V1ServerAddressByClientCIDR": "meta_v1",
+    "V1Service": "core_v1",
+    "V1ServiceAccount": "core_v1",
+    "V1ServiceAccountList": "core_v1",
+    "V1ServiceAccountTokenProjection": "core_v1",
+    "V1ServiceBackendPort": "networking_v1",
+    "V1ServiceList": "core_v1",
+    "V1ServicePort": "core_v1",
+    "V1ServiceSpec": "core_v1",
+    "V1ServiceStatus": "core_v1",
+    "V1SessionAffinityConfig": "core_v1",
+    "V1StatefulSet": "apps_v1",
+    "V1StatefulSetCondition": "apps_v1",
+    "V1StatefulSetList": "apps_v1",
+    "V1StatefulSetOrdinals": "apps_v1",
+    "V1StatefulSetPersistentVolumeClaimRetentionPolicy": "apps_v1",
+    "V1StatefulSetSpec": "apps_v1",
+    "V1StatefulSetStatus": "apps_v1",
+    "V1StatefulSetUpdateStrategy": "apps_v1",
+    "V1Status": "core_v1",
+    "V1StatusCause": "core_v1",
+    "V1StatusDetails": "core_v1",
+    "V1StorageClass": "storage_v1",
+    "V1StorageClassList": "storage_v1",
+    "V1StorageOSPersistentVolumeSource": "core_v1",
+    "V1StorageOSVolumeSource": "core_v1",
+    "V1Subject": "rbac_authorization_v1",
+    "V1SubjectAccessReview": "authorization_v1",
+    "V1SubjectAccessReviewSpec": "authorization_v1",
+    "V1SubjectAccessReviewStatus": "authorization_v1",
+    "V1SubjectRulesReviewStatus": "authorization_v1",
+    "V1Sysctl": "core_v1",
+    "V1Table": "meta_v1",
+    "V1TableColumnDefinition": "meta_v1",
+    "V1TableRow": "meta_v1",
+    "V1Taint": "core_v1",
+    "V1TCPSocketAction": "core_v1",
+    "V1TokenRequestSpec": "core_v1",
+    "V1TokenRequestStatus": "core_v1",
+    "V1TokenReview": "authentication_v1",
+    "V1TokenReviewSpec": "authentication_v1",
+    "V1TokenReviewStatus": "authentication_v1",
+    "V1Toleration": "core_v1",
+    "V1TopologySelectorLabelRequirement": "storage_v1",
+    "V1TopologySelectorTerm": "storage_v1",
+    "V1TopologySpreadConstraint": "core_v1",
+    "V1TypedLocalObjectReference": "core_v1",
+    "V1TypedObjectReference": "core_v1",
+    "V1UncountedTerminatedPods": "batch_v1",
+    "V1UserInfo": "meta_v1",
+    "V1ValidatingWebhook": "admissionregistration_v1",
+    "V1ValidatingWebhookConfiguration": "admissionregistration_v1",
+    "V1ValidatingWebhookConfigurationList": "admissionregistration_v1",
+    "V1Volume": "core_v1",
+    "V1VolumeAttachment": "storage_v1",
+    "V1VolumeAttachmentList": "storage_v1",
+    "V1VolumeAttachmentSource": "storage_v1",
+    "V1VolumeAttachmentSpec": "storage_v1",
+    "V1VolumeAttachmentStatus": "storage_v1",
+    "V1VolumeDevice": "core_v1",
+    "V1VolumeError": "storage_v1",
+    "V1VolumeMount": "core_v1",
+    "V1VolumeNodeAffinity": "core_v1",
+    "V1VolumeNodeResources": "storage_v1",
+    "V1VolumeProjection": "core_v1",
+    "V1VsphereVirtualDiskVolumeSource": "core_v1",
+    "V1WebhookConversion": "apiextensions_v1",
+    "V1WeightedPodAffinityTerm": "core_v1",
+    "V1WindowsSecurityContextOptions": "core_v1",
+    "V2ContainerResourceMetricSource": "autoscaling_v2",
+    "V2ContainerResourceMetricStatus": "autoscaling_v2",
+    "V2CrossVersionObjectReference": "autoscaling_v2",
+    "V2ExternalMetricSource": "autoscaling_v2",
+    "V2ExternalMetricStatus": "autoscaling_v2",
+    "V2HorizontalPodAutoscaler": "autoscaling_v2",
+    "V2HorizontalPodAutoscalerBehavior": "autoscaling_v2",
+    "V2HorizontalPodAutoscalerCondition": "autoscaling_v2",
+    "V2HorizontalPodAutoscalerList": "autoscaling_v2",
+    "V2HorizontalPodAutoscalerSpec": "autoscaling_v2",
+    "V2HorizontalPodAutoscalerStatus": "autoscaling_v2",
+    "V2HPAScalingPolicy": "autoscaling_v2",
+    "V2HPAScalingRules": "autoscaling_v2",
+    "V2MetricIdentifier": "autoscaling_v2",
+    "V2MetricSpec": "autoscaling_v2",
+    "V2MetricStatus": "autoscaling_v2",
+    "V2MetricTarget": "autoscaling_v2",
+    "V2MetricValueStatus": "autoscaling_v2",
+    "V2ObjectMetricSource": "autoscaling_v2",
+    "V2ObjectMetricStatus": "autoscaling_v2",
+    "V2PodsMetricSource": "autoscaling_v2",
+    "V2PodsMetricStatus": "autoscaling_v2",
+    "V2ResourceMetricSource": "autoscaling_v2",
+    "V2ResourceMetricStatus": "autoscaling_v2",
+}
+
+# kind -> version -> module
+KINDS: Dict[str, Dict[str, str]] = {
+    "TokenRequest": {
+        "v1": "core_v1",
+    },
+    "OwnerReference": {
+        "v1": "meta_v1",
+    },
+    "BoundObjectReference": {
+        "v1": "core_v1",
+    },
+    "Event": {
+        "v1": "events_v1",
+    },
+    "ObjectReference": {
+        "v1": "core_v1",
+    },
+    "EventList": {
+        "v1": "events_v1",
+    },
+    "APIGroup": {
+        "v1": "meta_v1",
+    },
+    "APIGroupList": {
+        "v1": "meta_v1",
+    },
+    "APIResourceList": {
+        "v1": "core_v1",
+    },
+    "APIResource": {
+        "v1": "core_v1",
+    },
+    "APIService": {
+        "v1": "apiregistration_v1",
+    },
+    "APIServiceList": {
+        "v1": "apiregistration_v1",
+    },
+    "APIVersions": {
+        "v1": "meta_v1",
+    },
+    "PartialObjectMetadata": {
+        "meta.k8s.io/v1": "meta_v1",
+    },
+    "Table": {
+        "meta.k8s.io/v1": "meta_v1",
+    },
+    "Binding": {
+        "v1": "core_v1",
+    },
+    "CSIDriver": {
+        "v1": "storage_v1",
+    },
+    "CSIDriverList": {
+        "v1": "storage_v1",
+    },
+    "CSINode": {
+        "v1": "storage_v1",
+    },
+    "CSINodeList": {
+        "v1": "storage_v1",
+    },
+    "CSIStorageCapacity": {
+        "v1": "storage_v1",
+        "v1beta1": "storage_v1beta1",
+    },
+    "CSIStorageCapacityList": {
+        "v1": "storage_v1",
+        "v1beta1": "storage_v1beta1",
+    },
+    "CertificateSigningRequest": {
+        "v1": "certificates_v1",
+    },
+    "CertificateSigningRequestList": {
+        "v1": "certificates_v1",
+    },
+    "ClusterRole": {
+        "v1": "rbac_authorization_v1",
+    },
+    "ClusterRoleBinding": {
+        "v1": "rbac_authorization_v1",
+    },
+    "RoleRef": {
+        "v1": "rbac_authorization_v1",
+    },
+    "Subject": {
+        "v1": "rbac_authorization_v1",
+        "v1beta2": "flowcontrol_apiserver_v1beta2",
+        "v1beta3": "flowcontrol_apiserver_v1beta3",
+    },
+    "ClusterRoleBindingList": {
+        "v1": "rbac_authorization_v1",
+    },
+    "ClusterRoleList": {
+        "v1": "rbac_authorization_v1",
+    },
+    "ComponentStatus": {
+        "v1": "core_v1",
+    },
+    "ComponentStatusList": {
+        "v1": "core_v1",
+    },
+    "ConfigMap": {
+        "v1": "core_v1",
+    },
+    "ConfigMapList": {
+        "v1": "core_v1",
+    },
+    "ControllerRevision": {
+        "v1": "apps_v1",
+    },
+    "ControllerRevisionList": {
+        "v1": "apps_v1",
+    },
+    "CronJob": {
+        "v1": "batch_v1",
+    },
+    "AzureDiskVolumeSource": {
+        "v1": "core_v1",
+    },
+    "TypedLocalObjectReference": {
+        "v1": "core_v1",
+    },
+    "TypedObjectReference": {
+        "v1": "core_v1",
+    },
+    "CronJobList": {
+        "v1": "batch_v1",
+    },
+    "CrossVersionObjectReference": {
+        "v1": "autoscaling_v1",
+        "v2": "autoscaling_v2",
+    },
+    "CustomResourceDefinition": {
+        "v1": "apiextensions_v1",
+    },
+    "CustomResourceDefinitionNames": {
+        "v1": "apiextensions_v1",
+    },
+    "CustomResourceDefinitionList": {
+        "v1": "apiextensions_v1",
+    },
+    "DaemonSet": {
+        "v1": "apps_v1",
+    },
+    "DaemonSetList": {
+        "v1": "apps_v1",
+    },
+    "DeleteOptions": {
+        "v1": "core_v1",
+    },
+    "Deployment": {
+        "v1": "apps_v1",
+    },
+    "DeploymentList": {
+        "v1": "apps_v1",
+    },
+    "EndpointSlice": {
+        "v1": "discovery_v1",
+    },
+    "EndpointSliceList": {
+        "v1": "discovery_v1",
+    },
+    "Endpoints": {
+        "v1": "core_v1",
+    },
+    "EndpointsList": {
+        "v1": "core_v1",
+    },
+    "Eviction": {
+        "v1": "core_v1",
+    },
+    "HorizontalPodAutoscaler": {
+        "v1": "autoscaling_v1",
+        "v2": "autoscaling_v2",
+    },
+    "HorizontalPodAutoscalerList": {
+        "v1": "autoscaling_v1",
+        "v2": "autoscaling_v2",
+    },
+    "Ingress": {
+        "v1": "networking_v1",
+    },
+    "IngressClass": {
+        "v1": "networking_v1",
+    },
+    "IngressClassParametersReference": {
+        "v1": "networking_v1",
+    },
+    "IngressClassList": {
+        "v1": "networking_v1",
+    },
+    "IngressList": {
+        "v1": "networking_v1",
+    },
+    "Job": {
+        "v1": "batch_v1",
+    },
+    "JobList": {
+        "v1": "batch_v1",
+    },
+    "Lease": {
+        "v1": "coordination_v1",
+    },
+    "LeaseList": {
+        "v1": "coordination_v1",
+    },
+    "LimitRange": {
+        "v1": "core_v1",
+    },
+    "LimitRangeList": {
+        "v1": "core_v1",
+    },
+    "LocalSubjectAccessReview": {
+        "v1": "authorization_v1",
+    },
+    "MutatingWebhookConfiguration": {
+        "v1": "admissionregistration_v1",
+    },
+    "MutatingWebhookConfigurationList": {
+        "v1": "admissionregistration_v1",
+    },
+    "Namespace": {
+        "v1": "core_v1",
+    },
+    "NamespaceList": {
+        "v1": "core_v1",
+    },
+    "NetworkPolicy": {
+        "v1": "networking_v1",
+    },
+    "NetworkPolicyList": {
+        "v1": "networking_v1",
+    },
+    "Node": {
+        "v1": "core_v1",
+    },
+    "NodeList": {
+        "v1": "core_v1",
+    },
+    "PersistentVolume": {
+        "v1": "core_v1",
+    },
+    "PersistentVolumeClaim": {
+        "v1": "core_v1",
+    },
+    "PersistentVolumeClaimList": {
+        "v1": "core_v1",
+    },
+    "PersistentVolumeList": {
+        "v1": "core_v1",
+    },
+    "Pod": {
+        "v1": "core_v1",
+    },
+    "PodDisruptionBudget": {
+        "v1": "policy_v1",
+    },
+    "PodDisruptionBudgetList": {
+        "v1": "policy_v1",
+    },
+    "PodList": {
+        "v1": "core_v1",
+    },
+    "PodTemplate": {
+        "v1": "core_v1",
+    },
+    "PodTemplateList": {
+        "v1": "core_v1",
+    },
+    "PriorityClass": {
+        "v1": "scheduling_v1",
+    },
+    "PriorityClassList": {
+        "v1": "scheduling_v1",
+    },
+    "ReplicaSet": {
+        "v1": "apps_v1",
+    },
+    "ReplicaSetList": {
+        "v1": "apps_v1",
+    },
+    "ReplicationController": {
+        "v1": "core_v1",
+    },
+    "ReplicationControllerList": {
+        "v1": "core_v1",
+    },
+    "ResourceQuota": {
+        "v1": "core_v1",
+    },
+    "ResourceQuotaList": {
+        "v1": "core_v1",
+    },
+    "Role": {
+        "v1": "rbac_authorization_v1",
+    },
+    "RoleBinding": {
+        "v1": "rbac_authorization_v1",
+    },
+    "RoleBindingList": {
+        "v1": "rbac_authorization_v1",
+    },
+    "RoleList": {
+        "v1": "rbac_authorization_v1",
+    },
+    "RuntimeClass": {
+        "v1": "node_v1",
+    },
+    "RuntimeClassList": {
+        "v1": "node_v1",
+    },
+    "Scale": {
+        "v1": "core_v1",
+    },
+    "Secret": {
+        "v1": "core_v1",
+    },
+    "SecretList": {
+        "v1": "core_v1",
+    },
+    "SelfSubjectAccessReview": {
+        "v1": "authorization_v1",
+    },
+    "SelfSubjectRulesReview": {
+        "v1": "authorization_v1",
+    },
+    "Service": {
+        "v1": "core_v1",
+    },
+    "ServiceAccount": {
+        "v1": "core_v1",
+    },
+    "ServiceAccountList": {
+        "v1": "core_v1",
+    },
+    "ServiceList": {
+        "v1": "core_v1",
+    },
+    "StatefulSet": {
+        "v1": "apps_v1",
+    },
+    "StatefulSetList": {
+        "v1": "apps_v1",
+    },
+    "Status": {
+        "v1": "core_v1",
+    },
+    "StatusDetails": {
+        "v1": "core_v1",
+    },
+    "StorageClass": {
+        "v1": "storage_v1",
+    },
+    "StorageClassList": {
+        "v1": "storage_v1",
+    },
+    "SubjectAccessReview": {
+        "v1": "authorization_v1",
+    },
+    "TokenReview": {
+        "v1": "authentication_v1",
+    },
+    "ValidatingWebhookConfiguration": {
+        "v1": "admissionregistration_v1",
+    },
+    "ValidatingWebhookConfigurationList": {
+        "v1": "admissionregistration_v1",
+    },
+    "VolumeAttachment": {
+        "v1": "storage_v1",
+    },
+    "VolumeAttachmentList": {
+        "v1": "storage_v1",
+    },
+    "ClusterCIDR": {
+        "v1alpha1": "networking_v1alpha1",
+    },
+    "ClusterCIDRList": {
+        "v1alpha1": "networking_v1alpha1",
+    },
+    "ParamKind": {
+        "v1alpha1": "admissionregistration_v1alpha1",
+    },
+    "PodScheduling": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "PodSchedulingList": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "ResourceClaim": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "ResourceClaimParametersReference": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "ResourceClaimList": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "ResourceClaimTemplate": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "ResourceClaimTemplateList": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "ResourceClass": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "ResourceClassParametersReference": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "ResourceClassList": {
+        "v1alpha1": "resource_v1alpha1",
+    },
+    "SelfSubjectReview": {
+        "v1alpha1": "authentication_v1alpha1",
+    },
+    "StorageVersion": {
+        "v1alpha1": "internal_apiserver_v1alpha1",
+    },
+    "StorageVersionList": {
+        "v1alpha1": "internal_apiserver_v1alpha1",
+    },
+    "ValidatingAdmissionPolicy": {
+        "v1alpha1": "admissionregistration_v1alpha1",
+    },
+    "ValidatingAdmissionPolicyBinding": {
+        "v1alpha1": "admissionregistration_v1alpha1",
+    },
+    "ValidatingAdmissionPolicyBindingList": {
+        "v1alpha1": "admissionregistration_v1alpha1",
+    },
+    "ValidatingAdmissionPolicyList": {
+        "v1alpha1": "admissionregistration_v1alpha1",
+    },
+    "FlowSchema": {
+        "v1beta2": "flowcontrol_apiserver_v1beta2",
+        "v1beta3": "flowcontrol_apiserver_v1beta3",
+    },
+    "FlowSchemaList": {
+        "v1beta2": "flowcontrol_apiserver_v1beta2",
+        "v1beta3": "flowcontrol_apiserver_v1beta3",
+    },
+    "PriorityLevelConfiguration": {
+        "v1beta2": "flowcontrol_apiserver_v1beta2",
+        "v1beta3": "flowcontrol_apiserver_v1beta3",
+    },
+    "PriorityLevelConfigurationList": {
+        "v1beta2": "flowcontrol_apiserver_v1beta2",
+        "v1beta3": "flowcontrol_apiserver_v1beta3",
+    },
+}
+
+
+def load_module(name: str) -> ModuleType:
+    """Import a group module by name, e.g. `core_v1`."""
+    return import_module(f"{__name__}.{name}")
+
+
+def load_model(name: str) -> Type[pydantic.BaseModel]:
+    """Get a model class by name, importing only the group that defines it."""
+    module = MODELS.get(name)
+    if module is None:
+        raise AttributeError(name)
+    return getattr(load_module(module), name)
+
+
+def load_kind(kind: str, version: str, default: Any = None) -> Optional[Type[pydantic.BaseModel]]:
+    """Get the model class for a kind and version, importing only the group that defines it."""
+    module = KINDS.get(kind, {}).get(version)
+    if module is None:
+        return default
+    return load_module(module).mapping[kind][version]
+
+
+def update_models(namespace: Dict[str, Any]):
+    """Resolve forward references of the models in a group module.
+
+    Models imported from other group modules are skipped, they were resolved by their own module.
+    """
+    module_name = namespace["__name__"]
+    for model in list(namespace.values()):
+        if not isinstance(model, type) or not issubclass(model, pydantic.BaseModel):
+            continue
+        if model.__module__ != module_name and model.__module__.startswith(f"{__name__}."):
+            continue
+        model.update_forward_refs(**namespace)
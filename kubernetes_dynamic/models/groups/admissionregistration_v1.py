@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1LabelSelector
+
+
+class V1ValidatingWebhookConfigurationList(ResourceItem):
+    items: List[V1ValidatingWebhookConfiguration] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ValidatingWebhook(ResourceValue):
+    admissionReviewVersions: List[str] = Field(default_factory=list)
+    clientConfig: AdmissionregistrationV1WebhookClientConfig = Field(
+        default_factory=lambda: AdmissionregistrationV1WebhookClientConfig()
+    )
+    failurePolicy: Optional[str] = None
+    matchPolicy: Optional[str] = None
+    name: Optional[str] = None
+    namespaceSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    objectSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    rules: List[V1RuleWithOperations] = Field(default_factory=list)
+    sideEffects: Optional[str] = None
+    timeoutSeconds: Optional[int] = None
+
+
+class V1ValidatingWebhookConfiguration(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    webhooks: List[V1ValidatingWebhook] = Field(default_factory=list)
+
+
+class V1MutatingWebhookConfigurationList(ResourceItem):
+    items: List[V1MutatingWebhookConfiguration] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1RuleWithOperations(ResourceValue):
+    apiGroups: List[str] = Field(default_factory=list)
+    apiVersions: List[str] = Field(default_factory=list)
+    operations: List[str] = Field(default_factory=list)
+    resources: List[str] = Field(default_factory=list)
+    scope: Optional[str] = None
+
+
+class AdmissionregistrationV1ServiceReference(ResourceValue):
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+    path: Optional[str] = None
+    port: Optional[int] = None
+
+
+class AdmissionregistrationV1WebhookClientConfig(ResourceValue):
+    caBundle: Optional[str] = None
+    service: AdmissionregistrationV1ServiceReference = Field(
+        default_factory=lambda: AdmissionregistrationV1ServiceReference()
+    )
+    url: Optional[str] = None
+
+
+class V1MutatingWebhook(ResourceValue):
+    admissionReviewVersions: List[str] = Field(default_factory=list)
+    clientConfig: AdmissionregistrationV1WebhookClientConfig = Field(
+        default_factory=lambda: AdmissionregistrationV1WebhookClientConfig()
+    )
+    failurePolicy: Optional[str] = None
+    matchPolicy: Optional[str] = None
+    name: Optional[str] = None
+    namespaceSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    objectSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    reinvocationPolicy: Optional[str] = None
+    rules: List[V1RuleWithOperations] = Field(default_factory=list)
+    sideEffects: Optional[str] = None
+    timeoutSeconds: Optional[int] = None
+
+
+class V1MutatingWebhookConfiguration(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    webhooks: List[V1MutatingWebhook] = Field(default_factory=list)
+
+
+mapping = {
+    "MutatingWebhookConfiguration": {
+        "v1": V1MutatingWebhookConfiguration,
+    },
+    "MutatingWebhookConfigurationList": {
+        "v1": V1MutatingWebhookConfigurationList,
+    },
+    "ValidatingWebhookConfiguration": {
+        "v1": V1ValidatingWebhookConfiguration,
+    },
+    "ValidatingWebhookConfigurationList": {
+        "v1": V1ValidatingWebhookConfigurationList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1LabelSelector
+
+
+class V1alpha1ValidatingAdmissionPolicyList(ResourceItem):
+    items: List[V1alpha1ValidatingAdmissionPolicy] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1alpha1ValidatingAdmissionPolicyBindingList(ResourceItem):
+    items: List[V1alpha1ValidatingAdmissionPolicyBinding] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1alpha1ParamRef(ResourceValue):
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+
+
+class V1alpha1ValidatingAdmissionPolicyBindingSpec(ResourceValue):
+    matchResources: V1alpha1MatchResources = Field(default_factory=lambda: V1alpha1MatchResources())
+    paramRef: V1alpha1ParamRef = Field(default_factory=lambda: V1alpha1ParamRef())
+    policyName: Optional[str] = None
+
+
+class V1alpha1ValidatingAdmissionPolicyBinding(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1alpha1ValidatingAdmissionPolicyBindingSpec = Field(
+        default_factory=lambda: V1alpha1ValidatingAdmissionPolicyBindingSpec()
+    )
+
+
+class V1alpha1Validation(ResourceValue):
+    expression: Optional[str] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+
+
+class V1alpha1NamedRuleWithOperations(ResourceValue):
+    apiGroups: List[str] = Field(default_factory=list)
+    apiVersions: List[str] = Field(default_factory=list)
+    operations: List[str] = Field(default_factory=list)
+    resourceNames: List[str] = Field(default_factory=list)
+    resources: List[str] = Field(default_factory=list)
+    scope: Optional[str] = None
+
+
+class V1alpha1MatchResources(ResourceValue):
+    excludeResourceRules: List[V1alpha1NamedRuleWithOperations] = Field(default_factory=list)
+    matchPolicy: Optional[str] = None
+    namespaceSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    objectSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    resourceRules: List[V1alpha1NamedRuleWithOperations] = Field(default_factory=list)
+
+
+class V1alpha1ValidatingAdmissionPolicySpec(ResourceValue):
+    failurePolicy: Optional[str] = None
+    matchConstraints: V1alpha1MatchResources = Field(default_factory=lambda: V1alpha1MatchResources())
+    paramKind: V1alpha1ParamKind = Field(default_factory=lambda: V1alpha1ParamKind())
+    validations: List[V1alpha1Validation] = Field(default_factory=list)
+
+
+class V1alpha1ValidatingAdmissionPolicy(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1alpha1ValidatingAdmissionPolicySpec = Field(default_factory=lambda: V1alpha1ValidatingAdmissionPolicySpec())
+
+
+class V1alpha1ParamKind(ResourceItem):
+    pass
+
+
+mapping = {
+    "ParamKind": {
+        "v1alpha1": V1alpha1ParamKind,
+    },
+    "ValidatingAdmissionPolicy": {
+        "v1alpha1": V1alpha1ValidatingAdmissionPolicy,
+    },
+    "ValidatingAdmissionPolicyBinding": {
+        "v1alpha1": V1alpha1ValidatingAdmissionPolicyBinding,
+    },
+    "ValidatingAdmissionPolicyBindingList": {
+        "v1alpha1": V1alpha1ValidatingAdmissionPolicyBindingList,
+    },
+    "ValidatingAdmissionPolicyList": {
+        "v1alpha1": V1alpha1ValidatingAdmissionPolicyList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+
+
+class V1CustomResourceDefinitionList(ResourceItem):
+    items: List[V1CustomResourceDefinition] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1CustomResourceDefinitionCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1CustomResourceDefinitionStatus(ResourceValue):
+    acceptedNames: V1CustomResourceDefinitionNames = Field(default_factory=lambda: V1CustomResourceDefinitionNames())
+    conditions: List[V1CustomResourceDefinitionCondition] = Field(default_factory=list)
+    storedVersions: List[str] = Field(default_factory=list)
+
+
+class V1CustomResourceSubresourceScale(ResourceValue):
+    labelSelectorPath: Optional[str] = None
+    specReplicasPath: Optional[str] = None
+    statusReplicasPath: Optional[str] = None
+
+
+class V1CustomResourceSubresources(ResourceValue):
+    scale: V1CustomResourceSubresourceScale = Field(default_factory=lambda: V1CustomResourceSubresourceScale())
+    status: Optional[object] = None
+
+
+class V1ExternalDocumentation(ResourceValue):
+    description: Optional[str] = None
+    url: Optional[str] = None
+
+
+class V1JSONSchemaProps(ResourceValue):
+    additionalItems: Optional[object] = None
+    additionalProperties: Optional[object] = None
+    allOf: List[V1JSONSchemaProps] = Field(default_factory=list)
+    anyOf: List[V1JSONSchemaProps] = Field(default_factory=list)
+    default: Optional[object] = None
+    definitions: Dict[str, V1JSONSchemaProps] = Field(default_factory=dict)
+    dependencies: Dict[str, object] = Field(default_factory=dict)
+    description: Optional[str] = None
+    enum: List[object] = Field(default_factory=list)
+    example: Optional[object] = None
+    exclusiveMaximum: Optional[bool] = None
+    exclusiveMinimum: Optional[bool] = None
+    externalDocs: V1ExternalDocumentation = Field(default_factory=lambda: V1ExternalDocumentation())
+    format: Optional[str] = None
+    id: Optional[str] = None
+    items: Union[V1JSONSchemaProps, List[V1JSONSchemaProps]] = Field(default_factory=list)
+    maxItems: Optional[int] = None
+    maxLength: Optional[int] = None
+    maxProperties: Optional[int] = None
+    maximum: Optional[float] = None
+    minItems: Optional[int] = None
+    minLength: Optional[int] = None
+    minProperties: Optional[int] = None
+    minimum: Optional[float] = None
+    multipleOf: Optional[float] = None
+    nullable: Optional[bool] = None
+    oneOf: List[V1JSONSchemaProps] = Field(default_factory=list)
+    pattern: Optional[str] = None
+    patternProperties: Dict[str, V1JSONSchemaProps] = Field(default_factory=dict)
+    properties: Dict[str, V1JSONSchemaProps] = Field(default_factory=dict)
+    required: List[str] = Field(default_factory=list)
+    title: Optional[str] = None
+    type: Optional[str] = None
+    uniqueItems: Optional[bool] = None
+
+
+class V1CustomResourceValidation(ResourceValue):
+    openAPIV3Schema: V1JSONSchemaProps = Field(default_factory=lambda: V1JSONSchemaProps())
+
+
+class V1CustomResourceColumnDefinition(ResourceValue):
+    description: Optional[str] = None
+    format: Optional[str] = None
+    jsonPath: Optional[str] = None
+    name: Optional[str] = None
+    priority: Optional[int] = None
+    type: Optional[str] = None
+
+
+class V1CustomResourceDefinitionVersion(ResourceValue):
+    additionalPrinterColumns: List[V1CustomResourceColumnDefinition] = Field(default_factory=list)
+    deprecated: Optional[bool] = None
+    deprecationWarning: Optional[str] = None
+    name: Optional[str] = None
+    v1schema: V1CustomResourceValidation = Field(alias="schema")
+    served: Optional[bool] = None
+    storage: Optional[bool] = None
+    subresources: V1CustomResourceSubresources = Field(default_factory=lambda: V1CustomResourceSubresources())
+
+
+class V1CustomResourceDefinitionNames(ResourceValue):
+    categories: List[str] = Field(default_factory=list)
+    kind: Optional[str] = None
+    listKind: Optional[str] = None
+    plural: Optional[str] = None
+    shortNames: List[str] = Field(default_factory=list)
+    singular: Optional[str] = None
+
+
+class ApiextensionsV1ServiceReference(ResourceValue):
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+    path: Optional[str] = None
+    port: Optional[int] = None
+
+
+class ApiextensionsV1WebhookClientConfig(ResourceValue):
+    caBundle: Optional[str] = None
+    service: ApiextensionsV1ServiceReference = Field(default_factory=lambda: ApiextensionsV1ServiceReference())
+    url: Optional[str] = None
+
+
+class V1WebhookConversion(ResourceValue):
+    clientConfig: ApiextensionsV1WebhookClientConfig = Field(
+        default_factory=lambda: ApiextensionsV1WebhookClientConfig()
+    )
+    conversionReviewVersions: List[str] = Field(default_factory=list)
+
+
+class V1CustomResourceConversion(ResourceValue):
+    strategy: Optional[str] = None
+    webhook: V1WebhookConversion = Field(default_factory=lambda: V1WebhookConversion())
+
+
+class V1CustomResourceDefinitionSpec(ResourceValue):
+    conversion: V1CustomResourceConversion = Field(default_factory=lambda: V1CustomResourceConversion())
+    group: Optional[str] = None
+    names: V1CustomResourceDefinitionNames = Field(default_factory=lambda: V1CustomResourceDefinitionNames())
+    preserveUnknownFields: Optional[bool] = None
+    scope: Optional[str] = None
+    versions: List[V1CustomResourceDefinitionVersion] = Field(default_factory=list)
+
+
+class V1CustomResourceDefinition(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1CustomResourceDefinitionSpec = Field(default_factory=lambda: V1CustomResourceDefinitionSpec())
+    status: V1CustomResourceDefinitionStatus = Field(default_factory=lambda: V1CustomResourceDefinitionStatus())
+
+
+mapping = {
+    "CustomResourceDefinition": {
+        "v1": V1CustomResourceDefinition,
+    },
+    "CustomResourceDefinitionNames": {
+        "v1": V1CustomResourceDefinitionNames,
+    },
+    "CustomResourceDefinitionList": {
+        "v1": V1CustomResourceDefinitionList,
+    },
+}
+
+
+update_models(locals())
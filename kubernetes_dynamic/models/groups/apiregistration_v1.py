@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+
+
+class V1APIServiceList(ResourceItem):
+    items: List[V1APIService] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1APIServiceCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1APIServiceStatus(ResourceValue):
+    conditions: List[V1APIServiceCondition] = Field(default_factory=list)
+
+
+class ApiregistrationV1ServiceReference(ResourceValue):
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+    port: Optional[int] = None
+
+
+class V1APIServiceSpec(ResourceValue):
+    caBundle: Optional[str] = None
+    group: Optional[str] = None
+    groupPriorityMinimum: Optional[int] = None
+    insecureSkipTLSVerify: Optional[bool] = None
+    service: ApiregistrationV1ServiceReference = Field(default_factory=lambda: ApiregistrationV1ServiceReference())
+    version: Optional[str] = None
+    versionPriority: Optional[int] = None
+
+
+class V1APIService(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1APIServiceSpec = Field(default_factory=lambda: V1APIServiceSpec())
+    status: V1APIServiceStatus = Field(default_factory=lambda: V1APIServiceStatus())
+
+
+mapping = {
+    "APIService": {
+        "v1": V1APIService,
+    },
+    "APIServiceList": {
+        "v1": V1APIServiceList,
+    },
+}
+
+
+update_models(locals())
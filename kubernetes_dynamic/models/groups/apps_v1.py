@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional, Union
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from ..stateful_set import V1StatefulSet as V1StatefulSet
+from . import update_models
+from .core_v1 import V1LabelSelector, V1PersistentVolumeClaim, V1PodTemplateSpec
+
+
+class V1StatefulSetList(ResourceItem):
+    items: List[V1StatefulSet] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1StatefulSetCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1StatefulSetStatus(ResourceValue):
+    availableReplicas: Optional[int] = None
+    collisionCount: Optional[int] = None
+    conditions: List[V1StatefulSetCondition] = Field(default_factory=list)
+    currentReplicas: Optional[int] = None
+    currentRevision: Optional[str] = None
+    observedGeneration: Optional[int] = None
+    readyReplicas: Optional[int] = None
+    replicas: Optional[int] = None
+    updateRevision: Optional[str] = None
+    updatedReplicas: Optional[int] = None
+
+
+class V1RollingUpdateStatefulSetStrategy(ResourceValue):
+    maxUnavailable: Optional[Union[str, int]] = None
+    partition: Optional[int] = None
+
+
+class V1StatefulSetUpdateStrategy(ResourceValue):
+    rollingUpdate: V1RollingUpdateStatefulSetStrategy = Field(
+        default_factory=lambda: V1RollingUpdateStatefulSetStrategy()
+    )
+    type: Optional[str] = None
+
+
+class V1StatefulSetPersistentVolumeClaimRetentionPolicy(ResourceValue):
+    whenDeleted: Optional[str] = None
+    whenScaled: Optional[str] = None
+
+
+class V1StatefulSetOrdinals(ResourceValue):
+    start: Optional[int] = None
+
+
+class V1StatefulSetSpec(ResourceValue):
+    minReadySeconds: Optional[int] = None
+    ordinals: V1StatefulSetOrdinals = Field(default_factory=lambda: V1StatefulSetOrdinals())
+    persistentVolumeClaimRetentionPolicy: V1StatefulSetPersistentVolumeClaimRetentionPolicy = Field(
+        default_factory=lambda: V1StatefulSetPersistentVolumeClaimRetentionPolicy()
+    )
+    podManagementPolicy: Optional[str] = None
+    replicas: Optional[int] = None
+    revisionHistoryLimit: Optional[int] = None
+    selector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    serviceName: Optional[str] = None
+    template: V1PodTemplateSpec = Field(default_factory=lambda: V1PodTemplateSpec())
+    updateStrategy: V1StatefulSetUpdateStrategy = Field(default_factory=lambda: V1StatefulSetUpdateStrategy())
+    volumeClaimTemplates: List[V1PersistentVolumeClaim] = Field(default_factory=list)
+
+
+class V1ReplicaSetList(ResourceItem):
+    items: List[V1ReplicaSet] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ReplicaSetCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1ReplicaSetStatus(ResourceValue):
+    availableReplicas: Optional[int] = None
+    conditions: List[V1ReplicaSetCondition] = Field(default_factory=list)
+    fullyLabeledReplicas: Optional[int] = None
+    observedGeneration: Optional[int] = None
+    readyReplicas: Optional[int] = None
+    replicas: Optional[int] = None
+
+
+class V1ReplicaSetSpec(ResourceValue):
+    minReadySeconds: Optional[int] = None
+    replicas: Optional[int] = None
+    selector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    template: V1PodTemplateSpec = Field(default_factory=lambda: V1PodTemplateSpec())
+
+
+class V1ReplicaSet(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1ReplicaSetSpec = Field(default_factory=lambda: V1ReplicaSetSpec())
+    status: V1ReplicaSetStatus = Field(default_factory=lambda: V1ReplicaSetStatus())
+
+
+class V1DeploymentList(ResourceItem):
+    items: List[V1Deployment] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1DeploymentCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    lastUpdateTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1DeploymentStatus(ResourceValue):
+    availableReplicas: Optional[int] = None
+    collisionCount: Optional[int] = None
+    conditions: List[V1DeploymentCondition] = Field(default_factory=list)
+    observedGeneration: Optional[int] = None
+    readyReplicas: Optional[int] = None
+    replicas: Optional[int] = None
+    unavailableReplicas: Optional[int] = None
+    updatedReplicas: Optional[int] = None
+
+
+class V1RollingUpdateDeployment(ResourceValue):
+    maxSurge: Optional[object] = None
+    maxUnavailable: Optional[object] = None
+
+
+class V1DeploymentStrategy(ResourceValue):
+    rollingUpdate: V1RollingUpdateDeployment = Field(default_factory=lambda: V1RollingUpdateDeployment())
+    type: Optional[str] = None
+
+
+class V1DeploymentSpec(ResourceValue):
+    minReadySeconds: Optional[int] = None
+    paused: Optional[bool] = None
+    progressDeadlineSeconds: Optional[int] = None
+    replicas: Optional[int] = None
+    revisionHistoryLimit: Optional[int] = None
+    selector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    strategy: V1DeploymentStrategy = Field(default_factory=lambda: V1DeploymentStrategy())
+    template: V1PodTemplateSpec = Field(default_factory=lambda: V1PodTemplateSpec())
+
+
+class V1Deployment(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1DeploymentSpec = Field(default_factory=lambda: V1DeploymentSpec())
+    status: V1DeploymentStatus = Field(default_factory=lambda: V1DeploymentStatus())
+
+
+class V1DaemonSetList(ResourceItem):
+    items: List[V1DaemonSet] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1DaemonSetCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1DaemonSetStatus(ResourceValue):
+    collisionCount: Optional[int] = None
+    conditions: List[V1DaemonSetCondition] = Field(default_factory=list)
+    currentNumberScheduled: Optional[int] = None
+    desiredNumberScheduled: Optional[int] = None
+    numberAvailable: Optional[int] = None
+    numberMisscheduled: Optional[int] = None
+    numberReady: Optional[int] = None
+    numberUnavailable: Optional[int] = None
+    observedGeneration: Optional[int] = None
+    updatedNumberScheduled: Optional[int] = None
+
+
+class V1RollingUpdateDaemonSet(ResourceValue):
+    maxSurge: Optional[object] = None
+    maxUnavailable: Optional[object] = None
+
+
+class V1DaemonSetUpdateStrategy(ResourceValue):
+    rollingUpdate: V1RollingUpdateDaemonSet = Field(default_factory=lambda: V1RollingUpdateDaemonSet())
+    type: Optional[str] = None
+
+
+class V1DaemonSetSpec(ResourceValue):
+    minReadySeconds: Optional[int] = None
+    revisionHistoryLimit: Optional[int] = None
+    selector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    template: V1PodTemplateSpec = Field(default_factory=lambda: V1PodTemplateSpec())
+    updateStrategy: V1DaemonSetUpdateStrategy = Field(default_factory=lambda: V1DaemonSetUpdateStrategy())
+
+
+class V1DaemonSet(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1DaemonSetSpec = Field(default_factory=lambda: V1DaemonSetSpec())
+    status: V1DaemonSetStatus = Field(default_factory=lambda: V1DaemonSetStatus())
+
+
+class V1ControllerRevisionList(ResourceItem):
+    items: List[V1ControllerRevision] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ControllerRevision(ResourceItem):
+    data: Optional[object] = None
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    revision: Optional[int] = None
+
+
+mapping = {
+    "ControllerRevision": {
+        "v1": V1ControllerRevision,
+    },
+    "ControllerRevisionList": {
+        "v1": V1ControllerRevisionList,
+    },
+    "DaemonSet": {
+        "v1": V1DaemonSet,
+    },
+    "DaemonSetList": {
+        "v1": V1DaemonSetList,
+    },
+    "Deployment": {
+        "v1": V1Deployment,
+    },
+    "DeploymentList": {
+        "v1": V1DeploymentList,
+    },
+    "ReplicaSet": {
+        "v1": V1ReplicaSet,
+    },
+    "ReplicaSetList": {
+        "v1": V1ReplicaSetList,
+    },
+    "StatefulSet": {
+        "v1": V1StatefulSet,
+    },
+    "StatefulSetList": {
+        "v1": V1StatefulSetList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .meta_v1 import V1UserInfo
+
+
+class V1TokenReviewStatus(ResourceValue):
+    audiences: List[str] = Field(default_factory=list)
+    authenticated: Optional[bool] = None
+    error: Optional[str] = None
+    user: V1UserInfo = Field(default_factory=lambda: V1UserInfo())
+
+
+class V1TokenReviewSpec(ResourceValue):
+    audiences: List[str] = Field(default_factory=list)
+    token: Optional[str] = None
+
+
+class V1TokenReview(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1TokenReviewSpec = Field(default_factory=lambda: V1TokenReviewSpec())
+    status: V1TokenReviewStatus = Field(default_factory=lambda: V1TokenReviewStatus())
+
+
+mapping = {
+    "TokenReview": {
+        "v1": V1TokenReview,
+    },
+}
+
+
+update_models(locals())
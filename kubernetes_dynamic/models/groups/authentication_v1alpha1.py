@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pydantic import Field
+
+from ..common import V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .meta_v1 import V1UserInfo
+
+
+class V1alpha1SelfSubjectReviewStatus(ResourceValue):
+    userInfo: V1UserInfo = Field(default_factory=lambda: V1UserInfo())
+
+
+class V1alpha1SelfSubjectReview(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    status: V1alpha1SelfSubjectReviewStatus = Field(default_factory=lambda: V1alpha1SelfSubjectReviewStatus())
+
+
+mapping = {
+    "SelfSubjectReview": {
+        "v1alpha1": V1alpha1SelfSubjectReview,
+    },
+}
+
+
+update_models(locals())
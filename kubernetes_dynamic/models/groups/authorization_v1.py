@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from ..common import V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+
+
+class V1SubjectAccessReview(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1SubjectAccessReviewSpec = Field(default_factory=lambda: V1SubjectAccessReviewSpec())
+    status: V1SubjectAccessReviewStatus = Field(default_factory=lambda: V1SubjectAccessReviewStatus())
+
+
+class V1ResourceRule(ResourceValue):
+    apiGroups: List[str] = Field(default_factory=list)
+    resourceNames: List[str] = Field(default_factory=list)
+    resources: List[str] = Field(default_factory=list)
+    verbs: List[str] = Field(default_factory=list)
+
+
+class V1NonResourceRule(ResourceValue):
+    nonResourceURLs: List[str] = Field(default_factory=list)
+    verbs: List[str] = Field(default_factory=list)
+
+
+class V1SubjectRulesReviewStatus(ResourceValue):
+    evaluationError: Optional[str] = None
+    incomplete: Optional[bool] = None
+    nonResourceRules: List[V1NonResourceRule] = Field(default_factory=list)
+    resourceRules: List[V1ResourceRule] = Field(default_factory=list)
+
+
+class V1SelfSubjectRulesReviewSpec(ResourceValue):
+    namespace: Optional[str] = None
+
+
+class V1SelfSubjectRulesReview(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1SelfSubjectRulesReviewSpec = Field(default_factory=lambda: V1SelfSubjectRulesReviewSpec())
+    status: V1SubjectRulesReviewStatus = Field(default_factory=lambda: V1SubjectRulesReviewStatus())
+
+
+class V1SelfSubjectAccessReviewSpec(ResourceValue):
+    nonResourceAttributes: V1NonResourceAttributes = Field(default_factory=lambda: V1NonResourceAttributes())
+    resourceAttributes: V1ResourceAttributes = Field(default_factory=lambda: V1ResourceAttributes())
+
+
+class V1SelfSubjectAccessReview(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1SelfSubjectAccessReviewSpec = Field(default_factory=lambda: V1SelfSubjectAccessReviewSpec())
+    status: V1SubjectAccessReviewStatus = Field(default_factory=lambda: V1SubjectAccessReviewStatus())
+
+
+class V1SubjectAccessReviewStatus(ResourceValue):
+    allowed: Optional[bool] = None
+    denied: Optional[bool] = None
+    evaluationError: Optional[str] = None
+    reason: Optional[str] = None
+
+
+class V1ResourceAttributes(ResourceValue):
+    group: Optional[str] = None
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+    resource: Optional[str] = None
+    subresource: Optional[str] = None
+    verb: Optional[str] = None
+    version: Optional[str] = None
+
+
+class V1NonResourceAttributes(ResourceValue):
+    path: Optional[str] = None
+    verb: Optional[str] = None
+
+
+class V1SubjectAccessReviewSpec(ResourceValue):
+    extra: Dict[str, List[str]] = Field(default_factory=dict)
+    groups: List[str] = Field(default_factory=list)
+    nonResourceAttributes: V1NonResourceAttributes = Field(default_factory=lambda: V1NonResourceAttributes())
+    resourceAttributes: V1ResourceAttributes = Field(default_factory=lambda: V1ResourceAttributes())
+    uid: Optional[str] = None
+    user: Optional[str] = None
+
+
+class V1LocalSubjectAccessReview(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1SubjectAccessReviewSpec = Field(default_factory=lambda: V1SubjectAccessReviewSpec())
+    status: V1SubjectAccessReviewStatus = Field(default_factory=lambda: V1SubjectAccessReviewStatus())
+
+
+mapping = {
+    "LocalSubjectAccessReview": {
+        "v1": V1LocalSubjectAccessReview,
+    },
+    "SelfSubjectAccessReview": {
+        "v1": V1SelfSubjectAccessReview,
+    },
+    "SelfSubjectRulesReview": {
+        "v1": V1SelfSubjectRulesReview,
+    },
+    "SubjectAccessReview": {
+        "v1": V1SubjectAccessReview,
+    },
+}
+
+
+update_models(locals())
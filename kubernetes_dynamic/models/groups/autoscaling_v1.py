@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+
+
+class V1HorizontalPodAutoscalerList(ResourceItem):
+    items: List[V1HorizontalPodAutoscaler] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1HorizontalPodAutoscalerStatus(ResourceValue):
+    currentCPUUtilizationPercentage: Optional[int] = None
+    currentReplicas: Optional[int] = None
+    desiredReplicas: Optional[int] = None
+    lastScaleTime: Optional[datetime] = None
+    observedGeneration: Optional[int] = None
+
+
+class V1HorizontalPodAutoscalerSpec(ResourceValue):
+    maxReplicas: Optional[int] = None
+    minReplicas: Optional[int] = None
+    scaleTargetRef: V1CrossVersionObjectReference = Field(default_factory=lambda: V1CrossVersionObjectReference())
+    targetCPUUtilizationPercentage: Optional[int] = None
+
+
+class V1HorizontalPodAutoscaler(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1HorizontalPodAutoscalerSpec = Field(default_factory=lambda: V1HorizontalPodAutoscalerSpec())
+    status: V1HorizontalPodAutoscalerStatus = Field(default_factory=lambda: V1HorizontalPodAutoscalerStatus())
+
+
+class V1CrossVersionObjectReference(ResourceItem):
+    name: Optional[str] = None
+
+
+mapping = {
+    "CrossVersionObjectReference": {
+        "v1": V1CrossVersionObjectReference,
+    },
+    "HorizontalPodAutoscaler": {
+        "v1": V1HorizontalPodAutoscaler,
+    },
+    "HorizontalPodAutoscalerList": {
+        "v1": V1HorizontalPodAutoscalerList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1LabelSelector
+
+
+class V2HorizontalPodAutoscalerList(ResourceItem):
+    items: List[V2HorizontalPodAutoscaler] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V2ResourceMetricStatus(ResourceValue):
+    current: V2MetricValueStatus = Field(default_factory=lambda: V2MetricValueStatus())
+    name: Optional[str] = None
+
+
+class V2PodsMetricStatus(ResourceValue):
+    current: V2MetricValueStatus = Field(default_factory=lambda: V2MetricValueStatus())
+    metric: V2MetricIdentifier = Field(default_factory=lambda: V2MetricIdentifier())
+
+
+class V2ObjectMetricStatus(ResourceValue):
+    current: V2MetricValueStatus = Field(default_factory=lambda: V2MetricValueStatus())
+    describedObject: V2CrossVersionObjectReference = Field(default_factory=lambda: V2CrossVersionObjectReference())
+    metric: V2MetricIdentifier = Field(default_factory=lambda: V2MetricIdentifier())
+
+
+class V2ExternalMetricStatus(ResourceValue):
+    current: V2MetricValueStatus = Field(default_factory=lambda: V2MetricValueStatus())
+    metric: V2MetricIdentifier = Field(default_factory=lambda: V2MetricIdentifier())
+
+
+class V2MetricValueStatus(ResourceValue):
+    averageUtilization: Optional[int] = None
+    averageValue: Optional[str] = None
+    value: Optional[str] = None
+
+
+class V2ContainerResourceMetricStatus(ResourceValue):
+    container: Optional[str] = None
+    current: V2MetricValueStatus = Field(default_factory=lambda: V2MetricValueStatus())
+    name: Optional[str] = None
+
+
+class V2MetricStatus(ResourceValue):
+    containerResource: V2ContainerResourceMetricStatus = Field(
+        default_factory=lambda: V2ContainerResourceMetricStatus()
+    )
+    external: V2ExternalMetricStatus = Field(default_factory=lambda: V2ExternalMetricStatus())
+    object: V2ObjectMetricStatus = Field(default_factory=lambda: V2ObjectMetricStatus())
+    pods: V2PodsMetricStatus = Field(default_factory=lambda: V2PodsMetricStatus())
+    resource: V2ResourceMetricStatus = Field(default_factory=lambda: V2ResourceMetricStatus())
+    type: Optional[str] = None
+
+
+class V2HorizontalPodAutoscalerCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V2HorizontalPodAutoscalerStatus(ResourceValue):
+    conditions: List[V2HorizontalPodAutoscalerCondition] = Field(default_factory=list)
+    currentMetrics: List[V2MetricStatus] = Field(default_factory=list)
+    currentReplicas: Optional[int] = None
+    desiredReplicas: Optional[int] = None
+    lastScaleTime: Optional[datetime] = None
+    observedGeneration: Optional[int] = None
+
+
+class V2ResourceMetricSource(ResourceValue):
+    name: Optional[str] = None
+    target: V2MetricTarget = Field(default_factory=lambda: V2MetricTarget())
+
+
+class V2PodsMetricSource(ResourceValue):
+    metric: V2MetricIdentifier = Field(default_factory=lambda: V2MetricIdentifier())
+    target: V2MetricTarget = Field(default_factory=lambda: V2MetricTarget())
+
+
+class V2ObjectMetricSource(ResourceValue):
+    describedObject: V2CrossVersionObjectReference = Field(default_factory=lambda: V2CrossVersionObjectReference())
+    metric: V2MetricIdentifier = Field(default_factory=lambda: V2MetricIdentifier())
+    target: V2MetricTarget = Field(default_factory=lambda: V2MetricTarget())
+
+
+class V2MetricIdentifier(ResourceValue):
+    name: Optional[str] = None
+    selector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+
+
+class V2ExternalMetricSource(ResourceValue):
+    metric: V2MetricIdentifier = Field(default_factory=lambda: V2MetricIdentifier())
+    target: V2MetricTarget = Field(default_factory=lambda: V2MetricTarget())
+
+
+class V2MetricTarget(ResourceValue):
+    averageUtilization: Optional[int] = None
+    averageValue: Optional[str] = None
+    type: Optional[str] = None
+    value: Optional[str] = None
+
+
+class V2ContainerResourceMetricSource(ResourceValue):
+    container: Optional[str] = None
+    name: Optional[str] = None
+    target: V2MetricTarget = Field(default_factory=lambda: V2MetricTarget())
+
+
+class V2MetricSpec(ResourceValue):
+    containerResource: V2ContainerResourceMetricSource = Field(
+        default_factory=lambda: V2ContainerResourceMetricSource()
+    )
+    external: V2ExternalMetricSource = Field(default_factory=lambda: V2ExternalMetricSource())
+    object: V2ObjectMetricSource = Field(default_factory=lambda: V2ObjectMetricSource())
+    pods: V2PodsMetricSource = Field(default_factory=lambda: V2PodsMetricSource())
+    resource: V2ResourceMetricSource = Field(default_factory=lambda: V2ResourceMetricSource())
+    type: Optional[str] = None
+
+
+class V2HPAScalingPolicy(ResourceValue):
+    periodSeconds: Optional[int] = None
+    type: Optional[str] = None
+    value: Optional[int] = None
+
+
+class V2HPAScalingRules(ResourceValue):
+    policies: List[V2HPAScalingPolicy] = Field(default_factory=list)
+    selectPolicy: Optional[str] = None
+    stabilizationWindowSeconds: Optional[int] = None
+
+
+class V2HorizontalPodAutoscalerBehavior(ResourceValue):
+    scaleDown: V2HPAScalingRules = Field(default_factory=lambda: V2HPAScalingRules())
+    scaleUp: V2HPAScalingRules = Field(default_factory=lambda: V2HPAScalingRules())
+
+
+class V2HorizontalPodAutoscalerSpec(ResourceValue):
+    behavior: V2HorizontalPodAutoscalerBehavior = Field(default_factory=lambda: V2HorizontalPodAutoscalerBehavior())
+    maxReplicas: Optional[int] = None
+    metrics: List[V2MetricSpec] = Field(default_factory=list)
+    minReplicas: Optional[int] = None
+    scaleTargetRef: V2CrossVersionObjectReference = Field(default_factory=lambda: V2CrossVersionObjectReference())
+
+
+class V2HorizontalPodAutoscaler(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V2HorizontalPodAutoscalerSpec = Field(default_factory=lambda: V2HorizontalPodAutoscalerSpec())
+    status: V2HorizontalPodAutoscalerStatus = Field(default_factory=lambda: V2HorizontalPodAutoscalerStatus())
+
+
+class V2CrossVersionObjectReference(ResourceItem):
+    name: Optional[str] = None
+
+
+mapping = {
+    "CrossVersionObjectReference": {
+        "v2": V2CrossVersionObjectReference,
+    },
+    "HorizontalPodAutoscaler": {
+        "v2": V2HorizontalPodAutoscaler,
+    },
+    "HorizontalPodAutoscalerList": {
+        "v2": V2HorizontalPodAutoscalerList,
+    },
+}
+
+
+update_models(locals())
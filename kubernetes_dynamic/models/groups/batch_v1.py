@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1LabelSelector, V1ObjectReference, V1PodTemplateSpec
+
+
+class V1JobList(ResourceItem):
+    items: List[V1Job] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1UncountedTerminatedPods(ResourceValue):
+    failed: List[str] = Field(default_factory=list)
+    succeeded: List[str] = Field(default_factory=list)
+
+
+class V1JobCondition(ResourceValue):
+    lastProbeTime: Optional[datetime] = None
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1JobStatus(ResourceValue):
+    active: Optional[int] = None
+    completedIndexes: Optional[str] = None
+    completionTime: Optional[datetime] = None
+    conditions: List[V1JobCondition] = Field(default_factory=list)
+    failed: Optional[int] = None
+    ready: Optional[int] = None
+    startTime: Optional[datetime] = None
+    succeeded: Optional[int] = None
+    uncountedTerminatedPods: V1UncountedTerminatedPods = Field(default_factory=lambda: V1UncountedTerminatedPods())
+
+
+class V1Job(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1JobSpec = Field(default_factory=lambda: V1JobSpec())
+    status: V1JobStatus = Field(default_factory=lambda: V1JobStatus())
+
+
+class V1CronJobList(ResourceItem):
+    items: List[V1CronJob] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1CronJobStatus(ResourceValue):
+    active: List[V1ObjectReference] = Field(default_factory=list)
+    lastScheduleTime: Optional[datetime] = None
+    lastSuccessfulTime: Optional[datetime] = None
+
+
+class V1PodFailurePolicyOnPodConditionsPattern(ResourceValue):
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1PodFailurePolicyOnExitCodesRequirement(ResourceValue):
+    containerName: Optional[str] = None
+    operator: Optional[str] = None
+    values: List[int] = Field(default_factory=list)
+
+
+class V1PodFailurePolicyRule(ResourceValue):
+    action: Optional[str] = None
+    onExitCodes: V1PodFailurePolicyOnExitCodesRequirement = Field(
+        default_factory=lambda: V1PodFailurePolicyOnExitCodesRequirement()
+    )
+    onPodConditions: List[V1PodFailurePolicyOnPodConditionsPattern] = Field(default_factory=list)
+
+
+class V1PodFailurePolicy(ResourceValue):
+    rules: List[V1PodFailurePolicyRule] = Field(default_factory=list)
+
+
+class V1JobSpec(ResourceValue):
+    activeDeadlineSeconds: Optional[int] = None
+    backoffLimit: Optional[int] = None
+    completionMode: Optional[str] = None
+    completions: Optional[int] = None
+    manualSelector: Optional[bool] = None
+    parallelism: Optional[int] = None
+    podFailurePolicy: V1PodFailurePolicy = Field(default_factory=lambda: V1PodFailurePolicy())
+    selector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    suspend: Optional[bool] = None
+    template: V1PodTemplateSpec = Field(default_factory=lambda: V1PodTemplateSpec())
+    ttlSecondsAfterFinished: Optional[int] = None
+
+
+class V1JobTemplateSpec(ResourceValue):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1JobSpec = Field(default_factory=lambda: V1JobSpec())
+
+
+class V1CronJobSpec(ResourceValue):
+    concurrencyPolicy: Optional[str] = None
+    failedJobsHistoryLimit: Optional[int] = None
+    jobTemplate: V1JobTemplateSpec = Field(default_factory=lambda: V1JobTemplateSpec())
+    schedule: Optional[str] = None
+    startingDeadlineSeconds: Optional[int] = None
+    successfulJobsHistoryLimit: Optional[int] = None
+    suspend: Optional[bool] = None
+    timeZone: Optional[str] = None
+
+
+class V1CronJob(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1CronJobSpec = Field(default_factory=lambda: V1CronJobSpec())
+    status: V1CronJobStatus = Field(default_factory=lambda: V1CronJobStatus())
+
+
+mapping = {
+    "CronJob": {
+        "v1": V1CronJob,
+    },
+    "CronJobList": {
+        "v1": V1CronJobList,
+    },
+    "Job": {
+        "v1": V1Job,
+    },
+    "JobList": {
+        "v1": V1JobList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+
+
+class V1CertificateSigningRequestList(ResourceItem):
+    items: List[V1CertificateSigningRequest] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1CertificateSigningRequestCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    lastUpdateTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1CertificateSigningRequestStatus(ResourceValue):
+    certificate: Optional[str] = None
+    conditions: List[V1CertificateSigningRequestCondition] = Field(default_factory=list)
+
+
+class V1CertificateSigningRequestSpec(ResourceValue):
+    expirationSeconds: Optional[int] = None
+    extra: Dict[str, List[str]] = Field(default_factory=dict)
+    groups: List[str] = Field(default_factory=list)
+    request: Optional[str] = None
+    signerName: Optional[str] = None
+    uid: Optional[str] = None
+    usages: List[str] = Field(default_factory=list)
+    username: Optional[str] = None
+
+
+class V1CertificateSigningRequest(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1CertificateSigningRequestSpec = Field(default_factory=lambda: V1CertificateSigningRequestSpec())
+    status: V1CertificateSigningRequestStatus = Field(default_factory=lambda: V1CertificateSigningRequestStatus())
+
+
+mapping = {
+    "CertificateSigningRequest": {
+        "v1": V1CertificateSigningRequest,
+    },
+    "CertificateSigningRequestList": {
+        "v1": V1CertificateSigningRequestList,
+    },
+}
+
+
+update_models(locals())
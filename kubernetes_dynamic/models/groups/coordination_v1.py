@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+
+
+class V1LeaseList(ResourceItem):
+    items: List[V1Lease] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1LeaseSpec(ResourceValue):
+    acquireTime: Optional[datetime] = None
+    holderIdentity: Optional[str] = None
+    leaseDurationSeconds: Optional[int] = None
+    leaseTransitions: Optional[int] = None
+    renewTime: Optional[datetime] = None
+
+
+class V1Lease(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1LeaseSpec = Field(default_factory=lambda: V1LeaseSpec())
+
+
+mapping = {
+    "Lease": {
+        "v1": V1Lease,
+    },
+    "LeaseList": {
+        "v1": V1LeaseList,
+    },
+}
+
+
+update_models(locals())
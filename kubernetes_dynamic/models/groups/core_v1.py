@@ -0,0 +1,1679 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..configmap import V1ConfigMap as V1ConfigMap
+from ..namespace import V1Namespace as V1Namespace
+from ..pod import V1Pod as V1Pod
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from ..secret import V1Secret as V1Secret
+from . import update_models
+
+
+class V1StatusCause(ResourceValue):
+    field: Optional[str] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+
+
+class V1StatusDetails(ResourceValue):
+    causes: List[V1StatusCause] = Field(default_factory=list)
+    group: Optional[str] = None
+    kind: Optional[str] = None
+    name: Optional[str] = None
+    retryAfterSeconds: Optional[int] = None
+    uid: Optional[str] = None
+
+
+class V1Status(ResourceItem):
+    code: Optional[int] = None
+    details: V1StatusDetails = Field(default_factory=lambda: V1StatusDetails())
+    message: Optional[str] = None
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+    reason: Optional[str] = None
+    status: Optional[str] = None
+
+
+class V1ServiceList(ResourceItem):
+    items: List[V1Service] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ServiceAccountList(ResourceItem):
+    items: List[V1ServiceAccount] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ServiceAccount(ResourceItem):
+    automountServiceAccountToken: Optional[bool] = None
+    imagePullSecrets: List[V1LocalObjectReference] = Field(default_factory=list)
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    secrets: List[V1ObjectReference] = Field(default_factory=list)
+
+
+class V1PortStatus(ResourceValue):
+    error: Optional[str] = None
+    port: Optional[int] = None
+    protocol: Optional[str] = None
+
+
+class V1LoadBalancerIngress(ResourceValue):
+    hostname: Optional[str] = None
+    ip: Optional[str] = None
+    ports: List[V1PortStatus] = Field(default_factory=list)
+
+
+class V1LoadBalancerStatus(ResourceValue):
+    ingress: List[V1LoadBalancerIngress] = Field(default_factory=list)
+
+
+class V1ServiceStatus(ResourceValue):
+    conditions: List[V1Condition] = Field(default_factory=list)
+    loadBalancer: V1LoadBalancerStatus = Field(default_factory=lambda: V1LoadBalancerStatus())
+
+
+class V1ClientIPConfig(ResourceValue):
+    timeoutSeconds: Optional[int] = None
+
+
+class V1SessionAffinityConfig(ResourceValue):
+    clientIP: V1ClientIPConfig = Field(default_factory=lambda: V1ClientIPConfig())
+
+
+class V1ServicePort(ResourceValue):
+    appProtocol: Optional[str] = None
+    name: Optional[str] = None
+    nodePort: Optional[int] = None
+    port: Optional[int] = None
+    protocol: Optional[str] = None
+    targetPort: Optional[object] = None
+
+
+class V1ServiceSpec(ResourceValue):
+    allocateLoadBalancerNodePorts: Optional[bool] = None
+    clusterIP: Optional[str] = None
+    clusterIPs: List[str] = Field(default_factory=list)
+    externalIPs: List[str] = Field(default_factory=list)
+    externalName: Optional[str] = None
+    externalTrafficPolicy: Optional[str] = None
+    healthCheckNodePort: Optional[int] = None
+    internalTrafficPolicy: Optional[str] = None
+    ipFamilies: List[str] = Field(default_factory=list)
+    ipFamilyPolicy: Optional[str] = None
+    loadBalancerClass: Optional[str] = None
+    loadBalancerIP: Optional[str] = None
+    loadBalancerSourceRanges: List[str] = Field(default_factory=list)
+    ports: List[V1ServicePort] = Field(default_factory=list)
+    publishNotReadyAddresses: Optional[bool] = None
+    selector: Dict[str, str] = Field(default_factory=dict)
+    sessionAffinity: Optional[str] = None
+    sessionAffinityConfig: V1SessionAffinityConfig = Field(default_factory=lambda: V1SessionAffinityConfig())
+    type: Optional[str] = None
+
+
+class V1Service(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1ServiceSpec = Field(default_factory=lambda: V1ServiceSpec())
+    status: V1ServiceStatus = Field(default_factory=lambda: V1ServiceStatus())
+
+
+class V1SecretList(ResourceItem):
+    items: List[V1Secret] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ScaleStatus(ResourceValue):
+    replicas: Optional[int] = None
+    selector: Optional[str] = None
+
+
+class V1ScaleSpec(ResourceValue):
+    replicas: Optional[int] = None
+
+
+class V1Scale(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1ScaleSpec = Field(default_factory=lambda: V1ScaleSpec())
+    status: V1ScaleStatus = Field(default_factory=lambda: V1ScaleStatus())
+
+
+class V1ResourceQuotaList(ResourceItem):
+    items: List[V1ResourceQuota] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ResourceQuotaStatus(ResourceValue):
+    hard: Dict[str, str] = Field(default_factory=dict)
+    used: Dict[str, str] = Field(default_factory=dict)
+
+
+class V1ScopedResourceSelectorRequirement(ResourceValue):
+    operator: Optional[str] = None
+    scopeName: Optional[str] = None
+    values: List[str] = Field(default_factory=list)
+
+
+class V1ScopeSelector(ResourceValue):
+    matchExpressions: List[V1ScopedResourceSelectorRequirement] = Field(default_factory=list)
+
+
+class V1ResourceQuotaSpec(ResourceValue):
+    hard: Dict[str, str] = Field(default_factory=dict)
+    scopeSelector: V1ScopeSelector = Field(default_factory=lambda: V1ScopeSelector())
+    scopes: List[str] = Field(default_factory=list)
+
+
+class V1ResourceQuota(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1ResourceQuotaSpec = Field(default_factory=lambda: V1ResourceQuotaSpec())
+    status: V1ResourceQuotaStatus = Field(default_factory=lambda: V1ResourceQuotaStatus())
+
+
+class V1ReplicationControllerList(ResourceItem):
+    items: List[V1ReplicationController] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ReplicationControllerCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1ReplicationControllerStatus(ResourceValue):
+    availableReplicas: Optional[int] = None
+    conditions: List[V1ReplicationControllerCondition] = Field(default_factory=list)
+    fullyLabeledReplicas: Optional[int] = None
+    observedGeneration: Optional[int] = None
+    readyReplicas: Optional[int] = None
+    replicas: Optional[int] = None
+
+
+class V1ReplicationControllerSpec(ResourceValue):
+    minReadySeconds: Optional[int] = None
+    replicas: Optional[int] = None
+    selector: Dict[str, str] = Field(default_factory=dict)
+    template: V1PodTemplateSpec = Field(default_factory=lambda: V1PodTemplateSpec())
+
+
+class V1ReplicationController(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1ReplicationControllerSpec = Field(default_factory=lambda: V1ReplicationControllerSpec())
+    status: V1ReplicationControllerStatus = Field(default_factory=lambda: V1ReplicationControllerStatus())
+
+
+class V1PodTemplateList(ResourceItem):
+    items: List[V1PodTemplate] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1PodTemplate(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    template: V1PodTemplateSpec = Field(default_factory=lambda: V1PodTemplateSpec())
+
+
+class V1PodList(ResourceItem):
+    items: List[V1Pod] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1PodIP(ResourceValue):
+    ip: Optional[str] = None
+
+
+class V1ContainerStateWaiting(ResourceValue):
+    message: Optional[str] = None
+    reason: Optional[str] = None
+
+
+class V1ContainerStateTerminated(ResourceValue):
+    containerID: Optional[str] = None
+    exitCode: Optional[int] = None
+    finishedAt: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    signal: Optional[int] = None
+    startedAt: Optional[datetime] = None
+
+
+class V1ContainerStateRunning(ResourceValue):
+    startedAt: Optional[datetime] = None
+
+
+class V1ContainerState(ResourceValue):
+    running: V1ContainerStateRunning = Field(default_factory=lambda: V1ContainerStateRunning())
+    terminated: V1ContainerStateTerminated = Field(default_factory=lambda: V1ContainerStateTerminated())
+    waiting: V1ContainerStateWaiting = Field(default_factory=lambda: V1ContainerStateWaiting())
+
+
+class V1ContainerStatus(ResourceValue):
+    containerID: Optional[str] = None
+    image: Optional[str] = None
+    imageID: Optional[str] = None
+    lastState: V1ContainerState = Field(default_factory=lambda: V1ContainerState())
+    name: Optional[str] = None
+    ready: Optional[bool] = None
+    restartCount: int = 0
+    started: Optional[bool] = None
+    state: V1ContainerState = Field(default_factory=lambda: V1ContainerState())
+
+
+class V1PodCondition(ResourceValue):
+    lastProbeTime: Optional[datetime] = None
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1PodStatus(ResourceValue):
+    conditions: List[V1PodCondition] = Field(default_factory=list)
+    containerStatuses: List[V1ContainerStatus] = Field(default_factory=list)
+    ephemeralContainerStatuses: List[V1ContainerStatus] = Field(default_factory=list)
+    hostIP: Optional[str] = None
+    initContainerStatuses: List[V1ContainerStatus] = Field(default_factory=list)
+    message: Optional[str] = None
+    nominatedNodeName: Optional[str] = None
+    phase: Optional[str] = None
+    podIP: Optional[str] = None
+    podIPs: List[V1PodIP] = Field(default_factory=list)
+    qosClass: Optional[str] = None
+    reason: Optional[str] = None
+    startTime: Optional[datetime] = None
+
+
+class V1PersistentVolumeList(ResourceItem):
+    items: List[V1PersistentVolume] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1PersistentVolumeClaimList(ResourceItem):
+    items: List[V1PersistentVolumeClaim] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1PersistentVolumeClaimCondition(ResourceValue):
+    lastProbeTime: Optional[datetime] = None
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1PersistentVolumeClaimStatus(ResourceValue):
+    accessModes: List[str] = Field(default_factory=list)
+    allocatedResources: Dict[str, str] = Field(default_factory=dict)
+    capacity: Dict[str, str] = Field(default_factory=dict)
+    conditions: List[V1PersistentVolumeClaimCondition] = Field(default_factory=list)
+    phase: Optional[str] = None
+    resizeStatus: Optional[str] = None
+
+
+class V1PersistentVolumeClaim(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1PersistentVolumeClaimSpec = Field(default_factory=lambda: V1PersistentVolumeClaimSpec())
+    status: V1PersistentVolumeClaimStatus = Field(default_factory=lambda: V1PersistentVolumeClaimStatus())
+
+
+class V1PersistentVolumeStatus(ResourceValue):
+    message: Optional[str] = None
+    phase: Optional[str] = None
+    reason: Optional[str] = None
+
+
+class V1StorageOSPersistentVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretRef: V1ObjectReference = Field(default_factory=lambda: V1ObjectReference())
+    volumeName: Optional[str] = None
+    volumeNamespace: Optional[str] = None
+
+
+class V1ScaleIOPersistentVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    gateway: Optional[str] = None
+    protectionDomain: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    sslEnabled: Optional[bool] = None
+    storageMode: Optional[str] = None
+    storagePool: Optional[str] = None
+    system: Optional[str] = None
+    volumeName: Optional[str] = None
+
+
+class V1RBDPersistentVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    image: Optional[str] = None
+    keyring: Optional[str] = None
+    monitors: List[str] = Field(default_factory=list)
+    pool: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    user: Optional[str] = None
+
+
+class V1VolumeNodeAffinity(ResourceValue):
+    required: V1NodeSelector = Field(default_factory=lambda: V1NodeSelector())
+
+
+class V1LocalVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    path: Optional[str] = None
+
+
+class V1ISCSIPersistentVolumeSource(ResourceValue):
+    chapAuthDiscovery: Optional[bool] = None
+    chapAuthSession: Optional[bool] = None
+    fsType: Optional[str] = None
+    initiatorName: Optional[str] = None
+    iqn: Optional[str] = None
+    iscsiInterface: Optional[str] = None
+    lun: Optional[int] = None
+    portals: List[str] = Field(default_factory=list)
+    readOnly: Optional[bool] = None
+    secretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    targetPortal: Optional[str] = None
+
+
+class V1GlusterfsPersistentVolumeSource(ResourceValue):
+    endpoints: Optional[str] = None
+    endpointsNamespace: Optional[str] = None
+    path: Optional[str] = None
+    readOnly: Optional[bool] = None
+
+
+class V1FlexPersistentVolumeSource(ResourceValue):
+    driver: Optional[str] = None
+    fsType: Optional[str] = None
+    options: Dict[str, str] = Field(default_factory=dict)
+    readOnly: Optional[bool] = None
+    secretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+
+
+class V1CSIPersistentVolumeSource(ResourceValue):
+    controllerExpandSecretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    controllerPublishSecretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    driver: Optional[str] = None
+    fsType: Optional[str] = None
+    nodeExpandSecretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    nodePublishSecretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    nodeStageSecretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    readOnly: Optional[bool] = None
+    volumeAttributes: Dict[str, str] = Field(default_factory=dict)
+    volumeHandle: Optional[str] = None
+
+
+class V1CinderPersistentVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    volumeID: Optional[str] = None
+
+
+class V1SecretReference(ResourceValue):
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+
+
+class V1CephFSPersistentVolumeSource(ResourceValue):
+    monitors: List[str] = Field(default_factory=list)
+    path: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretFile: Optional[str] = None
+    secretRef: V1SecretReference = Field(default_factory=lambda: V1SecretReference())
+    user: Optional[str] = None
+
+
+class V1AzureFilePersistentVolumeSource(ResourceValue):
+    readOnly: Optional[bool] = None
+    secretName: Optional[str] = None
+    secretNamespace: Optional[str] = None
+    shareName: Optional[str] = None
+
+
+class V1PersistentVolumeSpec(ResourceValue):
+    accessModes: List[str] = Field(default_factory=list)
+    awsElasticBlockStore: V1AWSElasticBlockStoreVolumeSource = Field(
+        default_factory=lambda: V1AWSElasticBlockStoreVolumeSource()
+    )
+    azureDisk: V1AzureDiskVolumeSource = Field(default_factory=lambda: V1AzureDiskVolumeSource())
+    azureFile: V1AzureFilePersistentVolumeSource = Field(default_factory=lambda: V1AzureFilePersistentVolumeSource())
+    capacity: Dict[str, str] = Field(default_factory=dict)
+    cephfs: V1CephFSPersistentVolumeSource = Field(default_factory=lambda: V1CephFSPersistentVolumeSource())
+    cinder: V1CinderPersistentVolumeSource = Field(default_factory=lambda: V1CinderPersistentVolumeSource())
+    claimRef: V1ObjectReference = Field(default_factory=lambda: V1ObjectReference())
+    csi: V1CSIPersistentVolumeSource = Field(default_factory=lambda: V1CSIPersistentVolumeSource())
+    fc: V1FCVolumeSource = Field(default_factory=lambda: V1FCVolumeSource())
+    flexVolume: V1FlexPersistentVolumeSource = Field(default_factory=lambda: V1FlexPersistentVolumeSource())
+    flocker: V1FlockerVolumeSource = Field(default_factory=lambda: V1FlockerVolumeSource())
+    gcePersistentDisk: V1GCEPersistentDiskVolumeSource = Field(
+        default_factory=lambda: V1GCEPersistentDiskVolumeSource()
+    )
+    glusterfs: V1GlusterfsPersistentVolumeSource = Field(default_factory=lambda: V1GlusterfsPersistentVolumeSource())
+    hostPath: V1HostPathVolumeSource = Field(default_factory=lambda: V1HostPathVolumeSource())
+    iscsi: V1ISCSIPersistentVolumeSource = Field(default_factory=lambda: V1ISCSIPersistentVolumeSource())
+    local: V1LocalVolumeSource = Field(default_factory=lambda: V1LocalVolumeSource())
+    mountOptions: List[str] = Field(default_factory=list)
+    nfs: V1NFSVolumeSource = Field(default_factory=lambda: V1NFSVolumeSource())
+    nodeAffinity: V1VolumeNodeAffinity = Field(default_factory=lambda: V1VolumeNodeAffinity())
+    persistentVolumeReclaimPolicy: Optional[str] = None
+    photonPersistentDisk: V1PhotonPersistentDiskVolumeSource = Field(
+        default_factory=lambda: V1PhotonPersistentDiskVolumeSource()
+    )
+    portworxVolume: V1PortworxVolumeSource = Field(default_factory=lambda: V1PortworxVolumeSource())
+    quobyte: V1QuobyteVolumeSource = Field(default_factory=lambda: V1QuobyteVolumeSource())
+    rbd: V1RBDPersistentVolumeSource = Field(default_factory=lambda: V1RBDPersistentVolumeSource())
+    scaleIO: V1ScaleIOPersistentVolumeSource = Field(default_factory=lambda: V1ScaleIOPersistentVolumeSource())
+    storageClassName: Optional[str] = None
+    storageos: V1StorageOSPersistentVolumeSource = Field(default_factory=lambda: V1StorageOSPersistentVolumeSource())
+    volumeMode: Optional[str] = None
+    vsphereVolume: V1VsphereVirtualDiskVolumeSource = Field(default_factory=lambda: V1VsphereVirtualDiskVolumeSource())
+
+
+class V1PersistentVolume(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1PersistentVolumeSpec = Field(default_factory=lambda: V1PersistentVolumeSpec())
+    status: V1PersistentVolumeStatus = Field(default_factory=lambda: V1PersistentVolumeStatus())
+
+
+class V1NodeList(ResourceItem):
+    items: List[V1Node] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1AttachedVolume(ResourceValue):
+    devicePath: Optional[str] = None
+    name: Optional[str] = None
+
+
+class V1NodeSystemInfo(ResourceValue):
+    architecture: Optional[str] = None
+    bootID: Optional[str] = None
+    containerRuntimeVersion: Optional[str] = None
+    kernelVersion: Optional[str] = None
+    kubeProxyVersion: Optional[str] = None
+    kubeletVersion: Optional[str] = None
+    machineID: Optional[str] = None
+    operatingSystem: Optional[str] = None
+    osImage: Optional[str] = None
+    systemUUID: Optional[str] = None
+
+
+class V1ContainerImage(ResourceValue):
+    names: List[str] = Field(default_factory=list)
+    sizeBytes: Optional[int] = None
+
+
+class V1DaemonEndpoint(ResourceValue):
+    Port: Optional[int] = None
+
+
+class V1NodeDaemonEndpoints(ResourceValue):
+    kubeletEndpoint: V1DaemonEndpoint = Field(default_factory=lambda: V1DaemonEndpoint())
+
+
+class V1NodeConfigStatus(ResourceValue):
+    active: V1NodeConfigSource = Field(default_factory=lambda: V1NodeConfigSource())
+    assigned: V1NodeConfigSource = Field(default_factory=lambda: V1NodeConfigSource())
+    error: Optional[str] = None
+    lastKnownGood: V1NodeConfigSource = Field(default_factory=lambda: V1NodeConfigSource())
+
+
+class V1NodeCondition(ResourceValue):
+    lastHeartbeatTime: Optional[datetime] = None
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1NodeAddress(ResourceValue):
+    address: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1NodeStatus(ResourceValue):
+    addresses: List[V1NodeAddress] = Field(default_factory=list)
+    allocatable: Dict[str, str] = Field(default_factory=dict)
+    capacity: Dict[str, str] = Field(default_factory=dict)
+    conditions: List[V1NodeCondition] = Field(default_factory=list)
+    config: V1NodeConfigStatus = Field(default_factory=lambda: V1NodeConfigStatus())
+    daemonEndpoints: V1NodeDaemonEndpoints = Field(default_factory=lambda: V1NodeDaemonEndpoints())
+    images: List[V1ContainerImage] = Field(default_factory=list)
+    nodeInfo: V1NodeSystemInfo = Field(default_factory=lambda: V1NodeSystemInfo())
+    phase: Optional[str] = None
+    volumesAttached: List[V1AttachedVolume] = Field(default_factory=list)
+    volumesInUse: List[str] = Field(default_factory=list)
+
+
+class V1Taint(ResourceValue):
+    effect: Optional[str] = None
+    key: Optional[str] = None
+    timeAdded: Optional[datetime] = None
+    value: Optional[str] = None
+
+
+class V1ConfigMapNodeConfigSource(ResourceValue):
+    kubeletConfigKey: Optional[str] = None
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+    resourceVersion: Optional[str] = None
+    uid: Optional[str] = None
+
+
+class V1NodeConfigSource(ResourceValue):
+    configMap: V1ConfigMapNodeConfigSource = Field(default_factory=lambda: V1ConfigMapNodeConfigSource())
+
+
+class V1NodeSpec(ResourceValue):
+    configSource: V1NodeConfigSource = Field(default_factory=lambda: V1NodeConfigSource())
+    externalID: Optional[str] = None
+    podCIDR: Optional[str] = None
+    podCIDRs: List[str] = Field(default_factory=list)
+    providerID: Optional[str] = None
+    taints: List[V1Taint] = Field(default_factory=list)
+    unschedulable: Optional[bool] = None
+
+
+class V1Node(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1NodeSpec = Field(default_factory=lambda: V1NodeSpec())
+    status: V1NodeStatus = Field(default_factory=lambda: V1NodeStatus())
+
+
+class V1Condition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    observedGeneration: Optional[int] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1NamespaceList(ResourceItem):
+    items: List[V1Namespace] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1NamespaceCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1NamespaceStatus(ResourceValue):
+    conditions: List[V1NamespaceCondition] = Field(default_factory=list)
+    phase: Optional[str] = None
+
+
+class V1NamespaceSpec(ResourceValue):
+    finalizers: List[str] = Field(default_factory=list)
+
+
+class V1LimitRangeList(ResourceItem):
+    items: List[V1LimitRange] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1LimitRangeItem(ResourceValue):
+    default: Dict[str, str] = Field(default_factory=dict)
+    defaultRequest: Dict[str, str] = Field(default_factory=dict)
+    max: Dict[str, str] = Field(default_factory=dict)
+    maxLimitRequestRatio: Dict[str, str] = Field(default_factory=dict)
+    min: Dict[str, str] = Field(default_factory=dict)
+    type: Optional[str] = None
+
+
+class V1LimitRangeSpec(ResourceValue):
+    limits: List[V1LimitRangeItem] = Field(default_factory=list)
+
+
+class V1LimitRange(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1LimitRangeSpec = Field(default_factory=lambda: V1LimitRangeSpec())
+
+
+class V1Eviction(ResourceItem):
+    deleteOptions: V1DeleteOptions = Field(default_factory=lambda: V1DeleteOptions())
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+
+
+class V1EndpointsList(ResourceItem):
+    items: List[V1Endpoints] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class CoreV1EndpointPort(ResourceValue):
+    appProtocol: Optional[str] = None
+    name: Optional[str] = None
+    port: Optional[int] = None
+    protocol: Optional[str] = None
+
+
+class V1EndpointAddress(ResourceValue):
+    hostname: Optional[str] = None
+    ip: Optional[str] = None
+    nodeName: Optional[str] = None
+    targetRef: V1ObjectReference = Field(default_factory=lambda: V1ObjectReference())
+
+
+class V1EndpointSubset(ResourceValue):
+    addresses: List[V1EndpointAddress] = Field(default_factory=list)
+    notReadyAddresses: List[V1EndpointAddress] = Field(default_factory=list)
+    ports: List[CoreV1EndpointPort] = Field(default_factory=list)
+
+
+class V1Endpoints(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    subsets: List[V1EndpointSubset] = Field(default_factory=list)
+
+
+class V1Preconditions(ResourceValue):
+    resourceVersion: Optional[str] = None
+    uid: Optional[str] = None
+
+
+class V1DeleteOptions(ResourceItem):
+    dryRun: List[str] = Field(default_factory=list)
+    gracePeriodSeconds: Optional[int] = None
+    orphanDependents: Optional[bool] = None
+    preconditions: V1Preconditions = Field(default_factory=lambda: V1Preconditions())
+    propagationPolicy: Optional[str] = None
+
+
+class V1VsphereVirtualDiskVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    storagePolicyID: Optional[str] = None
+    storagePolicyName: Optional[str] = None
+    volumePath: Optional[str] = None
+
+
+class V1StorageOSVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretRef: V1LocalObjectReference = Field(default_factory=lambda: V1LocalObjectReference())
+    volumeName: Optional[str] = None
+    volumeNamespace: Optional[str] = None
+
+
+class V1SecretVolumeSource(ResourceValue):
+    defaultMode: Optional[int] = None
+    items: List[V1KeyToPath] = Field(default_factory=list)
+    optional: Optional[bool] = None
+    secretName: Optional[str] = None
+
+
+class V1ScaleIOVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    gateway: Optional[str] = None
+    protectionDomain: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretRef: V1LocalObjectReference = Field(default_factory=lambda: V1LocalObjectReference())
+    sslEnabled: Optional[bool] = None
+    storageMode: Optional[str] = None
+    storagePool: Optional[str] = None
+    system: Optional[str] = None
+    volumeName: Optional[str] = None
+
+
+class V1RBDVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    image: Optional[str] = None
+    keyring: Optional[str] = None
+    monitors: List[str] = Field(default_factory=list)
+    pool: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretRef: V1LocalObjectReference = Field(default_factory=lambda: V1LocalObjectReference())
+    user: Optional[str] = None
+
+
+class V1QuobyteVolumeSource(ResourceValue):
+    group: Optional[str] = None
+    readOnly: Optional[bool] = None
+    registry: Optional[str] = None
+    tenant: Optional[str] = None
+    user: Optional[str] = None
+    volume: Optional[str] = None
+
+
+class V1ServiceAccountTokenProjection(ResourceValue):
+    audience: Optional[str] = None
+    expirationSeconds: Optional[int] = None
+    path: Optional[str] = None
+
+
+class V1SecretProjection(ResourceValue):
+    items: List[V1KeyToPath] = Field(default_factory=list)
+    name: Optional[str] = None
+    optional: Optional[bool] = None
+
+
+class V1DownwardAPIProjection(ResourceValue):
+    items: List[V1DownwardAPIVolumeFile] = Field(default_factory=list)
+
+
+class V1ConfigMapProjection(ResourceValue):
+    items: List[V1KeyToPath] = Field(default_factory=list)
+    name: Optional[str] = None
+    optional: Optional[bool] = None
+
+
+class V1VolumeProjection(ResourceValue):
+    configMap: V1ConfigMapProjection = Field(default_factory=lambda: V1ConfigMapProjection())
+    downwardAPI: V1DownwardAPIProjection = Field(default_factory=lambda: V1DownwardAPIProjection())
+    secret: V1SecretProjection = Field(default_factory=lambda: V1SecretProjection())
+    serviceAccountToken: V1ServiceAccountTokenProjection = Field(
+        default_factory=lambda: V1ServiceAccountTokenProjection()
+    )
+
+
+class V1ProjectedVolumeSource(ResourceValue):
+    defaultMode: Optional[int] = None
+    sources: List[V1VolumeProjection] = Field(default_factory=list)
+
+
+class V1PortworxVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    readOnly: Optional[bool] = None
+    volumeID: Optional[str] = None
+
+
+class V1PhotonPersistentDiskVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    pdID: Optional[str] = None
+
+
+class V1PersistentVolumeClaimVolumeSource(ResourceValue):
+    claimName: Optional[str] = None
+    readOnly: Optional[bool] = None
+
+
+class V1NFSVolumeSource(ResourceValue):
+    path: Optional[str] = None
+    readOnly: Optional[bool] = None
+    server: Optional[str] = None
+
+
+class V1ISCSIVolumeSource(ResourceValue):
+    chapAuthDiscovery: Optional[bool] = None
+    chapAuthSession: Optional[bool] = None
+    fsType: Optional[str] = None
+    initiatorName: Optional[str] = None
+    iqn: Optional[str] = None
+    iscsiInterface: Optional[str] = None
+    lun: Optional[int] = None
+    portals: List[str] = Field(default_factory=list)
+    readOnly: Optional[bool] = None
+    secretRef: V1LocalObjectReference = Field(default_factory=lambda: V1LocalObjectReference())
+    targetPortal: Optional[str] = None
+
+
+class V1HostPathVolumeSource(ResourceValue):
+    path: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1GlusterfsVolumeSource(ResourceValue):
+    endpoints: Optional[str] = None
+    path: Optional[str] = None
+    readOnly: Optional[bool] = None
+
+
+class V1GitRepoVolumeSource(ResourceValue):
+    directory: Optional[str] = None
+    repository: Optional[str] = None
+    revision: Optional[str] = None
+
+
+class V1GCEPersistentDiskVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    partition: Optional[int] = None
+    pdName: Optional[str] = None
+    readOnly: Optional[bool] = None
+
+
+class V1FlockerVolumeSource(ResourceValue):
+    datasetName: Optional[str] = None
+    datasetUUID: Optional[str] = None
+
+
+class V1FlexVolumeSource(ResourceValue):
+    driver: Optional[str] = None
+    fsType: Optional[str] = None
+    options: Dict[str, str] = Field(default_factory=dict)
+    readOnly: Optional[bool] = None
+    secretRef: V1LocalObjectReference = Field(default_factory=lambda: V1LocalObjectReference())
+
+
+class V1FCVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    lun: Optional[int] = None
+    readOnly: Optional[bool] = None
+    targetWWNs: List[str] = Field(default_factory=list)
+    wwids: List[str] = Field(default_factory=list)
+
+
+class V1TypedObjectReference(ResourceValue):
+    apiGroup: Optional[str] = None
+    kind: Optional[str] = None
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+
+
+class V1TypedLocalObjectReference(ResourceValue):
+    apiGroup: Optional[str] = None
+    kind: Optional[str] = None
+    name: Optional[str] = None
+
+
+class V1PersistentVolumeClaimSpec(ResourceValue):
+    accessModes: List[str] = Field(default_factory=list)
+    dataSource: V1TypedLocalObjectReference = Field(default_factory=lambda: V1TypedLocalObjectReference())
+    dataSourceRef: V1TypedObjectReference = Field(default_factory=lambda: V1TypedObjectReference())
+    resources: V1ResourceRequirements = Field(default_factory=lambda: V1ResourceRequirements())
+    selector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    storageClassName: Optional[str] = None
+    volumeMode: Optional[str] = None
+    volumeName: Optional[str] = None
+
+
+class V1PersistentVolumeClaimTemplate(ResourceValue):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1PersistentVolumeClaimSpec = Field(default_factory=lambda: V1PersistentVolumeClaimSpec())
+
+
+class V1EphemeralVolumeSource(ResourceValue):
+    volumeClaimTemplate: V1PersistentVolumeClaimTemplate = Field(
+        default_factory=lambda: V1PersistentVolumeClaimTemplate()
+    )
+
+
+class V1EmptyDirVolumeSource(ResourceValue):
+    medium: Optional[str] = None
+    sizeLimit: Optional[str] = None
+
+
+class V1DownwardAPIVolumeFile(ResourceValue):
+    fieldRef: V1ObjectFieldSelector = Field(default_factory=lambda: V1ObjectFieldSelector())
+    mode: Optional[int] = None
+    path: Optional[str] = None
+    resourceFieldRef: V1ResourceFieldSelector = Field(default_factory=lambda: V1ResourceFieldSelector())
+
+
+class V1DownwardAPIVolumeSource(ResourceValue):
+    defaultMode: Optional[int] = None
+    items: List[V1DownwardAPIVolumeFile] = Field(default_factory=list)
+
+
+class V1CSIVolumeSource(ResourceValue):
+    driver: Optional[str] = None
+    fsType: Optional[str] = None
+    nodePublishSecretRef: V1LocalObjectReference = Field(default_factory=lambda: V1LocalObjectReference())
+    readOnly: Optional[bool] = None
+    volumeAttributes: Dict[str, str] = Field(default_factory=dict)
+
+
+class V1KeyToPath(ResourceValue):
+    key: Optional[str] = None
+    mode: Optional[int] = None
+    path: Optional[str] = None
+
+
+class V1ConfigMapVolumeSource(ResourceValue):
+    defaultMode: Optional[int] = None
+    items: List[V1KeyToPath] = Field(default_factory=list)
+    name: Optional[str] = None
+    optional: Optional[bool] = None
+
+
+class V1CinderVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretRef: V1LocalObjectReference = Field(default_factory=lambda: V1LocalObjectReference())
+    volumeID: Optional[str] = None
+
+
+class V1CephFSVolumeSource(ResourceValue):
+    monitors: List[str] = Field(default_factory=list)
+    path: Optional[str] = None
+    readOnly: Optional[bool] = None
+    secretFile: Optional[str] = None
+    secretRef: V1LocalObjectReference = Field(default_factory=lambda: V1LocalObjectReference())
+    user: Optional[str] = None
+
+
+class V1AzureFileVolumeSource(ResourceValue):
+    readOnly: Optional[bool] = None
+    secretName: Optional[str] = None
+    shareName: Optional[str] = None
+
+
+class V1AzureDiskVolumeSource(ResourceValue):
+    cachingMode: Optional[str] = None
+    diskName: Optional[str] = None
+    diskURI: Optional[str] = None
+    fsType: Optional[str] = None
+    kind: Optional[str] = None
+    readOnly: Optional[bool] = None
+
+
+class V1AWSElasticBlockStoreVolumeSource(ResourceValue):
+    fsType: Optional[str] = None
+    partition: Optional[int] = None
+    readOnly: Optional[bool] = None
+    volumeID: Optional[str] = None
+
+
+class V1Volume(ResourceValue):
+    awsElasticBlockStore: V1AWSElasticBlockStoreVolumeSource = Field(
+        default_factory=lambda: V1AWSElasticBlockStoreVolumeSource()
+    )
+    azureDisk: V1AzureDiskVolumeSource = Field(default_factory=lambda: V1AzureDiskVolumeSource())
+    azureFile: V1AzureFileVolumeSource = Field(default_factory=lambda: V1AzureFileVolumeSource())
+    cephfs: V1CephFSVolumeSource = Field(default_factory=lambda: V1CephFSVolumeSource())
+    cinder: V1CinderVolumeSource = Field(default_factory=lambda: V1CinderVolumeSource())
+    configMap: V1ConfigMapVolumeSource = Field(default_factory=lambda: V1ConfigMapVolumeSource())
+    csi: V1CSIVolumeSource = Field(default_factory=lambda: V1CSIVolumeSource())
+    downwardAPI: V1DownwardAPIVolumeSource = Field(default_factory=lambda: V1DownwardAPIVolumeSource())
+    emptyDir: V1EmptyDirVolumeSource = Field(default_factory=lambda: V1EmptyDirVolumeSource())
+    ephemeral: V1EphemeralVolumeSource = Field(default_factory=lambda: V1EphemeralVolumeSource())
+    fc: V1FCVolumeSource = Field(default_factory=lambda: V1FCVolumeSource())
+    flexVolume: V1FlexVolumeSource = Field(default_factory=lambda: V1FlexVolumeSource())
+    flocker: V1FlockerVolumeSource = Field(default_factory=lambda: V1FlockerVolumeSource())
+    gcePersistentDisk: V1GCEPersistentDiskVolumeSource = Field(
+        default_factory=lambda: V1GCEPersistentDiskVolumeSource()
+    )
+    gitRepo: V1GitRepoVolumeSource = Field(default_factory=lambda: V1GitRepoVolumeSource())
+    glusterfs: V1GlusterfsVolumeSource = Field(default_factory=lambda: V1GlusterfsVolumeSource())
+    hostPath: V1HostPathVolumeSource = Field(default_factory=lambda: V1HostPathVolumeSource())
+    iscsi: V1ISCSIVolumeSource = Field(default_factory=lambda: V1ISCSIVolumeSource())
+    name: Optional[str] = None
+    nfs: V1NFSVolumeSource = Field(default_factory=lambda: V1NFSVolumeSource())
+    persistentVolumeClaim: V1PersistentVolumeClaimVolumeSource = Field(
+        default_factory=lambda: V1PersistentVolumeClaimVolumeSource()
+    )
+    photonPersistentDisk: V1PhotonPersistentDiskVolumeSource = Field(
+        default_factory=lambda: V1PhotonPersistentDiskVolumeSource()
+    )
+    portworxVolume: V1PortworxVolumeSource = Field(default_factory=lambda: V1PortworxVolumeSource())
+    projected: V1ProjectedVolumeSource = Field(default_factory=lambda: V1ProjectedVolumeSource())
+    quobyte: V1QuobyteVolumeSource = Field(default_factory=lambda: V1QuobyteVolumeSource())
+    rbd: V1RBDVolumeSource = Field(default_factory=lambda: V1RBDVolumeSource())
+    scaleIO: V1ScaleIOVolumeSource = Field(default_factory=lambda: V1ScaleIOVolumeSource())
+    secret: V1SecretVolumeSource = Field(default_factory=lambda: V1SecretVolumeSource())
+    storageos: V1StorageOSVolumeSource = Field(default_factory=lambda: V1StorageOSVolumeSource())
+    vsphereVolume: V1VsphereVirtualDiskVolumeSource = Field(default_factory=lambda: V1VsphereVirtualDiskVolumeSource())
+
+
+class V1TopologySpreadConstraint(ResourceValue):
+    labelSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    matchLabelKeys: List[str] = Field(default_factory=list)
+    maxSkew: Optional[int] = None
+    minDomains: Optional[int] = None
+    nodeAffinityPolicy: Optional[str] = None
+    nodeTaintsPolicy: Optional[str] = None
+    topologyKey: Optional[str] = None
+    whenUnsatisfiable: Optional[str] = None
+
+
+class V1Toleration(ResourceValue):
+    effect: Optional[str] = None
+    key: Optional[str] = None
+    operator: Optional[str] = None
+    tolerationSeconds: Optional[int] = None
+    value: Optional[str] = None
+
+
+class V1Sysctl(ResourceValue):
+    name: Optional[str] = None
+    value: Optional[str] = None
+
+
+class V1PodSecurityContext(ResourceValue):
+    fsGroup: Optional[int] = None
+    fsGroupChangePolicy: Optional[str] = None
+    runAsGroup: Optional[int] = None
+    runAsNonRoot: Optional[bool] = None
+    runAsUser: Optional[int] = None
+    seLinuxOptions: V1SELinuxOptions = Field(default_factory=lambda: V1SELinuxOptions())
+    seccompProfile: V1SeccompProfile = Field(default_factory=lambda: V1SeccompProfile())
+    supplementalGroups: List[int] = Field(default_factory=list)
+    sysctls: List[V1Sysctl] = Field(default_factory=list)
+    windowsOptions: V1WindowsSecurityContextOptions = Field(default_factory=lambda: V1WindowsSecurityContextOptions())
+
+
+class V1PodSchedulingGate(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1ClaimSource(ResourceValue):
+    resourceClaimName: Optional[str] = None
+    resourceClaimTemplateName: Optional[str] = None
+
+
+class V1PodResourceClaim(ResourceValue):
+    name: Optional[str] = None
+    source: V1ClaimSource = Field(default_factory=lambda: V1ClaimSource())
+
+
+class V1PodReadinessGate(ResourceValue):
+    conditionType: Optional[str] = None
+
+
+class V1PodOS(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1LocalObjectReference(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1HostAlias(ResourceValue):
+    hostnames: List[str] = Field(default_factory=list)
+    ip: Optional[str] = None
+
+
+class V1EphemeralContainer(ResourceValue):
+    args: List[str] = Field(default_factory=list)
+    command: List[str] = Field(default_factory=list)
+    env: List[V1EnvVar] = Field(default_factory=list)
+    envFrom: List[V1EnvFromSource] = Field(default_factory=list)
+    image: Optional[str] = None
+    imagePullPolicy: Optional[str] = None
+    lifecycle: V1Lifecycle = Field(default_factory=lambda: V1Lifecycle())
+    livenessProbe: V1Probe = Field(default_factory=lambda: V1Probe())
+    name: Optional[str] = None
+    ports: List[V1ContainerPort] = Field(default_factory=list)
+    readinessProbe: V1Probe = Field(default_factory=lambda: V1Probe())
+    resources: V1ResourceRequirements = Field(default_factory=lambda: V1ResourceRequirements())
+    securityContext: V1SecurityContext = Field(default_factory=lambda: V1SecurityContext())
+    startupProbe: V1Probe = Field(default_factory=lambda: V1Probe())
+    stdin: Optional[bool] = None
+    stdinOnce: Optional[bool] = None
+    targetContainerName: Optional[str] = None
+    terminationMessagePath: Optional[str] = None
+    terminationMessagePolicy: Optional[str] = None
+    tty: Optional[bool] = None
+    volumeDevices: List[V1VolumeDevice] = Field(default_factory=list)
+    volumeMounts: List[V1VolumeMount] = Field(default_factory=list)
+    workingDir: Optional[str] = None
+
+
+class V1PodDNSConfigOption(ResourceValue):
+    name: Optional[str] = None
+    value: Optional[str] = None
+
+
+class V1PodDNSConfig(ResourceValue):
+    nameservers: List[str] = Field(default_factory=list)
+    options: List[V1PodDNSConfigOption] = Field(default_factory=list)
+    searches: List[str] = Field(default_factory=list)
+
+
+class V1VolumeMount(ResourceValue):
+    mountPath: Optional[str] = None
+    mountPropagation: Optional[str] = None
+    name: Optional[str] = None
+    readOnly: Optional[bool] = None
+    subPath: Optional[str] = None
+    subPathExpr: Optional[str] = None
+
+
+class V1VolumeDevice(ResourceValue):
+    devicePath: Optional[str] = None
+    name: Optional[str] = None
+
+
+class V1WindowsSecurityContextOptions(ResourceValue):
+    gmsaCredentialSpec: Optional[str] = None
+    gmsaCredentialSpecName: Optional[str] = None
+    hostProcess: Optional[bool] = None
+    runAsUserName: Optional[str] = None
+
+
+class V1SeccompProfile(ResourceValue):
+    localhostProfile: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1SELinuxOptions(ResourceValue):
+    level: Optional[str] = None
+    role: Optional[str] = None
+    type: Optional[str] = None
+    user: Optional[str] = None
+
+
+class V1Capabilities(ResourceValue):
+    add: List[str] = Field(default_factory=list)
+    drop: List[str] = Field(default_factory=list)
+
+
+class V1SecurityContext(ResourceValue):
+    allowPrivilegeEscalation: Optional[bool] = None
+    capabilities: V1Capabilities = Field(default_factory=lambda: V1Capabilities())
+    privileged: Optional[bool] = None
+    procMount: Optional[str] = None
+    readOnlyRootFilesystem: Optional[bool] = None
+    runAsGroup: Optional[int] = None
+    runAsNonRoot: Optional[bool] = None
+    runAsUser: Optional[int] = None
+    seLinuxOptions: V1SELinuxOptions = Field(default_factory=lambda: V1SELinuxOptions())
+    seccompProfile: V1SeccompProfile = Field(default_factory=lambda: V1SeccompProfile())
+    windowsOptions: V1WindowsSecurityContextOptions = Field(default_factory=lambda: V1WindowsSecurityContextOptions())
+
+
+class V1ResourceClaim(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1ResourceRequirements(ResourceValue):
+    claims: List[V1ResourceClaim] = Field(default_factory=list)
+    limits: Dict[str, str] = Field(default_factory=dict)
+    requests: Dict[str, str] = Field(default_factory=dict)
+
+
+class V1ContainerPort(ResourceValue):
+    containerPort: Optional[int] = None
+    hostIP: Optional[str] = None
+    hostPort: Optional[int] = None
+    name: Optional[str] = None
+    protocol: Optional[str] = None
+
+
+class V1GRPCAction(ResourceValue):
+    port: Optional[int] = None
+    service: Optional[str] = None
+
+
+class V1Probe(ResourceValue):
+    exec: V1ExecAction = Field(default_factory=lambda: V1ExecAction())
+    failureThreshold: Optional[int] = None
+    grpc: V1GRPCAction = Field(default_factory=lambda: V1GRPCAction())
+    httpGet: V1HTTPGetAction = Field(default_factory=lambda: V1HTTPGetAction())
+    initialDelaySeconds: Optional[int] = None
+    periodSeconds: Optional[int] = None
+    successThreshold: Optional[int] = None
+    tcpSocket: V1TCPSocketAction = Field(default_factory=lambda: V1TCPSocketAction())
+    terminationGracePeriodSeconds: Optional[int] = None
+    timeoutSeconds: Optional[int] = None
+
+
+class V1TCPSocketAction(ResourceValue):
+    host: Optional[str] = None
+    port: Optional[object] = None
+
+
+class V1HTTPHeader(ResourceValue):
+    name: Optional[str] = None
+    value: Optional[str] = None
+
+
+class V1HTTPGetAction(ResourceValue):
+    host: Optional[str] = None
+    httpHeaders: List[V1HTTPHeader] = Field(default_factory=list)
+    path: Optional[str] = None
+    port: Optional[object] = None
+    scheme: Optional[str] = None
+
+
+class V1ExecAction(ResourceValue):
+    command: List[str] = Field(default_factory=list)
+
+
+class V1LifecycleHandler(ResourceValue):
+    exec: V1ExecAction = Field(default_factory=lambda: V1ExecAction())
+    httpGet: V1HTTPGetAction = Field(default_factory=lambda: V1HTTPGetAction())
+    tcpSocket: V1TCPSocketAction = Field(default_factory=lambda: V1TCPSocketAction())
+
+
+class V1Lifecycle(ResourceValue):
+    postStart: V1LifecycleHandler = Field(default_factory=lambda: V1LifecycleHandler())
+    preStop: V1LifecycleHandler = Field(default_factory=lambda: V1LifecycleHandler())
+
+
+class V1SecretEnvSource(ResourceValue):
+    name: Optional[str] = None
+    optional: Optional[bool] = None
+
+
+class V1ConfigMapEnvSource(ResourceValue):
+    name: Optional[str] = None
+    optional: Optional[bool] = None
+
+
+class V1EnvFromSource(ResourceValue):
+    configMapRef: V1ConfigMapEnvSource = Field(default_factory=lambda: V1ConfigMapEnvSource())
+    prefix: Optional[str] = None
+    secretRef: V1SecretEnvSource = Field(default_factory=lambda: V1SecretEnvSource())
+
+
+class V1SecretKeySelector(ResourceValue):
+    key: Optional[str] = None
+    name: Optional[str] = None
+    optional: Optional[bool] = None
+
+
+class V1ResourceFieldSelector(ResourceValue):
+    containerName: Optional[str] = None
+    divisor: Optional[str] = None
+    resource: Optional[str] = None
+
+
+class V1ObjectFieldSelector(ResourceValue):
+    apiVersion: Optional[str] = None
+    fieldPath: Optional[str] = None
+
+
+class V1ConfigMapKeySelector(ResourceValue):
+    key: Optional[str] = None
+    name: Optional[str] = None
+    optional: Optional[bool] = None
+
+
+class V1EnvVarSource(ResourceValue):
+    configMapKeyRef: V1ConfigMapKeySelector = Field(default_factory=lambda: V1ConfigMapKeySelector())
+    fieldRef: V1ObjectFieldSelector = Field(default_factory=lambda: V1ObjectFieldSelector())
+    resourceFieldRef: V1ResourceFieldSelector = Field(default_factory=lambda: V1ResourceFieldSelector())
+    secretKeyRef: V1SecretKeySelector = Field(default_factory=lambda: V1SecretKeySelector())
+
+
+class V1EnvVar(ResourceValue):
+    name: Optional[str] = None
+    value: Optional[str] = None
+    valueFrom: V1EnvVarSource = Field(default_factory=lambda: V1EnvVarSource())
+
+
+class V1Container(ResourceValue):
+    args: List[str] = Field(default_factory=list)
+    command: List[str] = Field(default_factory=list)
+    env: List[V1EnvVar] = Field(default_factory=list)
+    envFrom: List[V1EnvFromSource] = Field(default_factory=list)
+    image: Optional[str] = None
+    imagePullPolicy: Optional[str] = None
+    lifecycle: V1Lifecycle = Field(default_factory=lambda: V1Lifecycle())
+    livenessProbe: V1Probe = Field(default_factory=lambda: V1Probe())
+    name: Optional[str] = None
+    ports: List[V1ContainerPort] = Field(default_factory=list)
+    readinessProbe: V1Probe = Field(default_factory=lambda: V1Probe())
+    resources: V1ResourceRequirements = Field(default_factory=lambda: V1ResourceRequirements())
+    securityContext: V1SecurityContext = Field(default_factory=lambda: V1SecurityContext())
+    startupProbe: V1Probe = Field(default_factory=lambda: V1Probe())
+    stdin: Optional[bool] = None
+    stdinOnce: Optional[bool] = None
+    terminationMessagePath: Optional[str] = None
+    terminationMessagePolicy: Optional[str] = None
+    tty: Optional[bool] = None
+    volumeDevices: List[V1VolumeDevice] = Field(default_factory=list)
+    volumeMounts: List[V1VolumeMount] = Field(default_factory=list)
+    workingDir: Optional[str] = None
+
+
+class V1PodAntiAffinity(ResourceValue):
+    preferredDuringSchedulingIgnoredDuringExecution: List[V1WeightedPodAffinityTerm] = Field(default_factory=list)
+    requiredDuringSchedulingIgnoredDuringExecution: List[V1PodAffinityTerm] = Field(default_factory=list)
+
+
+class V1PodAffinityTerm(ResourceValue):
+    labelSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    namespaceSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    namespaces: List[str] = Field(default_factory=list)
+    topologyKey: Optional[str] = None
+
+
+class V1WeightedPodAffinityTerm(ResourceValue):
+    podAffinityTerm: V1PodAffinityTerm = Field(default_factory=lambda: V1PodAffinityTerm())
+    weight: Optional[int] = None
+
+
+class V1PodAffinity(ResourceValue):
+    preferredDuringSchedulingIgnoredDuringExecution: List[V1WeightedPodAffinityTerm] = Field(default_factory=list)
+    requiredDuringSchedulingIgnoredDuringExecution: List[V1PodAffinityTerm] = Field(default_factory=list)
+
+
+class V1NodeSelector(ResourceValue):
+    nodeSelectorTerms: List[V1NodeSelectorTerm] = Field(default_factory=list)
+
+
+class V1NodeSelectorRequirement(ResourceValue):
+    key: Optional[str] = None
+    operator: Optional[str] = None
+    values: List[str] = Field(default_factory=list)
+
+
+class V1NodeSelectorTerm(ResourceValue):
+    matchExpressions: List[V1NodeSelectorRequirement] = Field(default_factory=list)
+    matchFields: List[V1NodeSelectorRequirement] = Field(default_factory=list)
+
+
+class V1PreferredSchedulingTerm(ResourceValue):
+    preference: V1NodeSelectorTerm = Field(default_factory=lambda: V1NodeSelectorTerm())
+    weight: Optional[int] = None
+
+
+class V1NodeAffinity(ResourceValue):
+    preferredDuringSchedulingIgnoredDuringExecution: List[V1PreferredSchedulingTerm] = Field(default_factory=list)
+    requiredDuringSchedulingIgnoredDuringExecution: V1NodeSelector = Field(default_factory=lambda: V1NodeSelector())
+
+
+class V1Affinity(ResourceValue):
+    nodeAffinity: V1NodeAffinity = Field(default_factory=lambda: V1NodeAffinity())
+    podAffinity: V1PodAffinity = Field(default_factory=lambda: V1PodAffinity())
+    podAntiAffinity: V1PodAntiAffinity = Field(default_factory=lambda: V1PodAntiAffinity())
+
+
+class V1PodSpec(ResourceValue):
+    activeDeadlineSeconds: Optional[int] = None
+    affinity: V1Affinity = Field(default_factory=lambda: V1Affinity())
+    automountServiceAccountToken: Optional[bool] = None
+    containers: List[V1Container] = Field(default_factory=list)
+    dnsConfig: V1PodDNSConfig = Field(default_factory=lambda: V1PodDNSConfig())
+    dnsPolicy: Optional[str] = None
+    enableServiceLinks: Optional[bool] = None
+    ephemeralContainers: List[V1EphemeralContainer] = Field(default_factory=list)
+    hostAliases: List[V1HostAlias] = Field(default_factory=list)
+    hostIPC: Optional[bool] = None
+    hostNetwork: Optional[bool] = None
+    hostPID: Optional[bool] = None
+    hostUsers: Optional[bool] = None
+    hostname: Optional[str] = None
+    imagePullSecrets: List[V1LocalObjectReference] = Field(default_factory=list)
+    initContainers: List[V1Container] = Field(default_factory=list)
+    nodeName: Optional[str] = None
+    nodeSelector: Dict[str, str] = Field(default_factory=dict)
+    os: V1PodOS = Field(default_factory=lambda: V1PodOS())
+    overhead: Dict[str, str] = Field(default_factory=dict)
+    preemptionPolicy: Optional[str] = None
+    priority: Optional[int] = None
+    priorityClassName: Optional[str] = None
+    readinessGates: List[V1PodReadinessGate] = Field(default_factory=list)
+    resourceClaims: List[V1PodResourceClaim] = Field(default_factory=list)
+    restartPolicy: Optional[str] = None
+    runtimeClassName: Optional[str] = None
+    schedulerName: Optional[str] = None
+    schedulingGates: List[V1PodSchedulingGate] = Field(default_factory=list)
+    securityContext: V1PodSecurityContext = Field(default_factory=lambda: V1PodSecurityContext())
+    serviceAccount: Optional[str] = None
+    serviceAccountName: Optional[str] = None
+    setHostnameAsFQDN: Optional[bool] = None
+    shareProcessNamespace: Optional[bool] = None
+    subdomain: Optional[str] = None
+    terminationGracePeriodSeconds: Optional[int] = None
+    tolerations: List[V1Toleration] = Field(default_factory=list)
+    topologySpreadConstraints: List[V1TopologySpreadConstraint] = Field(default_factory=list)
+    volumes: List[V1Volume] = Field(default_factory=list)
+
+
+class V1PodTemplateSpec(ResourceValue):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1PodSpec = Field(default_factory=lambda: V1PodSpec())
+
+
+class V1ConfigMapList(ResourceItem):
+    items: List[V1ConfigMap] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ComponentStatusList(ResourceItem):
+    items: List[V1ComponentStatus] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ComponentCondition(ResourceValue):
+    error: Optional[str] = None
+    message: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1ComponentStatus(ResourceItem):
+    conditions: List[V1ComponentCondition] = Field(default_factory=list)
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+
+
+class V1LabelSelectorRequirement(ResourceValue):
+    key: Optional[str] = None
+    operator: Optional[str] = None
+    values: List[str] = Field(default_factory=list)
+
+
+class V1LabelSelector(ResourceValue):
+    matchExpressions: List[V1LabelSelectorRequirement] = Field(default_factory=list)
+    matchLabels: Dict[str, str] = Field(default_factory=dict)
+
+
+class V1Binding(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    target: V1ObjectReference = Field(default_factory=lambda: V1ObjectReference())
+
+
+class V1APIResource(ResourceValue):
+    categories: List[str] = Field(default_factory=list)
+    group: Optional[str] = None
+    kind: Optional[str] = None
+    name: Optional[str] = None
+    namespaced: Optional[bool] = None
+    shortNames: List[str] = Field(default_factory=list)
+    singularName: Optional[str] = None
+    storageVersionHash: Optional[str] = None
+    verbs: List[str] = Field(default_factory=list)
+    version: Optional[str] = None
+
+
+class V1APIResourceList(ResourceItem):
+    groupVersion: Optional[str] = None
+    resources: List[V1APIResource] = Field(default_factory=list)
+
+
+class CoreV1EventList(ResourceItem):
+    items: List[CoreV1Event] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1EventSource(ResourceValue):
+    component: Optional[str] = None
+    host: Optional[str] = None
+
+
+class CoreV1EventSeries(ResourceValue):
+    count: Optional[int] = None
+    lastObservedTime: Optional[datetime] = None
+
+
+class V1ObjectReference(ResourceItem):
+    fieldPath: Optional[str] = None
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+    resourceVersion: Optional[str] = None
+    uid: Optional[str] = None
+
+
+class CoreV1Event(ResourceItem):
+    action: Optional[str] = None
+    count: Optional[int] = None
+    eventTime: Optional[datetime] = None
+    firstTimestamp: Optional[datetime] = None
+    involvedObject: V1ObjectReference = Field(default_factory=lambda: V1ObjectReference())
+    lastTimestamp: Optional[datetime] = None
+    message: Optional[str] = None
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    reason: Optional[str] = None
+    related: V1ObjectReference = Field(default_factory=lambda: V1ObjectReference())
+    reportingComponent: Optional[str] = None
+    reportingInstance: Optional[str] = None
+    series: CoreV1EventSeries = Field(default_factory=lambda: CoreV1EventSeries())
+    source: V1EventSource = Field(default_factory=lambda: V1EventSource())
+    type: Optional[str] = None
+
+
+class V1TokenRequestStatus(ResourceValue):
+    expirationTimestamp: Optional[datetime] = None
+    token: Optional[str] = None
+
+
+class V1BoundObjectReference(ResourceItem):
+    name: Optional[str] = None
+    uid: Optional[str] = None
+
+
+class V1TokenRequestSpec(ResourceValue):
+    audiences: List[str] = Field(default_factory=list)
+    boundObjectRef: V1BoundObjectReference = Field(default_factory=lambda: V1BoundObjectReference())
+    expirationSeconds: Optional[int] = None
+
+
+class AuthenticationV1TokenRequest(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1TokenRequestSpec = Field(default_factory=lambda: V1TokenRequestSpec())
+    status: V1TokenRequestStatus = Field(default_factory=lambda: V1TokenRequestStatus())
+
+
+mapping = {
+    "TokenRequest": {
+        "v1": AuthenticationV1TokenRequest,
+    },
+    "BoundObjectReference": {
+        "v1": V1BoundObjectReference,
+    },
+    "ObjectReference": {
+        "v1": V1ObjectReference,
+    },
+    "APIResourceList": {
+        "v1": V1APIResourceList,
+    },
+    "APIResource": {
+        "v1": V1APIResource,
+    },
+    "Binding": {
+        "v1": V1Binding,
+    },
+    "ComponentStatus": {
+        "v1": V1ComponentStatus,
+    },
+    "ComponentStatusList": {
+        "v1": V1ComponentStatusList,
+    },
+    "ConfigMap": {
+        "v1": V1ConfigMap,
+    },
+    "ConfigMapList": {
+        "v1": V1ConfigMapList,
+    },
+    "AzureDiskVolumeSource": {
+        "v1": V1AzureDiskVolumeSource,
+    },
+    "TypedLocalObjectReference": {
+        "v1": V1TypedLocalObjectReference,
+    },
+    "TypedObjectReference": {
+        "v1": V1TypedObjectReference,
+    },
+    "DeleteOptions": {
+        "v1": V1DeleteOptions,
+    },
+    "Endpoints": {
+        "v1": V1Endpoints,
+    },
+    "EndpointsList": {
+        "v1": V1EndpointsList,
+    },
+    "Eviction": {
+        "v1": V1Eviction,
+    },
+    "LimitRange": {
+        "v1": V1LimitRange,
+    },
+    "LimitRangeList": {
+        "v1": V1LimitRangeList,
+    },
+    "Namespace": {
+        "v1": V1Namespace,
+    },
+    "NamespaceList": {
+        "v1": V1NamespaceList,
+    },
+    "Node": {
+        "v1": V1Node,
+    },
+    "NodeList": {
+        "v1": V1NodeList,
+    },
+    "PersistentVolume": {
+        "v1": V1PersistentVolume,
+    },
+    "PersistentVolumeClaim": {
+        "v1": V1PersistentVolumeClaim,
+    },
+    "PersistentVolumeClaimList": {
+        "v1": V1PersistentVolumeClaimList,
+    },
+    "PersistentVolumeList": {
+        "v1": V1PersistentVolumeList,
+    },
+    "Pod": {
+        "v1": V1Pod,
+    },
+    "PodList": {
+        "v1": V1PodList,
+    },
+    "PodTemplate": {
+        "v1": V1PodTemplate,
+    },
+    "PodTemplateList": {
+        "v1": V1PodTemplateList,
+    },
+    "ReplicationController": {
+        "v1": V1ReplicationController,
+    },
+    "ReplicationControllerList": {
+        "v1": V1ReplicationControllerList,
+    },
+    "ResourceQuota": {
+        "v1": V1ResourceQuota,
+    },
+    "ResourceQuotaList": {
+        "v1": V1ResourceQuotaList,
+    },
+    "Scale": {
+        "v1": V1Scale,
+    },
+    "Secret": {
+        "v1": V1Secret,
+    },
+    "SecretList": {
+        "v1": V1SecretList,
+    },
+    "Service": {
+        "v1": V1Service,
+    },
+    "ServiceAccount": {
+        "v1": V1ServiceAccount,
+    },
+    "ServiceAccountList": {
+        "v1": V1ServiceAccountList,
+    },
+    "ServiceList": {
+        "v1": V1ServiceList,
+    },
+    "Status": {
+        "v1": V1Status,
+    },
+    "StatusDetails": {
+        "v1": V1StatusDetails,
+    },
+}
+
+
+update_models(locals())
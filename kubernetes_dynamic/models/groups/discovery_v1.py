@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1ObjectReference
+
+
+class V1EndpointSliceList(ResourceItem):
+    items: List[V1EndpointSlice] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class DiscoveryV1EndpointPort(ResourceValue):
+    appProtocol: Optional[str] = None
+    name: Optional[str] = None
+    port: Optional[int] = None
+    protocol: Optional[str] = None
+
+
+class V1ForZone(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1EndpointHints(ResourceValue):
+    forZones: List[V1ForZone] = Field(default_factory=list)
+
+
+class V1EndpointConditions(ResourceValue):
+    ready: Optional[bool] = None
+    serving: Optional[bool] = None
+    terminating: Optional[bool] = None
+
+
+class V1Endpoint(ResourceValue):
+    addresses: List[str] = Field(default_factory=list)
+    conditions: V1EndpointConditions = Field(default_factory=lambda: V1EndpointConditions())
+    deprecatedTopology: Dict[str, str] = Field(default_factory=dict)
+    hints: V1EndpointHints = Field(default_factory=lambda: V1EndpointHints())
+    hostname: Optional[str] = None
+    nodeName: Optional[str] = None
+    targetRef: V1ObjectReference = Field(default_factory=lambda: V1ObjectReference())
+    zone: Optional[str] = None
+
+
+class V1EndpointSlice(ResourceItem):
+    addressType: Optional[str] = None
+    endpoints: List[V1Endpoint] = Field(default_factory=list)
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    ports: List[DiscoveryV1EndpointPort] = Field(default_factory=list)
+
+
+mapping = {
+    "EndpointSlice": {
+        "v1": V1EndpointSlice,
+    },
+    "EndpointSliceList": {
+        "v1": V1EndpointSliceList,
+    },
+}
+
+
+update_models(locals())
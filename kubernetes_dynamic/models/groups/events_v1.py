@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1EventSource, V1ObjectReference
+
+
+class EventsV1EventList(ResourceItem):
+    items: List[EventsV1Event] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class EventsV1EventSeries(ResourceValue):
+    count: Optional[int] = None
+    lastObservedTime: Optional[datetime] = None
+
+
+class EventsV1Event(ResourceItem):
+    action: Optional[str] = None
+    deprecatedCount: Optional[int] = None
+    deprecatedFirstTimestamp: Optional[datetime] = None
+    deprecatedLastTimestamp: Optional[datetime] = None
+    deprecatedSource: V1EventSource = Field(default_factory=lambda: V1EventSource())
+    eventTime: Optional[datetime] = None
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    note: Optional[str] = None
+    reason: Optional[str] = None
+    regarding: V1ObjectReference = Field(default_factory=lambda: V1ObjectReference())
+    related: V1ObjectReference = Field(default_factory=lambda: V1ObjectReference())
+    reportingController: Optional[str] = None
+    reportingInstance: Optional[str] = None
+    series: EventsV1EventSeries = Field(default_factory=lambda: EventsV1EventSeries())
+    type: Optional[str] = None
+
+
+mapping = {
+    "Event": {
+        "v1": EventsV1Event,
+    },
+    "EventList": {
+        "v1": EventsV1EventList,
+    },
+}
+
+
+update_models(locals())
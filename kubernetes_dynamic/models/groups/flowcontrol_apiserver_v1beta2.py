@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+
+
+class V1beta2PriorityLevelConfigurationList(ResourceItem):
+    items: List[V1beta2PriorityLevelConfiguration] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1beta2PriorityLevelConfigurationCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1beta2PriorityLevelConfigurationStatus(ResourceValue):
+    conditions: List[V1beta2PriorityLevelConfigurationCondition] = Field(default_factory=list)
+
+
+class V1beta2QueuingConfiguration(ResourceValue):
+    handSize: Optional[int] = None
+    queueLengthLimit: Optional[int] = None
+    queues: Optional[int] = None
+
+
+class V1beta2LimitResponse(ResourceValue):
+    queuing: V1beta2QueuingConfiguration = Field(default_factory=lambda: V1beta2QueuingConfiguration())
+    type: Optional[str] = None
+
+
+class V1beta2LimitedPriorityLevelConfiguration(ResourceValue):
+    assuredConcurrencyShares: Optional[int] = None
+    borrowingLimitPercent: Optional[int] = None
+    lendablePercent: Optional[int] = None
+    limitResponse: V1beta2LimitResponse = Field(default_factory=lambda: V1beta2LimitResponse())
+
+
+class V1beta2PriorityLevelConfigurationSpec(ResourceValue):
+    limited: V1beta2LimitedPriorityLevelConfiguration = Field(
+        default_factory=lambda: V1beta2LimitedPriorityLevelConfiguration()
+    )
+    type: Optional[str] = None
+
+
+class V1beta2PriorityLevelConfiguration(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1beta2PriorityLevelConfigurationSpec = Field(default_factory=lambda: V1beta2PriorityLevelConfigurationSpec())
+    status: V1beta2PriorityLevelConfigurationStatus = Field(
+        default_factory=lambda: V1beta2PriorityLevelConfigurationStatus()
+    )
+
+
+class V1beta2FlowSchemaList(ResourceItem):
+    items: List[V1beta2FlowSchema] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1beta2FlowSchemaCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1beta2FlowSchemaStatus(ResourceValue):
+    conditions: List[V1beta2FlowSchemaCondition] = Field(default_factory=list)
+
+
+class V1beta2UserSubject(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1beta2ServiceAccountSubject(ResourceValue):
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+
+
+class V1beta2GroupSubject(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1beta2Subject(ResourceValue):
+    group: V1beta2GroupSubject = Field(default_factory=lambda: V1beta2GroupSubject())
+    kind: Optional[str] = None
+    serviceAccount: V1beta2ServiceAccountSubject = Field(default_factory=lambda: V1beta2ServiceAccountSubject())
+    user: V1beta2UserSubject = Field(default_factory=lambda: V1beta2UserSubject())
+
+
+class V1beta2ResourcePolicyRule(ResourceValue):
+    apiGroups: List[str] = Field(default_factory=list)
+    clusterScope: Optional[bool] = None
+    namespaces: List[str] = Field(default_factory=list)
+    resources: List[str] = Field(default_factory=list)
+    verbs: List[str] = Field(default_factory=list)
+
+
+class V1beta2NonResourcePolicyRule(ResourceValue):
+    nonResourceURLs: List[str] = Field(default_factory=list)
+    verbs: List[str] = Field(default_factory=list)
+
+
+class V1beta2PolicyRulesWithSubjects(ResourceValue):
+    nonResourceRules: List[V1beta2NonResourcePolicyRule] = Field(default_factory=list)
+    resourceRules: List[V1beta2ResourcePolicyRule] = Field(default_factory=list)
+    subjects: List[V1beta2Subject] = Field(default_factory=list)
+
+
+class V1beta2PriorityLevelConfigurationReference(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1beta2FlowDistinguisherMethod(ResourceValue):
+    type: Optional[str] = None
+
+
+class V1beta2FlowSchemaSpec(ResourceValue):
+    distinguisherMethod: V1beta2FlowDistinguisherMethod = Field(
+        default_factory=lambda: V1beta2FlowDistinguisherMethod()
+    )
+    matchingPrecedence: Optional[int] = None
+    priorityLevelConfiguration: V1beta2PriorityLevelConfigurationReference = Field(
+        default_factory=lambda: V1beta2PriorityLevelConfigurationReference()
+    )
+    rules: List[V1beta2PolicyRulesWithSubjects] = Field(default_factory=list)
+
+
+class V1beta2FlowSchema(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1beta2FlowSchemaSpec = Field(default_factory=lambda: V1beta2FlowSchemaSpec())
+    status: V1beta2FlowSchemaStatus = Field(default_factory=lambda: V1beta2FlowSchemaStatus())
+
+
+mapping = {
+    "Subject": {
+        "v1beta2": V1beta2Subject,
+    },
+    "FlowSchema": {
+        "v1beta2": V1beta2FlowSchema,
+    },
+    "FlowSchemaList": {
+        "v1beta2": V1beta2FlowSchemaList,
+    },
+    "PriorityLevelConfiguration": {
+        "v1beta2": V1beta2PriorityLevelConfiguration,
+    },
+    "PriorityLevelConfigurationList": {
+        "v1beta2": V1beta2PriorityLevelConfigurationList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+
+
+class V1beta3PriorityLevelConfigurationList(ResourceItem):
+    items: List[V1beta3PriorityLevelConfiguration] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1beta3PriorityLevelConfigurationCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1beta3PriorityLevelConfigurationStatus(ResourceValue):
+    conditions: List[V1beta3PriorityLevelConfigurationCondition] = Field(default_factory=list)
+
+
+class V1beta3QueuingConfiguration(ResourceValue):
+    handSize: Optional[int] = None
+    queueLengthLimit: Optional[int] = None
+    queues: Optional[int] = None
+
+
+class V1beta3LimitResponse(ResourceValue):
+    queuing: V1beta3QueuingConfiguration = Field(default_factory=lambda: V1beta3QueuingConfiguration())
+    type: Optional[str] = None
+
+
+class V1beta3LimitedPriorityLevelConfiguration(ResourceValue):
+    borrowingLimitPercent: Optional[int] = None
+    lendablePercent: Optional[int] = None
+    limitResponse: V1beta3LimitResponse = Field(default_factory=lambda: V1beta3LimitResponse())
+    nominalConcurrencyShares: Optional[int] = None
+
+
+class V1beta3PriorityLevelConfigurationSpec(ResourceValue):
+    limited: V1beta3LimitedPriorityLevelConfiguration = Field(
+        default_factory=lambda: V1beta3LimitedPriorityLevelConfiguration()
+    )
+    type: Optional[str] = None
+
+
+class V1beta3PriorityLevelConfiguration(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1beta3PriorityLevelConfigurationSpec = Field(default_factory=lambda: V1beta3PriorityLevelConfigurationSpec())
+    status: V1beta3PriorityLevelConfigurationStatus = Field(
+        default_factory=lambda: V1beta3PriorityLevelConfigurationStatus()
+    )
+
+
+class V1beta3FlowSchemaList(ResourceItem):
+    items: List[V1beta3FlowSchema] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1beta3FlowSchemaCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1beta3FlowSchemaStatus(ResourceValue):
+    conditions: List[V1beta3FlowSchemaCondition] = Field(default_factory=list)
+
+
+class V1beta3UserSubject(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1beta3ServiceAccountSubject(ResourceValue):
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+
+
+class V1beta3GroupSubject(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1beta3Subject(ResourceValue):
+    group: V1beta3GroupSubject = Field(default_factory=lambda: V1beta3GroupSubject())
+    kind: Optional[str] = None
+    serviceAccount: V1beta3ServiceAccountSubject = Field(default_factory=lambda: V1beta3ServiceAccountSubject())
+    user: V1beta3UserSubject = Field(default_factory=lambda: V1beta3UserSubject())
+
+
+class V1beta3ResourcePolicyRule(ResourceValue):
+    apiGroups: List[str] = Field(default_factory=list)
+    clusterScope: Optional[bool] = None
+    namespaces: List[str] = Field(default_factory=list)
+    resources: List[str] = Field(default_factory=list)
+    verbs: List[str] = Field(default_factory=list)
+
+
+class V1beta3NonResourcePolicyRule(ResourceValue):
+    nonResourceURLs: List[str] = Field(default_factory=list)
+    verbs: List[str] = Field(default_factory=list)
+
+
+class V1beta3PolicyRulesWithSubjects(ResourceValue):
+    nonResourceRules: List[V1beta3NonResourcePolicyRule] = Field(default_factory=list)
+    resourceRules: List[V1beta3ResourcePolicyRule] = Field(default_factory=list)
+    subjects: List[V1beta3Subject] = Field(default_factory=list)
+
+
+class V1beta3PriorityLevelConfigurationReference(ResourceValue):
+    name: Optional[str] = None
+
+
+class V1beta3FlowDistinguisherMethod(ResourceValue):
+    type: Optional[str] = None
+
+
+class V1beta3FlowSchemaSpec(ResourceValue):
+    distinguisherMethod: V1beta3FlowDistinguisherMethod = Field(
+        default_factory=lambda: V1beta3FlowDistinguisherMethod()
+    )
+    matchingPrecedence: Optional[int] = None
+    priorityLevelConfiguration: V1beta3PriorityLevelConfigurationReference = Field(
+        default_factory=lambda: V1beta3PriorityLevelConfigurationReference()
+    )
+    rules: List[V1beta3PolicyRulesWithSubjects] = Field(default_factory=list)
+
+
+class V1beta3FlowSchema(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1beta3FlowSchemaSpec = Field(default_factory=lambda: V1beta3FlowSchemaSpec())
+    status: V1beta3FlowSchemaStatus = Field(default_factory=lambda: V1beta3FlowSchemaStatus())
+
+
+mapping = {
+    "Subject": {
+        "v1beta3": V1beta3Subject,
+    },
+    "FlowSchema": {
+        "v1beta3": V1beta3FlowSchema,
+    },
+    "FlowSchemaList": {
+        "v1beta3": V1beta3FlowSchemaList,
+    },
+    "PriorityLevelConfiguration": {
+        "v1beta3": V1beta3PriorityLevelConfiguration,
+    },
+    "PriorityLevelConfigurationList": {
+        "v1beta3": V1beta3PriorityLevelConfigurationList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+
+
+class V1alpha1StorageVersionList(ResourceItem):
+    items: List[V1alpha1StorageVersion] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1alpha1ServerStorageVersion(ResourceValue):
+    apiServerID: Optional[str] = None
+    decodableVersions: List[str] = Field(default_factory=list)
+    encodingVersion: Optional[str] = None
+
+
+class V1alpha1StorageVersionCondition(ResourceValue):
+    lastTransitionTime: Optional[datetime] = None
+    message: Optional[str] = None
+    observedGeneration: Optional[int] = None
+    reason: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+
+
+class V1alpha1StorageVersionStatus(ResourceValue):
+    commonEncodingVersion: Optional[str] = None
+    conditions: List[V1alpha1StorageVersionCondition] = Field(default_factory=list)
+    storageVersions: List[V1alpha1ServerStorageVersion] = Field(default_factory=list)
+
+
+class V1alpha1StorageVersion(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: Optional[object] = None
+    status: V1alpha1StorageVersionStatus = Field(default_factory=lambda: V1alpha1StorageVersionStatus())
+
+
+mapping = {
+    "StorageVersion": {
+        "v1alpha1": V1alpha1StorageVersion,
+    },
+    "StorageVersionList": {
+        "v1alpha1": V1alpha1StorageVersionList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta as V1ListMeta
+from ..common import V1ManagedFieldsEntry as V1ManagedFieldsEntry
+from ..common import V1ObjectMeta as V1ObjectMeta
+from ..common import V1OwnerReference as V1OwnerReference
+from ..partial_object_metadata import V1PartialObjectMetadata as V1PartialObjectMetadata
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from ..table import V1Table as V1Table
+from ..table import V1TableColumnDefinition as V1TableColumnDefinition
+from ..table import V1TableRow as V1TableRow
+from . import update_models
+
+
+class V1UserInfo(ResourceValue):
+    extra: Dict[str, List[str]] = Field(default_factory=dict)
+    groups: List[str] = Field(default_factory=list)
+    uid: Optional[str] = None
+    username: Optional[str] = None
+
+
+class V1APIVersions(ResourceItem):
+    serverAddressByClientCIDRs: List[V1ServerAddressByClientCIDR] = Field(default_factory=list)
+    versions: List[str] = Field(default_factory=list)
+
+
+class V1APIGroupList(ResourceItem):
+    groups: List[V1APIGroup] = Field(default_factory=list)
+
+
+class V1ServerAddressByClientCIDR(ResourceValue):
+    clientCIDR: Optional[str] = None
+    serverAddress: Optional[str] = None
+
+
+class V1GroupVersionForDiscovery(ResourceValue):
+    groupVersion: Optional[str] = None
+    version: Optional[str] = None
+
+
+class V1APIGroup(ResourceItem):
+    name: Optional[str] = None
+    preferredVersion: V1GroupVersionForDiscovery = Field(default_factory=lambda: V1GroupVersionForDiscovery())
+    serverAddressByClientCIDRs: List[V1ServerAddressByClientCIDR] = Field(default_factory=list)
+    versions: List[V1GroupVersionForDiscovery] = Field(default_factory=list)
+
+
+mapping = {
+    "OwnerReference": {
+        "v1": V1OwnerReference,
+    },
+    "APIGroup": {
+        "v1": V1APIGroup,
+    },
+    "APIGroupList": {
+        "v1": V1APIGroupList,
+    },
+    "APIVersions": {
+        "v1": V1APIVersions,
+    },
+    "PartialObjectMetadata": {
+        "meta.k8s.io/v1": V1PartialObjectMetadata,
+    },
+    "Table": {
+        "meta.k8s.io/v1": V1Table,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..ingress import V1Ingress as V1Ingress
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1Condition, V1LabelSelector, V1TypedLocalObjectReference
+
+
+class V1NetworkPolicyList(ResourceItem):
+    items: List[V1NetworkPolicy] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1NetworkPolicyStatus(ResourceValue):
+    conditions: List[V1Condition] = Field(default_factory=list)
+
+
+class V1NetworkPolicyIngressRule(ResourceValue):
+    ports: List[V1NetworkPolicyPort] = Field(default_factory=list)
+
+
+class V1IPBlock(ResourceValue):
+    cidr: Optional[str] = None
+
+
+class V1NetworkPolicyPeer(ResourceValue):
+    ipBlock: V1IPBlock = Field(default_factory=lambda: V1IPBlock())
+    namespaceSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    podSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+
+
+class V1NetworkPolicyPort(ResourceValue):
+    endPort: Optional[int] = None
+    port: Optional[object] = None
+    protocol: Optional[str] = None
+
+
+class V1NetworkPolicyEgressRule(ResourceValue):
+    ports: List[V1NetworkPolicyPort] = Field(default_factory=list)
+    to: List[V1NetworkPolicyPeer] = Field(default_factory=list)
+
+
+class V1NetworkPolicySpec(ResourceValue):
+    egress: List[V1NetworkPolicyEgressRule] = Field(default_factory=list)
+    ingress: List[V1NetworkPolicyIngressRule] = Field(default_factory=list)
+    podSelector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    policyTypes: List[str] = Field(default_factory=list)
+
+
+class V1NetworkPolicy(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1NetworkPolicySpec = Field(default_factory=lambda: V1NetworkPolicySpec())
+    status: V1NetworkPolicyStatus = Field(default_factory=lambda: V1NetworkPolicyStatus())
+
+
+class V1IngressList(ResourceItem):
+    items: List[V1Ingress] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1IngressClassList(ResourceItem):
+    items: List[V1IngressClass] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1IngressClassParametersReference(ResourceValue):
+    apiGroup: Optional[str] = None
+    kind: Optional[str] = None
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+    scope: Optional[str] = None
+
+
+class V1IngressClassSpec(ResourceValue):
+    controller: Optional[str] = None
+    parameters: V1IngressClassParametersReference = Field(default_factory=lambda: V1IngressClassParametersReference())
+
+
+class V1IngressClass(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1IngressClassSpec = Field(default_factory=lambda: V1IngressClassSpec())
+
+
+class V1IngressPortStatus(ResourceValue):
+    error: Optional[str] = None
+    port: Optional[int] = None
+    protocol: Optional[str] = None
+
+
+class V1IngressLoadBalancerIngress(ResourceValue):
+    hostname: Optional[str] = None
+    ip: Optional[str] = None
+    ports: List[V1IngressPortStatus] = Field(default_factory=list)
+
+
+class V1IngressLoadBalancerStatus(ResourceValue):
+    ingress: List[V1IngressLoadBalancerIngress] = Field(default_factory=list)
+
+
+class V1IngressStatus(ResourceValue):
+    loadBalancer: V1IngressLoadBalancerStatus = Field(default_factory=lambda: V1IngressLoadBalancerStatus())
+
+
+class V1IngressTLS(ResourceValue):
+    hosts: List[str] = Field(default_factory=list)
+    secretName: Optional[str] = None
+
+
+class V1HTTPIngressPath(ResourceValue):
+    backend: V1IngressBackend = Field(default_factory=lambda: V1IngressBackend())
+    path: Optional[str] = None
+    pathType: Optional[str] = None
+
+
+class V1HTTPIngressRuleValue(ResourceValue):
+    paths: List[V1HTTPIngressPath] = Field(default_factory=list)
+
+
+class V1IngressRule(ResourceValue):
+    host: Optional[str] = None
+    http: V1HTTPIngressRuleValue = Field(default_factory=lambda: V1HTTPIngressRuleValue())
+
+
+class V1ServiceBackendPort(ResourceValue):
+    name: Optional[str] = None
+    number: Optional[int] = None
+
+
+class V1IngressServiceBackend(ResourceValue):
+    name: Optional[str] = None
+    port: V1ServiceBackendPort = Field(default_factory=lambda: V1ServiceBackendPort())
+
+
+class V1IngressBackend(ResourceValue):
+    resource: V1TypedLocalObjectReference = Field(default_factory=lambda: V1TypedLocalObjectReference())
+    service: V1IngressServiceBackend = Field(default_factory=lambda: V1IngressServiceBackend())
+
+
+class V1IngressSpec(ResourceValue):
+    defaultBackend: V1IngressBackend = Field(default_factory=lambda: V1IngressBackend())
+    ingressClassName: Optional[str] = None
+    rules: List[V1IngressRule] = Field(default_factory=list)
+    tls: List[V1IngressTLS] = Field(default_factory=list)
+
+
+mapping = {
+    "Ingress": {
+        "v1": V1Ingress,
+    },
+    "IngressClass": {
+        "v1": V1IngressClass,
+    },
+    "IngressClassParametersReference": {
+        "v1": V1IngressClassParametersReference,
+    },
+    "IngressClassList": {
+        "v1": V1IngressClassList,
+    },
+    "IngressList": {
+        "v1": V1IngressList,
+    },
+    "NetworkPolicy": {
+        "v1": V1NetworkPolicy,
+    },
+    "NetworkPolicyList": {
+        "v1": V1NetworkPolicyList,
+    },
+}
+
+
+update_models(locals())
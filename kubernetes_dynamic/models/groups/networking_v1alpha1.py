@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1NodeSelector
+
+
+class V1alpha1ClusterCIDRList(ResourceItem):
+    items: List[V1alpha1ClusterCIDR] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1alpha1ClusterCIDRSpec(ResourceValue):
+    ipv4: Optional[str] = None
+    ipv6: Optional[str] = None
+    nodeSelector: V1NodeSelector = Field(default_factory=lambda: V1NodeSelector())
+    perNodeHostBits: Optional[int] = None
+
+
+class V1alpha1ClusterCIDR(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1alpha1ClusterCIDRSpec = Field(default_factory=lambda: V1alpha1ClusterCIDRSpec())
+
+
+mapping = {
+    "ClusterCIDR": {
+        "v1alpha1": V1alpha1ClusterCIDR,
+    },
+    "ClusterCIDRList": {
+        "v1alpha1": V1alpha1ClusterCIDRList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1Toleration
+
+
+class V1RuntimeClassList(ResourceItem):
+    items: List[V1RuntimeClass] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1Scheduling(ResourceValue):
+    nodeSelector: Dict[str, str] = Field(default_factory=dict)
+    tolerations: List[V1Toleration] = Field(default_factory=list)
+
+
+class V1Overhead(ResourceValue):
+    podFixed: Dict[str, str] = Field(default_factory=dict)
+
+
+class V1RuntimeClass(ResourceItem):
+    handler: Optional[str] = None
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    overhead: V1Overhead = Field(default_factory=lambda: V1Overhead())
+    scheduling: V1Scheduling = Field(default_factory=lambda: V1Scheduling())
+
+
+mapping = {
+    "RuntimeClass": {
+        "v1": V1RuntimeClass,
+    },
+    "RuntimeClassList": {
+        "v1": V1RuntimeClassList,
+    },
+}
+
+
+update_models(locals())
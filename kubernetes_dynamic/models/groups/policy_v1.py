@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1Condition, V1LabelSelector
+
+
+class V1PodDisruptionBudgetList(ResourceItem):
+    items: List[V1PodDisruptionBudget] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1PodDisruptionBudgetStatus(ResourceValue):
+    conditions: List[V1Condition] = Field(default_factory=list)
+    currentHealthy: Optional[int] = None
+    desiredHealthy: Optional[int] = None
+    disruptedPods: Dict[str, datetime] = Field(default_factory=dict)
+    disruptionsAllowed: Optional[int] = None
+    expectedPods: Optional[int] = None
+    observedGeneration: Optional[int] = None
+
+
+class V1PodDisruptionBudgetSpec(ResourceValue):
+    maxUnavailable: Optional[object] = None
+    minAvailable: Optional[object] = None
+    selector: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    unhealthyPodEvictionPolicy: Optional[str] = None
+
+
+class V1PodDisruptionBudget(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1PodDisruptionBudgetSpec = Field(default_factory=lambda: V1PodDisruptionBudgetSpec())
+    status: V1PodDisruptionBudgetStatus = Field(default_factory=lambda: V1PodDisruptionBudgetStatus())
+
+
+mapping = {
+    "PodDisruptionBudget": {
+        "v1": V1PodDisruptionBudget,
+    },
+    "PodDisruptionBudgetList": {
+        "v1": V1PodDisruptionBudgetList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1LabelSelector
+
+
+class V1RoleList(ResourceItem):
+    items: List[V1Role] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1RoleBindingList(ResourceItem):
+    items: List[V1RoleBinding] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1RoleBinding(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    roleRef: V1RoleRef = Field(default_factory=lambda: V1RoleRef())
+    subjects: List[V1Subject] = Field(default_factory=list)
+
+
+class V1Role(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    rules: List[V1PolicyRule] = Field(default_factory=list)
+
+
+class V1ClusterRoleList(ResourceItem):
+    items: List[V1ClusterRole] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1ClusterRoleBindingList(ResourceItem):
+    items: List[V1ClusterRoleBinding] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1Subject(ResourceValue):
+    apiGroup: Optional[str] = None
+    kind: Optional[str] = None
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+
+
+class V1RoleRef(ResourceValue):
+    apiGroup: Optional[str] = None
+    kind: Optional[str] = None
+    name: Optional[str] = None
+
+
+class V1ClusterRoleBinding(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    roleRef: V1RoleRef = Field(default_factory=lambda: V1RoleRef())
+    subjects: List[V1Subject] = Field(default_factory=list)
+
+
+class V1PolicyRule(ResourceValue):
+    apiGroups: List[str] = Field(default_factory=list)
+    nonResourceURLs: List[str] = Field(default_factory=list)
+    resourceNames: List[str] = Field(default_factory=list)
+    resources: List[str] = Field(default_factory=list)
+    verbs: List[str] = Field(default_factory=list)
+
+
+class V1AggregationRule(ResourceValue):
+    clusterRoleSelectors: List[V1LabelSelector] = Field(default_factory=list)
+
+
+class V1ClusterRole(ResourceItem):
+    aggregationRule: V1AggregationRule = Field(default_factory=lambda: V1AggregationRule())
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    rules: List[V1PolicyRule] = Field(default_factory=list)
+
+
+mapping = {
+    "ClusterRole": {
+        "v1": V1ClusterRole,
+    },
+    "ClusterRoleBinding": {
+        "v1": V1ClusterRoleBinding,
+    },
+    "RoleRef": {
+        "v1": V1RoleRef,
+    },
+    "Subject": {
+        "v1": V1Subject,
+    },
+    "ClusterRoleBindingList": {
+        "v1": V1ClusterRoleBindingList,
+    },
+    "ClusterRoleList": {
+        "v1": V1ClusterRoleList,
+    },
+    "Role": {
+        "v1": V1Role,
+    },
+    "RoleBinding": {
+        "v1": V1RoleBinding,
+    },
+    "RoleBindingList": {
+        "v1": V1RoleBindingList,
+    },
+    "RoleList": {
+        "v1": V1RoleList,
+    },
+}
+
+
+update_models(locals())
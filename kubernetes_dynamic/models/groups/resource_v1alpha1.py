@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1NodeSelector
+
+
+class V1alpha1ResourceClassList(ResourceItem):
+    items: List[V1alpha1ResourceClass] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1alpha1ResourceClassParametersReference(ResourceValue):
+    apiGroup: Optional[str] = None
+    kind: Optional[str] = None
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+
+
+class V1alpha1ResourceClass(ResourceItem):
+    driverName: Optional[str] = None
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    parametersRef: V1alpha1ResourceClassParametersReference = Field(
+        default_factory=lambda: V1alpha1ResourceClassParametersReference()
+    )
+    suitableNodes: V1NodeSelector = Field(default_factory=lambda: V1NodeSelector())
+
+
+class V1alpha1ResourceClaimTemplateList(ResourceItem):
+    items: List[V1alpha1ResourceClaimTemplate] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1alpha1ResourceClaimTemplateSpec(ResourceValue):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1alpha1ResourceClaimSpec = Field(default_factory=lambda: V1alpha1ResourceClaimSpec())
+
+
+class V1alpha1ResourceClaimTemplate(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1alpha1ResourceClaimTemplateSpec = Field(default_factory=lambda: V1alpha1ResourceClaimTemplateSpec())
+
+
+class V1alpha1ResourceClaimList(ResourceItem):
+    items: List[V1alpha1ResourceClaim] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1alpha1ResourceClaimConsumerReference(ResourceValue):
+    apiGroup: Optional[str] = None
+    name: Optional[str] = None
+    resource: Optional[str] = None
+    uid: Optional[str] = None
+
+
+class V1alpha1AllocationResult(ResourceValue):
+    availableOnNodes: V1NodeSelector = Field(default_factory=lambda: V1NodeSelector())
+    resourceHandle: Optional[str] = None
+    shareable: Optional[bool] = None
+
+
+class V1alpha1ResourceClaimStatus(ResourceValue):
+    allocation: V1alpha1AllocationResult = Field(default_factory=lambda: V1alpha1AllocationResult())
+    deallocationRequested: Optional[bool] = None
+    driverName: Optional[str] = None
+    reservedFor: List[V1alpha1ResourceClaimConsumerReference] = Field(default_factory=list)
+
+
+class V1alpha1ResourceClaimParametersReference(ResourceValue):
+    apiGroup: Optional[str] = None
+    kind: Optional[str] = None
+    name: Optional[str] = None
+
+
+class V1alpha1ResourceClaimSpec(ResourceValue):
+    allocationMode: Optional[str] = None
+    parametersRef: V1alpha1ResourceClaimParametersReference = Field(
+        default_factory=lambda: V1alpha1ResourceClaimParametersReference()
+    )
+    resourceClassName: Optional[str] = None
+
+
+class V1alpha1ResourceClaim(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1alpha1ResourceClaimSpec = Field(default_factory=lambda: V1alpha1ResourceClaimSpec())
+    status: V1alpha1ResourceClaimStatus = Field(default_factory=lambda: V1alpha1ResourceClaimStatus())
+
+
+class V1alpha1PodSchedulingList(ResourceItem):
+    items: List[V1alpha1PodScheduling] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1alpha1ResourceClaimSchedulingStatus(ResourceValue):
+    name: Optional[str] = None
+    unsuitableNodes: List[str] = Field(default_factory=list)
+
+
+class V1alpha1PodSchedulingStatus(ResourceValue):
+    resourceClaims: List[V1alpha1ResourceClaimSchedulingStatus] = Field(default_factory=list)
+
+
+class V1alpha1PodSchedulingSpec(ResourceValue):
+    potentialNodes: List[str] = Field(default_factory=list)
+    selectedNode: Optional[str] = None
+
+
+class V1alpha1PodScheduling(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1alpha1PodSchedulingSpec = Field(default_factory=lambda: V1alpha1PodSchedulingSpec())
+    status: V1alpha1PodSchedulingStatus = Field(default_factory=lambda: V1alpha1PodSchedulingStatus())
+
+
+mapping = {
+    "PodScheduling": {
+        "v1alpha1": V1alpha1PodScheduling,
+    },
+    "PodSchedulingList": {
+        "v1alpha1": V1alpha1PodSchedulingList,
+    },
+    "ResourceClaim": {
+        "v1alpha1": V1alpha1ResourceClaim,
+    },
+    "ResourceClaimParametersReference": {
+        "v1alpha1": V1alpha1ResourceClaimParametersReference,
+    },
+    "ResourceClaimList": {
+        "v1alpha1": V1alpha1ResourceClaimList,
+    },
+    "ResourceClaimTemplate": {
+        "v1alpha1": V1alpha1ResourceClaimTemplate,
+    },
+    "ResourceClaimTemplateList": {
+        "v1alpha1": V1alpha1ResourceClaimTemplateList,
+    },
+    "ResourceClass": {
+        "v1alpha1": V1alpha1ResourceClass,
+    },
+    "ResourceClassParametersReference": {
+        "v1alpha1": V1alpha1ResourceClassParametersReference,
+    },
+    "ResourceClassList": {
+        "v1alpha1": V1alpha1ResourceClassList,
+    },
+}
+
+
+update_models(locals())
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from . import update_models
+
+
+class V1PriorityClassList(ResourceItem):
+    items: List[V1PriorityClass] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1PriorityClass(ResourceItem):
+    description: Optional[str] = None
+    globalDefault: Optional[bool] = None
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    preemptionPolicy: Optional[str] = None
+    value: Optional[int] = None
+
+
+mapping = {
+    "PriorityClass": {
+        "v1": V1PriorityClass,
+    },
+    "PriorityClassList": {
+        "v1": V1PriorityClassList,
+    },
+}
+
+
+update_models(locals())
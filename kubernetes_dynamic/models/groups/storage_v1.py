@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from ..resource_value import ResourceValue
+from . import update_models
+from .core_v1 import V1LabelSelector, V1PersistentVolumeSpec
+
+
+class V1VolumeAttachmentList(ResourceItem):
+    items: List[V1VolumeAttachment] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1VolumeError(ResourceValue):
+    message: Optional[str] = None
+    time: Optional[datetime] = None
+
+
+class V1VolumeAttachmentStatus(ResourceValue):
+    attachError: V1VolumeError = Field(default_factory=lambda: V1VolumeError())
+    attached: Optional[bool] = None
+    attachmentMetadata: Dict[str, str] = Field(default_factory=dict)
+    detachError: V1VolumeError = Field(default_factory=lambda: V1VolumeError())
+
+
+class V1VolumeAttachmentSource(ResourceValue):
+    inlineVolumeSpec: V1PersistentVolumeSpec = Field(default_factory=lambda: V1PersistentVolumeSpec())
+    persistentVolumeName: Optional[str] = None
+
+
+class V1VolumeAttachmentSpec(ResourceValue):
+    attacher: Optional[str] = None
+    nodeName: Optional[str] = None
+    source: V1VolumeAttachmentSource = Field(default_factory=lambda: V1VolumeAttachmentSource())
+
+
+class V1VolumeAttachment(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1VolumeAttachmentSpec = Field(default_factory=lambda: V1VolumeAttachmentSpec())
+    status: V1VolumeAttachmentStatus = Field(default_factory=lambda: V1VolumeAttachmentStatus())
+
+
+class V1StorageClassList(ResourceItem):
+    items: List[V1StorageClass] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1TopologySelectorLabelRequirement(ResourceValue):
+    key: Optional[str] = None
+    values: List[str] = Field(default_factory=list)
+
+
+class V1TopologySelectorTerm(ResourceValue):
+    matchLabelExpressions: List[V1TopologySelectorLabelRequirement] = Field(default_factory=list)
+
+
+class V1StorageClass(ResourceItem):
+    allowVolumeExpansion: Optional[bool] = None
+    allowedTopologies: List[V1TopologySelectorTerm] = Field(default_factory=list)
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    mountOptions: List[str] = Field(default_factory=list)
+    parameters: Dict[str, str] = Field(default_factory=dict)
+    provisioner: Optional[str] = None
+    reclaimPolicy: Optional[str] = None
+    volumeBindingMode: Optional[str] = None
+
+
+class V1CSIStorageCapacityList(ResourceItem):
+    items: List[V1CSIStorageCapacity] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1CSIStorageCapacity(ResourceItem):
+    capacity: Optional[str] = None
+    maximumVolumeSize: Optional[str] = None
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    nodeTopology: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    storageClassName: Optional[str] = None
+
+
+class V1CSINodeList(ResourceItem):
+    items: List[V1CSINode] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1VolumeNodeResources(ResourceValue):
+    count: Optional[int] = None
+
+
+class V1CSINodeDriver(ResourceValue):
+    allocatable: V1VolumeNodeResources = Field(default_factory=lambda: V1VolumeNodeResources())
+    name: Optional[str] = None
+    nodeID: Optional[str] = None
+    topologyKeys: List[str] = Field(default_factory=list)
+
+
+class V1CSINodeSpec(ResourceValue):
+    drivers: List[V1CSINodeDriver] = Field(default_factory=list)
+
+
+class V1CSINode(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1CSINodeSpec = Field(default_factory=lambda: V1CSINodeSpec())
+
+
+class V1CSIDriverList(ResourceItem):
+    items: List[V1CSIDriver] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class StorageV1TokenRequest(ResourceValue):
+    audience: Optional[str] = None
+    expirationSeconds: Optional[int] = None
+
+
+class V1CSIDriverSpec(ResourceValue):
+    attachRequired: Optional[bool] = None
+    fsGroupPolicy: Optional[str] = None
+    podInfoOnMount: Optional[bool] = None
+    requiresRepublish: Optional[bool] = None
+    seLinuxMount: Optional[bool] = None
+    storageCapacity: Optional[bool] = None
+    tokenRequests: List[StorageV1TokenRequest] = Field(default_factory=list)
+    volumeLifecycleModes: List[str] = Field(default_factory=list)
+
+
+class V1CSIDriver(ResourceItem):
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    spec: V1CSIDriverSpec = Field(default_factory=lambda: V1CSIDriverSpec())
+
+
+mapping = {
+    "CSIDriver": {
+        "v1": V1CSIDriver,
+    },
+    "CSIDriverList": {
+        "v1": V1CSIDriverList,
+    },
+    "CSINode": {
+        "v1": V1CSINode,
+    },
+    "CSINodeList": {
+        "v1": V1CSINodeList,
+    },
+    "CSIStorageCapacity": {
+        "v1": V1CSIStorageCapacity,
+    },
+    "CSIStorageCapacityList": {
+        "v1": V1CSIStorageCapacityList,
+    },
+    "StorageClass": {
+        "v1": V1StorageClass,
+    },
+    "StorageClassList": {
+        "v1": V1StorageClassList,
+    },
+    "VolumeAttachment": {
+        "v1": V1VolumeAttachment,
+    },
+    "VolumeAttachmentList": {
+        "v1": V1VolumeAttachmentList,
+    },
+}
+
+
+update_models(locals())
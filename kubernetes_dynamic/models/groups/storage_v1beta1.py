@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..common import V1ListMeta, V1ObjectMeta
+from ..resource_item import ResourceItem
+from . import update_models
+from .core_v1 import V1LabelSelector
+
+
+class V1beta1CSIStorageCapacityList(ResourceItem):
+    items: List[V1beta1CSIStorageCapacity] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+
+
+class V1beta1CSIStorageCapacity(ResourceItem):
+    capacity: Optional[str] = None
+    maximumVolumeSize: Optional[str] = None
+    metadata: V1ObjectMeta = Field(default_factory=lambda: V1ObjectMeta())
+    nodeTopology: V1LabelSelector = Field(default_factory=lambda: V1LabelSelector())
+    storageClassName: Optional[str] = None
+
+
+mapping = {
+    "CSIStorageCapacity": {
+        "v1beta1": V1beta1CSIStorageCapacity,
+    },
+    "CSIStorageCapacityList": {
+        "v1beta1": V1beta1CSIStorageCapacityList,
+    },
+}
+
+
+update_models(locals())
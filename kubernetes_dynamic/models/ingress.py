@@ -9,7 +9,7 @@
 from .resource_item import ResourceItem
 
 if TYPE_CHECKING:
-    from .all import V1IngressSpec, V1IngressStatus
+    from .groups.networking_v1 import V1IngressSpec, V1IngressStatus
 
 
 class V1Ingress(ResourceItem):
@@ -28,3 +28,7 @@ def get_default_host(cls) -> Optional[str]:
     def url(self):
         """Get URL."""
         return f"https://{self.spec.rules[0].host}"
+
+
+# resolves the forward references above
+from .groups import networking_v1  # noqa: E402, F401
@@ -10,7 +10,7 @@
 from .resource_item import ResourceItem
 
 if TYPE_CHECKING:
-    from .all import V1NamespaceSpec, V1NamespaceStatus
+    from .groups.core_v1 import V1NamespaceSpec, V1NamespaceStatus
 
 
 class V1Namespace(ResourceItem):
@@ -31,3 +31,7 @@ def ensure(cls, name: str) -> V1Namespace:
             return item.create()
         except ConflictError:
             return item.refresh()
+
+
+# resolves the forward references above
+from .groups import core_v1  # noqa: E402, F401
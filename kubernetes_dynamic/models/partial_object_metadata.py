@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from .resource_item import ResourceItem
+
+
+class V1PartialObjectMetadata(ResourceItem):
+    """Object with only its metadata, returned by metadata-only requests."""
+
+    @classmethod
+    def get_defaults(cls):
+        return {"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1"}
+
+
+# resolves the forward references above
+from .groups import meta_v1  # noqa: E402, F401
@@ -8,7 +8,7 @@
 from .resource_item import ResourceItem
 
 if TYPE_CHECKING:
-    from .all import V1PodSpec, V1PodStatus
+    from .groups.core_v1 import V1PodSpec, V1PodStatus
 
 
 class V1Pod(ResourceItem):
@@ -83,3 +83,7 @@ def get_env(self) -> dict[str, str]:
         """Get environment variables from a pod."""
         env = self.exec("env")
         return {item.split("=", 1)[0]: item.split("=", 1)[1] for item in env.splitlines()}
+
+
+# resolves the forward references above
+from .groups import core_v1  # noqa: E402, F401
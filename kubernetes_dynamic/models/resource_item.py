@@ -2,7 +2,7 @@
 
 import re
 import typing
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
 import pydantic
 from typing_extensions import Self
@@ -65,6 +65,17 @@ def __init__(
         self._api: Optional[ResourceApi] = None
         self._client = client
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any], lazy: bool = False) -> Self:
+        """Build the object from trusted data, skipping validation, see `ResourceValue.from_trusted`."""
+        if not data.get("kind") or not data.get("apiVersion"):
+            defaults = cls.get_defaults()
+            data = dict(data)
+            for key in ("kind", "apiVersion"):
+                if not data.get(key) and defaults.get(key):
+                    data[key] = defaults[key]
+        return super().from_trusted(data, lazy)
+
     @classmethod
     def get_defaults(cls):
         """Get some default values based on the class."""
@@ -96,10 +107,10 @@ def client(self) -> K8sClient:
 
     @classmethod
     def default_client(cls) -> K8sClient:
-        """Create a default K8sClient."""
-        from ..client import K8sClient
+        """Get the process-wide default K8sClient."""
+        from ..client import shared_client
 
-        return K8sClient()
+        return shared_client()
 
     def refresh(self) -> Self:
         """Refreshes the local instance with kubernetes data."""
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import functools
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pydantic
 import yaml
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_MAPPING, SHAPE_SEQUENCE, SHAPE_SINGLETON, ModelField
+from typing_extensions import Self
+
+from .. import json_codec
+
+Converter = Optional[Callable[[Any], Any]]
+TrustedField = Tuple[str, Converter, Optional[Callable[[], Any]]]
+
+_MISSING = object()
+_trusted_fields: Dict[Tuple[type, bool], Dict[str, TrustedField]] = {}
 
 
 class ResourceValue(pydantic.BaseModel):
@@ -16,6 +29,9 @@ class Config:
         arbitrary_types_allowed = True
         use_enum_values = True
 
+    _lazy: Optional[_LazyState] = pydantic.PrivateAttr(default=None)
+    _deferred: Optional[Dict[str, bytes]] = pydantic.PrivateAttr(default=None)
+
     def __init__(
         self,
         definition: dict[str, Any] | ResourceValue | None = None,
@@ -57,29 +73,205 @@ def convert(item: Any):
             values[name] = convert(value)
         return values
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any], lazy: bool = False) -> Self:
+        """Build a model from trusted data, skipping validation.
+
+        Meant for apiserver responses, which are already schema valid. Nested models are built from the field
+        types and extra dicts become ResourceValues like with validation, but values are not checked or coerced,
+        except timestamps which are parsed to datetime. Missing nested models default to empty trusted models.
+
+        With `lazy`, `data` is kept and every field is built on first access, so objects of which only a few
+        fields are read are much cheaper. Values which need no conversion are shared with `data`, and
+        `to_dict` returns `data` itself (with timestamps as strings) while the object is not modified.
+        """
+        obj = cls.__new__(cls)
+        if lazy:
+            fields_set = set(data)
+            for alias, name in _aliases(cls).items():
+                if alias in fields_set:
+                    fields_set.remove(alias)
+                    fields_set.add(name)
+            object.__setattr__(obj, "__dict__", {})
+            object.__setattr__(obj, "__fields_set__", fields_set)
+            obj._init_private_attributes()
+            obj._lazy = _LazyState(data)
+            return obj
+
+        values = {}
+        fields_set = set()
+        for name, (alias, converter, default) in cls._trusted_fields(False).items():
+            value = data.get(alias, _MISSING)
+            if value is _MISSING:
+                if default is not None:
+                    values[name] = default()
+                continue
+            values[name] = converter(value) if converter is not None and value is not None else value
+            fields_set.add(name)
+        if len(fields_set) < len(data):
+            for key in data.keys() - {field.alias for field in cls.__fields__.values()}:
+                values[key] = _convert_extra(data[key])
+                fields_set.add(key)
+        object.__setattr__(obj, "__dict__", values)
+        object.__setattr__(obj, "__fields_set__", fields_set)
+        obj._init_private_attributes()
+        return obj
+
+    @classmethod
+    def _trusted_fields(cls, lazy: bool) -> Dict[str, TrustedField]:
+        fields = _trusted_fields.get((cls, lazy))
+        if fields is None:
+            fields = _trusted_fields[(cls, lazy)] = {
+                field.name: (
+                    field.alias,
+                    _field_converter(field, lazy),
+                    None if field.required else _field_default(field, lazy),
+                )
+                for field in cls.__fields__.values()
+            }
+        return fields
+
+    def defer_field(self, name: str, raw: bytes):
+        """Keep a field as encoded JSON, it is decoded and built when first accessed."""
+        self.__dict__.pop(name, None)
+        if self._deferred is None:
+            self._deferred = {}
+        self._deferred[name] = raw
+
+    def _undefer(self, name: str) -> Any:
+        """Decode a deferred field, lazy objects get it back in their data."""
+        value = json_codec.loads(self._deferred.pop(name))
+        if self._lazy is not None:
+            field = self.__fields__.get(name)
+            self._lazy.data[field.alias if field else name] = value
+        return value
+
+    def _build(self, name: str) -> Any:
+        """Build a field of a lazy object or a deferred field, `_MISSING` if it has no such field."""
+        if self._deferred and name in self._deferred:
+            raw = self._undefer(name)
+            if self._lazy is None:
+                field = self._trusted_fields(False).get(name)
+                converter = field[1] if field else _convert_extra
+                value = self.__dict__[name] = converter(raw) if converter is not None and raw is not None else raw
+                return value
+        lazy = self._lazy
+        if lazy is None or lazy.complete:
+            return _MISSING
+        field = self._trusted_fields(True).get(name)
+        if field is None:
+            if name not in lazy.data or name in self.__fields__ or name in _aliases(type(self)):
+                return _MISSING
+            raw = lazy.data[name]
+            value = _convert_extra(raw, lazy=True)
+        else:
+            alias, converter, default = field
+            raw = lazy.data.get(alias, _MISSING)
+            if raw is _MISSING:
+                if default is None:
+                    return _MISSING
+                value = default()
+            else:
+                value = converter(raw) if converter is not None and raw is not None else raw
+        if value is not raw:
+            lazy.track(value)
+        self.__dict__[name] = value
+        return value
+
+    def _materialize(self):
+        """Build all fields of a lazy object and the deferred fields."""
+        if self._deferred:
+            for name in list(self._deferred):
+                self._build(name)
+        lazy = self._lazy
+        if lazy is None or lazy.complete:
+            return
+        values = {}
+        for name in list(self.__fields__) + [key for key in lazy.data if key not in _aliases(type(self))]:
+            value = self.__dict__[name] if name in self.__dict__ else self._build(name)
+            if value is not _MISSING:
+                values[name] = value
+        for name, value in self.__dict__.items():
+            values.setdefault(name, value)
+        object.__setattr__(self, "__dict__", values)
+        lazy.complete = True
+
+    def _is_unmodified(self) -> bool:
+        """Whether a lazy object and its built children are unchanged since they were built."""
+        lazy = self._lazy
+        if lazy is None or lazy.modified:
+            return False
+        if self._deferred:
+            for name in list(self._deferred):
+                self._undefer(name)
+        return lazy.unchanged() and _is_unmodified(self.__dict__)
+
     def _update_attrs(self, data: dict | ResourceValue):
         data = self.validate(data)
         for key in data.__fields__:
             setattr(self, key, getattr(data, key))
         return self
 
+    def _iter(self, *args, **kwargs):
+        self._materialize()
+        return super()._iter(*args, **kwargs)
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def __getstate__(self):
+        self._materialize()
+        state = super().__getstate__()
+        state["__private_attribute_values__"].pop("_lazy", None)
+        state["__private_attribute_values__"].pop("_deferred", None)
+        return state
+
+    def copy(self, **kwargs) -> Self:
+        self._materialize()
+        obj = super().copy(**kwargs)
+        obj._lazy = None
+        obj._deferred = None
+        return obj
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.__private_attributes__:
+            return
+        if self._deferred:
+            self._deferred.pop(name, None)
+        if self._lazy is not None:
+            self._lazy.modified = True
+
     def __str__(self):
         return "{}:\n  {}".format(self.__class__.__name__, "  ".join(yaml.safe_dump(self.dict()).splitlines(True)))
 
     def __getattr__(self, name: str) -> Any:
-        return None
+        if name in self.__private_attributes__:
+            return None
+        value = self._build(name)
+        return None if value is _MISSING else value
 
     def __getitem__(self, name: str):
+        if name not in self.__dict__:
+            self._build(name)
         return self.__dict__[name]
 
     def __setitem__(self, name: str, value: Any):
         setattr(self, name, value)
 
     def keys(self):
+        self._materialize()
         return self.__dict__.keys()
 
     def to_dict(self):
-        """Convert to dict."""
+        """Convert to dict, lazy objects return their original dict when not modified."""
+        if self._is_unmodified():
+            return self._lazy.data
         return self.dict()
 
     def to_str(self):
@@ -88,7 +280,110 @@ def to_str(self):
 
     def get(self, name: str, default: Any = None):
         """Same as dict.get."""
+        if name not in self.__dict__:
+            self._build(name)
         return self.__dict__.get(name, default)
 
     def __contains__(self, m):
-        return m in self.__dict__
+        return m in self.__dict__ or self._build(m) is not _MISSING
+
+
+class _LazyState:
+    """Decoded data of a lazy object and the containers built from it."""
+
+    __slots__ = ("data", "complete", "modified", "containers")
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.complete = False
+        self.modified = False
+        self.containers: List[Tuple[Any, Any]] = []
+
+    def track(self, value: Any):
+        """Remember the content of built lists and dicts to detect in place changes."""
+        if isinstance(value, list):
+            self.containers.append((value, list(value)))
+            nested = value
+        elif isinstance(value, dict):
+            self.containers.append((value, dict(value)))
+            nested = value.values()
+        else:
+            return
+        for item in nested:
+            self.track(item)
+
+    def unchanged(self) -> bool:
+        for container, snapshot in self.containers:
+            if len(container) != len(snapshot):
+                return False
+            if isinstance(container, list):
+                if any(a is not b for a, b in zip(container, snapshot)):
+                    return False
+            elif any(key not in container or container[key] is not value for key, value in snapshot.items()):
+                return False
+        return True
+
+    def __deepcopy__(self, memo: dict) -> None:
+        return None
+
+
+def _is_unmodified(value: Any) -> bool:
+    if isinstance(value, ResourceValue):
+        return value._is_unmodified()
+    if isinstance(value, list):
+        return all(_is_unmodified(item) for item in value)
+    if isinstance(value, dict):
+        return all(_is_unmodified(item) for item in value.values())
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _aliases(cls: type) -> Dict[str, str]:
+    """Field names by alias, for fields with an alias."""
+    return {field.alias: field.name for field in cls.__fields__.values() if field.alias != field.name}
+
+
+def _convert_extra(value: Any, lazy: bool = False) -> Any:
+    if isinstance(value, dict):
+        return ResourceValue.from_trusted(value, lazy)
+    if isinstance(value, list):
+        return [_convert_extra(item, lazy) for item in value]
+    return value
+
+
+def _field_converter(field: ModelField, lazy: bool = False) -> Converter:
+    """Converter building the value of a field from trusted data, `None` keeps the value as is."""
+    type_ = field.type_
+    if isinstance(type_, type) and issubclass(type_, ResourceValue):
+
+        def convert(value: Any) -> Any:
+            return type_.from_trusted(value, lazy) if isinstance(value, dict) else value
+
+    elif type_ is datetime:
+
+        def convert(value: Any) -> Any:
+            return parse_datetime(value) if isinstance(value, str) else value
+
+    else:
+        return None
+
+    if field.shape == SHAPE_SINGLETON:
+        return convert
+    if field.shape in (SHAPE_LIST, SHAPE_SEQUENCE):
+        return lambda value: [convert(item) for item in value]
+    if field.shape in (SHAPE_DICT, SHAPE_MAPPING):
+        return lambda value: {key: convert(item) for key, item in value.items()}
+    return None
+
+
+def _field_default(field: ModelField, lazy: bool = False) -> Callable[[], Any]:
+    """Default of a field, nested models are built with `from_trusted` instead of being validated."""
+    type_ = field.type_
+    if (
+        field.default_factory is not None
+        and field.shape == SHAPE_SINGLETON
+        and isinstance(type_, type)
+        and issubclass(type_, ResourceValue)
+    ):
+        return lambda: type_.from_trusted({}, lazy)
+    return field.get_default
@@ -8,9 +8,13 @@
 from .resource_item import ResourceItem
 
 if TYPE_CHECKING:
-    from .all import V1StatefulSetSpec, V1StatefulSetStatus
+    from .groups.apps_v1 import V1StatefulSetSpec, V1StatefulSetStatus
 
 
 class V1StatefulSet(ResourceItem):
     spec: V1StatefulSetSpec = Field(default_factory=lambda: get_default("V1StatefulSetSpec"))
     status: V1StatefulSetStatus = Field(default_factory=lambda: get_default("V1StatefulSetStatus"))
+
+
+# resolves the forward references above
+from .groups import apps_v1  # noqa: E402, F401
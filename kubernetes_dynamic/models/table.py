@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import Field
+
+from .common import V1ListMeta
+from .resource_item import ResourceItem
+from .resource_value import ResourceValue
+
+
+class V1TableColumnDefinition(ResourceValue):
+    description: Optional[str] = None
+    format: Optional[str] = None
+    name: str = ""
+    priority: int = 0
+    type: Optional[str] = None
+
+
+class V1TableRow(ResourceValue):
+    cells: List[Any] = Field(default_factory=list)
+    conditions: List[Dict[str, Any]] = Field(default_factory=list)
+    object: Optional[Dict[str, Any]] = None
+
+
+class V1Table(ResourceItem):
+    """Server side table output, the rows only contain the cells of the columns."""
+
+    columnDefinitions: List[V1TableColumnDefinition] = Field(default_factory=list)
+    metadata: V1ListMeta = Field(default_factory=lambda: V1ListMeta())
+    rows: List[V1TableRow] = Field(default_factory=list)
+
+    @classmethod
+    def get_defaults(cls):
+        return {"kind": "Table", "apiVersion": "meta.k8s.io/v1"}
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names."""
+        return [column.name for column in self.columnDefinitions]
+
+    def records(self, priority: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rows as dicts by column name, only the columns up to `priority` when given (0 is the default view)."""
+        indexes = [
+            index
+            for index, column in enumerate(self.columnDefinitions)
+            if priority is None or column.priority <= priority
+        ]
+        columns = self.columns
+        return [{columns[index]: row.cells[index] for index in indexes} for row in self.rows]
+
+
+# resolves the forward references above
+from .groups import meta_v1  # noqa: E402, F401
@@ -4,9 +4,13 @@
 from types import NoneType
 from typing import (
     Any,
+    Callable,
+    Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -16,12 +20,18 @@
 from typing_extensions import Protocol
 
 from kubernetes_dynamic.events import Watch
+from kubernetes_dynamic.formatters import SelectorTypes
 from kubernetes_dynamic.models.resource_value import ResourceValue
 
 if typing.TYPE_CHECKING:
+    from kubernetes_dynamic.backoff import Backoff
     from kubernetes_dynamic.client import K8sClient
-    from kubernetes_dynamic.events import Event
+    from kubernetes_dynamic.events import Event, EventBuffer, FieldChanged
+    from kubernetes_dynamic.informer import Informer
     from kubernetes_dynamic.models.common import ItemList
+    from kubernetes_dynamic.models.resource_item import CheckResult
+    from kubernetes_dynamic.models.table import V1Table
+    from kubernetes_dynamic.watch_hub import Subscription
 
 
 R = TypeVar("R", bound=ResourceValue)
@@ -99,6 +109,34 @@ def get(self, name: Optional[str] = None, namespace: Optional[str] = None, **kwa
     def find(self, pattern: str, namespace: Optional[str] = None, **kwargs) -> list[R]:
         return self.client.find(self, pattern, namespace, **kwargs)  # pragma: no cover
 
+    def iterate(
+        self,
+        namespace: Optional[str] = None,
+        page_size: int = 500,
+        label_selector: SelectorTypes = None,
+        field_selector: SelectorTypes = None,
+        on_expired: str = "restart",
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[R]:
+        yield from self.client.iterate(
+            self, namespace, page_size, label_selector, field_selector, on_expired, prefetch, **kwargs
+        )  # pragma: no cover
+
+    def table(
+        self,
+        name: Optional[str] = None,
+        namespace: Optional[str] = None,
+        label_selector: SelectorTypes = None,
+        field_selector: SelectorTypes = None,
+        include_object: Optional[str] = "None",
+        page_size: Optional[int] = None,
+        **kwargs,
+    ) -> V1Table:
+        return self.client.table(
+            self, name, namespace, label_selector, field_selector, include_object, page_size, **kwargs
+        )  # pragma: no cover
+
     def create(self, body: dict | R, namespace: Optional[str] = None, **kwargs) -> R:
         return self.client.create(self, body, namespace, **kwargs)  # pragma: no cover
 
@@ -162,11 +200,104 @@ def watch(
         resource_version: Optional[str] = None,
         timeout: Optional[float] = None,
         watcher: Optional[Watch] = None,
+        metadata_only: bool = False,
+        send_initial_events: bool = False,
+        reconnect: bool = False,
+        deadline: Optional[float] = None,
+        backoff: Optional[Backoff] = None,
+        predicates: Optional[Sequence[FieldChanged]] = None,
     ) -> Iterator[Event[R]]:
         yield from self.client.watch(
-            self, namespace, name, label_selector, field_selector, resource_version, timeout, watcher
+            self,
+            namespace,
+            name,
+            label_selector,
+            field_selector,
+            resource_version,
+            timeout,
+            watcher,
+            metadata_only,
+            send_initial_events,
+            reconnect,
+            deadline,
+            backoff,
+            predicates,
+        )  # pragma: no cover
+
+    def watch_in_background(
+        self,
+        namespace: Optional[str] = None,
+        *args,
+        max_queued: int = 1000,
+        overflow: str = "block",
+        callback: Optional[Callable[[Event[R]], None]] = None,
+        **kwargs,
+    ) -> EventBuffer[R]:
+        return self.client.watch_in_background(
+            self, namespace, *args, max_queued=max_queued, overflow=overflow, callback=callback, **kwargs
+        )  # pragma: no cover
+
+    def informer(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: SelectorTypes = None,
+        field_selector: SelectorTypes = None,
+        start: bool = True,
+        **kwargs,
+    ) -> Informer[R]:
+        return self.client.informer(
+            self, namespace, label_selector, field_selector, start, **kwargs
+        )  # pragma: no cover
+
+    def enable_lister(
+        self, namespace: Optional[str] = None, wait: bool = True, timeout: Optional[float] = None, **kwargs
+    ) -> Informer[R]:
+        return self.client.enable_lister(self, namespace, wait, timeout, **kwargs)  # pragma: no cover
+
+    def disable_lister(self) -> None:
+        return self.client.disable_lister(self)  # pragma: no cover
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        return self.client.wait_for_sync(self, timeout)  # pragma: no cover
+
+    def subscribe(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: SelectorTypes = None,
+        field_selector: SelectorTypes = None,
+        callback: Optional[Callable[[Event[R]], None]] = None,
+        max_queued: int = 1000,
+        overflow: str = "error",
+        **kwargs,
+    ) -> Subscription[R]:
+        return self.client.subscribe(
+            self, namespace, label_selector, field_selector, callback, max_queued, overflow, **kwargs
         )  # pragma: no cover
 
+    def wait_until_all(
+        self,
+        items: Optional[Iterable[R | str]] = None,
+        *,
+        namespace: Optional[str] = None,
+        check: Optional[Callable[[Event[R]], CheckResult]] = None,
+        label_selector: SelectorTypes = None,
+        field_selector: SelectorTypes = None,
+        timeout: float = 30,
+    ) -> Dict[str, Event[R]]:
+        ...  # pragma: no cover
+
+    def wait_until_any(
+        self,
+        items: Optional[Iterable[R | str]] = None,
+        *,
+        namespace: Optional[str] = None,
+        check: Optional[Callable[[Event[R]], CheckResult]] = None,
+        label_selector: SelectorTypes = None,
+        field_selector: SelectorTypes = None,
+        timeout: float = 30,
+    ) -> Event[R]:
+        ...  # pragma: no cover
+
     def validate(self, definition: dict, version: Optional[str] = None, strict: bool = False) -> Tuple[List, List]:
         ...  # pragma: no cover
 
@@ -0,0 +1,177 @@
+"""Watch hubs: one upstream watch of a collection, fanned out to any number of subscribers.
+
+A hub watches a collection once and hands every decoded `Event` to each of its subscribers, so parts of a
+process watching the same resource, namespace and selectors share one stream and one decoding. Subscribers
+iterate their `Subscription` or pass a callback, which is called from a thread of its own. Every subscriber
+has a bounded queue: by default one which falls behind by more than `max_queued` events is disconnected with a
+`WatchOverflowError`, like the apiserver does with slow watchers, instead of holding up the others. It can also
+drop its oldest events or coalesce the events of each object, see `EventBuffer`; a coalescing queue full of
+other objects is disconnected as well. The
+upstream watch starts with the first subscriber and stops when the last one leaves. Use `K8sClient.subscribe`
+to share hubs within a process.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import typing
+from typing import Callable, Generic, List, Optional, TypeVar
+
+from .events import Event, EventBuffer, Watch
+from .exceptions import InvalidParameter, WatchOverflowError
+from .models.resource_value import ResourceValue
+
+if typing.TYPE_CHECKING:
+    from .client import K8sClient
+    from .resource_api import ResourceApi
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R", bound=ResourceValue)
+
+
+class Subscription(EventBuffer[R]):
+    """Events of a hub for one subscriber, iterate it until the subscription is closed."""
+
+    def __init__(self, hub: WatchHub[R], max_queued: int = 1000, overflow: str = "error"):
+        if overflow == "block":
+            raise InvalidParameter("Subscribers of a watch hub cannot block it")
+        super().__init__(max_queued, overflow)
+        self.hub = hub
+
+    def close(self) -> None:
+        """Leave the hub, queued events can still be iterated."""
+        self.hub.unsubscribe(self)
+
+
+class WatchHub(Generic[R]):
+    def __init__(
+        self,
+        client: K8sClient,
+        resource: ResourceApi[R],
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        watch_timeout: int = 60,
+    ):
+        """Share one watch of a collection between subscribers.
+
+        Args:
+            client: Client to watch with.
+            resource: Resource of the collection.
+            namespace: Namespace of a namespaced resource, None for cluster resources.
+            label_selector: Label selector of the collection.
+            field_selector: Field selector of the collection.
+            watch_timeout: Seconds of a single watch request, the watch reconnects after each.
+        """
+        self.client = client
+        self.resource = resource
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.watch_timeout = watch_timeout
+        self._subscriptions: List[Subscription[R]] = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watcher: Optional[Watch] = None
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        callback: Optional[Callable[[Event[R]], None]] = None,
+        max_queued: int = 1000,
+        overflow: str = "error",
+    ) -> Optional[Subscription[R]]:
+        """Receive the events from now on, through the returned subscription or `callback`.
+
+        A callback is called from a thread of the subscription, one event at a time. `overflow` is the policy of
+        the subscriber's queue, any of `EventBuffer` but "block". A "coalesce" queue full of other objects is
+        disconnected like with "error". The upstream watch starts with the first
+        subscriber. Returns None when the hub has already stopped.
+        """
+        subscription = Subscription(self, max_queued, overflow)
+        with self._lock:
+            if self.stopped:
+                return None
+            self._subscriptions.append(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"kubernetes-dynamic-watch-hub-{self.resource.kind}", daemon=True
+                )
+                self._thread.start()
+        if callback:
+            subscription.dispatch(callback, name=f"kubernetes-dynamic-watch-subscriber-{self.resource.kind}")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription[R]) -> None:
+        """End a subscription, the upstream watch stops when the last subscriber leaves."""
+        subscription._end()
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            if not self._subscriptions:
+                self._stop()
+
+    def stop(self) -> None:
+        """Stop the upstream watch and end every subscription."""
+        with self._lock:
+            self._stop()
+
+    def _stop(self, error: Optional[BaseException] = None) -> None:
+        self._stopped.set()
+        if self._watcher:
+            self._watcher.stop()
+        for subscription in self._subscriptions:
+            subscription._end(error)
+        self._subscriptions.clear()
+
+    def _run(self):
+        self._watcher = Watch(
+            self.client.client,
+            self.resource._resource_type,
+            trusted=self.client.trusted,
+            lazy=self.client.lazy,
+            managed_fields=self.client.managed_fields,
+        )
+        try:
+            # start from the current state, existing objects are not replayed as ADDED events
+            resource_version = self.client.read(
+                self.resource,
+                namespace=self.namespace,
+                label_selector=self.label_selector,
+                field_selector=self.field_selector,
+                limit=1,
+                metadata_only=True,
+            ).metadata.resourceVersion
+            for event in self.client.watch(
+                self.resource,
+                self.namespace,
+                label_selector=self.label_selector,
+                field_selector=self.field_selector,
+                resource_version=resource_version,
+                timeout=self.watch_timeout,
+                watcher=self._watcher,
+                reconnect=True,
+            ):
+                if self.stopped:
+                    break
+                with self._lock:
+                    subscriptions = list(self._subscriptions)
+                # delivered outside of the lock, a full subscription is disconnected rather than waited for
+                for subscription in subscriptions:
+                    if subscription.put(event, block=False) or not isinstance(subscription._error, WatchOverflowError):
+                        continue
+                    logger.warning("Subscriber of the %s watch hub fell behind, disconnecting it", self.resource.kind)
+                    self.unsubscribe(subscription)
+        except Exception as e:  # noqa: B902
+            logger.exception("Watch hub of %s failed", self.resource.kind)
+            with self._lock:
+                self._stop(e)
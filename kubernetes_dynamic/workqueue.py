@@ -0,0 +1,284 @@
+"""Rate limited work queues for controllers, with the semantics of client-go's workqueue.
+
+A `WorkQueue` holds keys of objects ("namespace/name") to reconcile. A key is queued at most once: adding it
+again while it is waiting, like for a burst of MODIFIED events, has no effect, and adding it while it is being
+processed queues it again once it is done, so one key is never processed by two workers at the same time.
+Failed keys are retried with `add_rate_limited`, delayed by the larger of a per-key exponential backoff and an
+overall token bucket, see `RateLimiter`. A delayed key also waits only once, until the earliest time it was
+added for. `run_workers` runs a reconcile function on a pool of threads.
+"""
+from __future__ import annotations
+
+import collections
+import heapq
+import logging
+import threading
+import time
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+
+from .backoff import Backoff
+from .client import object_key
+from .events import Event
+from .models.resource_value import ResourceValue
+
+logger = logging.getLogger(__name__)
+
+Key = Union[str, Event, ResourceValue]
+
+
+def key_of(item: Key) -> str:
+    """Queue key of an object, an event of it or the key itself."""
+    if isinstance(item, str):
+        return item
+    if isinstance(item, Event):
+        return object_key(item.object)
+    return object_key(item)
+
+
+class TokenBucket:
+    def __init__(self, rate: float = 10.0, burst: int = 100):
+        """Token bucket refilled with `rate` tokens per second, holding up to `burst` tokens."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returns the delay in seconds until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+class RateLimiter:
+    def __init__(self, backoff: Optional[Backoff] = None, bucket: Optional[TokenBucket] = None):
+        """Delays of retries: the larger of a per-key exponential backoff and an overall token bucket.
+
+        Args:
+            backoff: Delays by the number of failures of a key, 5ms doubling up to 1000s without jitter by default.
+            bucket: Limits the retries of all keys, 10 per second with bursts of 100 by default.
+        """
+        self.backoff = backoff or Backoff(initial=0.005, maximum=1000, jitter=0)
+        self.bucket = bucket or TokenBucket()
+        self._failures: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def when(self, key: str) -> float:
+        """Count a failure of `key` and return the delay before its retry."""
+        with self._lock:
+            failures = self._failures[key] = self._failures.get(key, 0) + 1
+        return max(self.backoff.delay(failures), self.bucket.reserve())
+
+    def forget(self, key: str) -> None:
+        """Start the backoff of `key` over."""
+        with self._lock:
+            self._failures.pop(key, None)
+
+    def retries(self, key: str) -> int:
+        return self._failures.get(key, 0)
+
+
+class WorkQueue:
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None, name: Optional[str] = None):
+        """Queue of keys to reconcile.
+
+        Args:
+            rate_limiter: Delays of `add_rate_limited`.
+            name: Name of the queue, used for worker threads and logs.
+        """
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.name = name or "workqueue"
+        self._queue: Deque[str] = collections.deque()
+        self._dirty: Set[str] = set()
+        self._processing: Set[str] = set()
+        # delayed keys: (ready at, sequence, key), entries replaced by an earlier one are skipped
+        self._waiting: List[Tuple[float, int, str]] = []
+        self._waiting_at: Dict[str, float] = {}
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._shutting_down = False
+        self._added_at: Dict[str, float] = {}
+        self._started_at: Dict[str, float] = {}
+        self._adds = 0
+        self._retries = 0
+        self._queue_latency = [0.0, 0.0, 0]  # total, max, count
+        self._work_duration = [0.0, 0.0, 0]
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def shutting_down(self) -> bool:
+        return self._shutting_down
+
+    def add(self, item: Key) -> None:
+        """Queue a key, unless it is already waiting to be processed."""
+        with self._condition:
+            self._add(key_of(item))
+
+    def add_after(self, item: Key, delay: float) -> None:
+        """Queue a key after `delay` seconds, or earlier when it is already waiting for less."""
+        if delay <= 0:
+            self.add(item)
+            return
+        key = key_of(item)
+        with self._condition:
+            if self._shutting_down:
+                return
+            ready_at = time.monotonic() + delay
+            waiting_at = self._waiting_at.get(key)
+            if waiting_at is not None and waiting_at <= ready_at:
+                return
+            self._waiting_at[key] = ready_at
+            self._sequence += 1
+            heapq.heappush(self._waiting, (ready_at, self._sequence, key))
+            self._condition.notify()
+
+    def add_rate_limited(self, item: Key) -> None:
+        """Queue a key again after the delay of the rate limiter, for retries."""
+        key = key_of(item)
+        with self._condition:
+            self._retries += 1
+        self.add_after(key, self.rate_limiter.when(key))
+
+    def forget(self, item: Key) -> None:
+        """Stop tracking the retries of a key, call it once the key was processed successfully."""
+        self.rate_limiter.forget(key_of(item))
+
+    def retries(self, item: Key) -> int:
+        return self.rate_limiter.retries(key_of(item))
+
+    def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Take the next key to process, None once the queue is shut down and empty, or after `timeout`.
+
+        Every key taken must be marked with `done` once processed.
+        """
+        end = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._waiting and self._waiting[0][0] <= now:
+                    ready_at, _, key = heapq.heappop(self._waiting)
+                    if self._waiting_at.get(key) == ready_at:
+                        del self._waiting_at[key]
+                        self._add(key)
+                if self._queue:
+                    break
+                if self._shutting_down:
+                    return None
+                wait = self._waiting[0][0] - now if self._waiting else None
+                if end is not None:
+                    if now >= end:
+                        return None
+                    wait = min(wait, end - now) if wait is not None else end - now
+                self._condition.wait(wait)
+            key = self._queue.popleft()
+            self._dirty.discard(key)
+            self._processing.add(key)
+            self._observe(self._queue_latency, now - self._added_at.pop(key, now))
+            self._started_at[key] = now
+            return key
+
+    def done(self, key: str) -> None:
+        """Mark a key as processed, it is queued again when it was added meanwhile."""
+        with self._condition:
+            self._processing.discard(key)
+            started_at = self._started_at.pop(key, None)
+            if started_at is not None:
+                self._observe(self._work_duration, time.monotonic() - started_at)
+            if key in self._dirty:
+                self._queue.append(key)
+                self._condition.notify()
+
+    def shut_down(self) -> None:
+        """Ignore new keys, `get` returns the queued ones and then None. Delayed keys are dropped."""
+        with self._condition:
+            self._shutting_down = True
+            self._waiting.clear()
+            self._waiting_at.clear()
+            self._condition.notify_all()
+
+    def metrics(self) -> Dict[str, float]:
+        """Depth, counters and latencies of the queue.
+
+        `queue_latency` is the time keys waited in the queue before being taken, `work_duration` the time they
+        were processed until `done`, both in seconds.
+        """
+        with self._condition:
+            now = time.monotonic()
+            latency_total, latency_max, latency_count = self._queue_latency
+            work_total, work_max, work_count = self._work_duration
+            return {
+                "depth": len(self._queue),
+                "waiting": len(self._waiting_at),
+                "processing": len(self._processing),
+                "adds": self._adds,
+                "retries": self._retries,
+                "queue_latency_seconds_avg": latency_total / latency_count if latency_count else 0.0,
+                "queue_latency_seconds_max": latency_max,
+                "work_duration_seconds_avg": work_total / work_count if work_count else 0.0,
+                "work_duration_seconds_max": work_max,
+                "longest_running_seconds": max((now - start for start in self._started_at.values()), default=0.0),
+            }
+
+    def _add(self, key: str) -> None:
+        if self._shutting_down or key in self._dirty:
+            return
+        self._adds += 1
+        self._dirty.add(key)
+        self._added_at.setdefault(key, time.monotonic())
+        if key not in self._processing:
+            self._queue.append(key)
+            self._condition.notify()
+
+    @staticmethod
+    def _observe(stats: list, value: float) -> None:
+        stats[0] += value
+        stats[1] = max(stats[1], value)
+        stats[2] += 1
+
+
+def run_workers(
+    queue: WorkQueue,
+    reconcile: Callable[[str], Optional[float]],
+    workers: int = 2,
+    max_retries: Optional[int] = None,
+) -> List[threading.Thread]:
+    """Process the keys of `queue` with `reconcile` on `workers` threads, until the queue is shut down.
+
+    `reconcile(key)` may return a number of seconds after which the key is reconciled again. When it raises,
+    the key is retried with the rate limiter of the queue, at most `max_retries` times when given.
+    """
+
+    def work():
+        while True:
+            key = queue.get()
+            if key is None:
+                return
+            try:
+                requeue_after = reconcile(key)
+            except Exception:  # noqa: B902
+                if max_retries is not None and queue.retries(key) >= max_retries:
+                    logger.exception("Reconciling %s failed %d times, dropping it", key, max_retries + 1)
+                    queue.forget(key)
+                else:
+                    logger.exception("Reconciling %s failed, retrying", key)
+                    queue.add_rate_limited(key)
+            else:
+                queue.forget(key)
+                if requeue_after is not None:
+                    queue.add_after(key, requeue_after)
+            finally:
+                queue.done(key)
+
+    threads = [
+        threading.Thread(target=work, name=f"kubernetes-dynamic-{queue.name}-worker-{index}", daemon=True)
+        for index in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads
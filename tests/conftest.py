@@ -4,6 +4,14 @@
 from pytest_mock import MockerFixture
 
 import kubernetes_dynamic._kubernetes
+from kubernetes_dynamic.client import reset_shared_clients
+
+
+@pytest.fixture(autouse=True)
+def reset_clients():
+    reset_shared_clients()
+    yield
+    reset_shared_clients()
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,44 @@
+"""Objects and responses shared by the tests of the client, informers and watch hubs."""
+import json
+import time
+from typing import Optional
+from unittest.mock import MagicMock
+
+from kubernetes_dynamic.models.pod import V1Pod
+
+
+def pods_api():
+    """Pods resource, watches are requested with `get`, other requests go through `client.call_api`."""
+    return MagicMock(namespaced=True, _resource_type=V1Pod, kind="Pod", group_version="v1")
+
+
+def pod(name, resource_version="1", namespace="ns", ready: Optional[bool] = None):
+    metadata = {"name": name, "namespace": namespace, "resourceVersion": resource_version}
+    data = {"kind": "Pod", "apiVersion": "v1", "metadata": metadata}
+    if ready is not None:
+        data["status"] = {"conditions": [{"type": "Ready", "status": "True" if ready else "False"}]}
+    return data
+
+
+def pod_list(*pods, resource_version="10", continue_token=None):
+    """Response of a list request."""
+    metadata = {"resourceVersion": resource_version}
+    if continue_token:
+        metadata["continue"] = continue_token
+    data = {"kind": "PodList", "apiVersion": "v1", "metadata": metadata, "items": list(pods)}
+    return MagicMock(data=json.dumps(data))
+
+
+def watch_response(*events):
+    """Response of a watch request, events are `(type, object)` pairs or objects, which are MODIFIED."""
+    pairs = [event if isinstance(event, tuple) else ("MODIFIED", event) for event in events]
+    resp = MagicMock()
+    resp.__iter__.return_value = [json.dumps({"type": type_, "object": obj}) for type_, obj in pairs]
+    return resp
+
+
+def wait_for(condition, timeout=5):
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    assert condition()
@@ -0,0 +1,23 @@
+from unittest.mock import MagicMock
+
+from kubernetes_dynamic.backoff import Backoff, retry_after
+
+
+def test_backoff():
+    backoff = Backoff(initial=1, maximum=5, factor=2, jitter=0)
+    assert [backoff.next() for _ in range(5)] == [1, 2, 4, 5, 5]
+    backoff.reset()
+    assert backoff.next() == 1
+    assert backoff.delay(3) == 4
+
+
+def test_backoff_jitter(mocker):
+    mocker.patch("kubernetes_dynamic.backoff.random.random", return_value=0.5)
+    backoff = Backoff(initial=1, maximum=5, factor=2, jitter=0.5)
+    assert [backoff.next() for _ in range(4)] == [1.25, 2.5, 5, 5]
+
+
+def test_retry_after():
+    assert retry_after(MagicMock(headers={"Retry-After": "3"})) == 3
+    assert retry_after(MagicMock(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) is None
+    assert retry_after(MagicMock(headers=None)) is None
@@ -1,3 +1,7 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -6,18 +10,27 @@
 from kubernetes import dynamic
 from kubernetes.config import ConfigException
 
+import kubernetes_dynamic
 from kubernetes_dynamic.client import (
     ConflictError,
     K8sClient,
     NotFoundError,
     ResourceNotUniqueError,
     UnprocessibleEntityError,
+    reset_shared_clients,
+    serialize_object,
+    set_shared_client,
+    shared_client,
 )
-from kubernetes_dynamic.events import Event
-from kubernetes_dynamic.exceptions import InvalidParameter
+from kubernetes_dynamic.events import GENERATION_CHANGED, Event, Watch
+from kubernetes_dynamic.exceptions import ApiException, EventTimeoutError, InternalServerError, InvalidParameter
 from kubernetes_dynamic.formatters import format_selector
+from kubernetes_dynamic.models.partial_object_metadata import V1PartialObjectMetadata
 from kubernetes_dynamic.models.pod import V1Pod
+from kubernetes_dynamic.models.resource_item import ResourceItem
 from kubernetes_dynamic.models.resource_value import ResourceValue
+from kubernetes_dynamic.models.table import V1Table
+from tests.factories import pod, pod_list, pods_api, wait_for, watch_response
 
 
 def resource_api(namespaced=True, obj_type=None):
@@ -249,12 +262,13 @@ def test_k8s_client_watch(mock_request: MagicMock):
         '{"type": "ADDED", "object": {"apiVersion": "v1", "kind": "A", "data": 1}}',
         '{"type": "DELETED", "object": {"apiVersion": "v1", "kind": "A", "data": 1}}',
         '{"type": "MODIFIED", "object": {"apiVersion": "v1", "kind": "A", "data": 1}}',
-        '{"type": "ERROR", "object": {"apiVersion": "v1", "kind": "A", "data": 1}}',
+        '{"type": "ERROR", "object": {"apiVersion": "v1", "kind": "Status", "code": 500, "message": "error"}}',
     ]
     api = resource_api(obj_type=ResourceValue)
     api.get.return_value = resp
-    for idx, item in enumerate(
-        K8sClient().watch(
+    events = []
+    with pytest.raises(InternalServerError):
+        for item in K8sClient().watch(
             api,
             "namespace",
             "name",
@@ -263,13 +277,58 @@ def test_k8s_client_watch(mock_request: MagicMock):
             "resource_version",
             "timeout",
             None,
-        )
-    ):
+        ):
+            events.append(item)
+    assert len(events) == 3
+    for idx, item in enumerate(events):
         assert item == pydantic.parse_raw_as(Event, resp.__iter__.return_value[idx])
         assert isinstance(item.object, ResourceValue)
         assert item.object.data == 1
 
 
+def test_k8s_client_watch_bookmarks():
+    resp = MagicMock()
+    resp.__iter__.return_value = [
+        '{"type": "ADDED", "object": {"apiVersion": "v1", "kind": "Pod", "metadata": {"resourceVersion": "1"}}}',
+        '{"type": "BOOKMARK", "object": {"apiVersion": "v1", "kind": "Pod", "metadata": {"resourceVersion": "5"}}}',
+    ]
+    api = resource_api(obj_type=V1Pod)
+    api.get.return_value = resp
+    watcher = Watch(None, V1Pod)
+    events = list(K8sClient().watch(api, "namespace", timeout=1, watcher=watcher))
+    assert [event.type for event in events] == ["ADDED"]
+    assert watcher.resource_version == "5"
+    assert api.get.call_args.kwargs["allow_watch_bookmarks"] is True
+
+
+def test_watch_resume_on_gone():
+    func = MagicMock()
+    func.return_value.metadata.resourceVersion = "7"
+    watcher = Watch(None, V1Pod)
+
+    def parse(resp):
+        if watcher.resource_version == "1":
+            raise ApiException(410)
+        watcher.stop()
+        yield from ()
+
+    watcher._parse_response_iter = parse
+    assert list(watcher.stream(func, resource_version="1", header_params={"Accept": "x"})) == []
+    assert watcher.resource_version == "7"
+    # only a single item is listed to get the current resource version
+    assert func.call_args_list[1].kwargs == {"serialize": True, "limit": 1}
+
+
+def test_k8s_client_request_query_params():
+    cl = K8sClient()
+    cl.request("get", "/api/v1/pods", label_selector="app=a", _continue="token", resource_version="1", serialize=False)
+    assert cl.client.call_api.call_args.args[3] == [
+        ("continue", "token"),
+        ("labelSelector", "app=a"),
+        ("resourceVersion", "1"),
+    ]
+
+
 def test_k8s_client_stream():
     method = MagicMock()
     method.return_value.data = MagicMock()
@@ -327,3 +386,396 @@ def test_k8s_client_apply(mocker, mock_resources):
     pod_api.create.side_effect = [ConflictError(MagicMock(name="pod-name")), expected]
     pod_api.patch.side_effect = UnprocessibleEntityError(MagicMock(name="pod-name"))
     assert cl.apply(data=[item]) == [expected]
+
+
+def test_shared_client():
+    cl = shared_client()
+    assert shared_client() is cl
+    assert shared_client(context="other") is not cl
+    assert ResourceItem().client is cl
+
+    other = K8sClient()
+    set_shared_client(other)
+    assert shared_client() is other
+    set_shared_client(None)
+    assert shared_client() is not other
+
+    reset_shared_clients()
+    assert shared_client() is not cl
+
+
+def test_module_client_follows_shared_client():
+    first = kubernetes_dynamic.cl
+    assert kubernetes_dynamic.cl is first is shared_client()
+
+    other = K8sClient()
+    set_shared_client(other)
+    assert kubernetes_dynamic.cl is other
+    reset_shared_clients()
+    assert kubernetes_dynamic.cl is not other
+    assert kubernetes_dynamic.cl is not first
+
+
+def test_shared_client_threads():
+    with ThreadPoolExecutor(8) as executor:
+        clients = list(executor.map(lambda _: shared_client(), range(32)))
+    assert all(cl is clients[0] for cl in clients)
+
+
+def test_k8s_client_get_api_cached(mock_resources: MagicMock):
+    mock_resources.get.return_value = MagicMock(kind="Pod", api_version="v1")
+    cl = K8sClient()
+    assert cl.pods is cl.pods
+    assert cl.get_api(kind="Pod", api_version="v1") is cl.get_api(kind="Pod", api_version="v1")
+    assert mock_resources.get.call_count == 2
+
+    assert cl.get_api("pods", object_type=V1Pod)._resource_type == V1Pod
+    assert cl.pods._resource_type == ResourceItem
+    assert mock_resources.get.call_count == 3
+
+    mock_resources._cache = {}
+    cl.pods
+    assert mock_resources.get.call_count == 4
+
+    cl.invalidate_cache()
+    mock_resources.invalidate_cache.assert_called_once()
+    cl.pods
+    assert mock_resources.get.call_count == 5
+
+
+def pod_page(names, token=None):
+    return pod_list(*(pod(name, namespace="namespace") for name in names), continue_token=token)
+
+
+def test_k8s_client_iterate(mock_request: MagicMock):
+    mock_request.side_effect = [pod_page(["a", "b"], "token"), pod_page(["c"])]
+    items = K8sClient().iterate(resource_api(), "namespace", page_size=2, label_selector={"app": "name"})
+    assert [item.metadata.name for item in items] == ["a", "b", "c"]
+    assert mock_request.call_args_list[0].kwargs["limit"] == 2
+    assert mock_request.call_args_list[0].kwargs["_continue"] is None
+    assert mock_request.call_args_list[0].kwargs["label_selector"] == "app=name"
+    assert mock_request.call_args_list[1].kwargs["_continue"] == "token"
+
+
+def test_k8s_client_iterate_prefetch(mock_request: MagicMock):
+    mock_request.side_effect = [pod_page(["a"], "token"), pod_page(["b"], "token2"), pod_page(["c"])]
+    items = K8sClient().iterate(resource_api(), "namespace", page_size=1, prefetch=2)
+    assert [item.metadata.name for item in items] == ["a", "b", "c"]
+    assert mock_request.call_count == 3
+
+
+def test_k8s_client_iterate_expired_restart(mock_request: MagicMock):
+    mock_request.side_effect = [
+        pod_page(["a", "b"], "token"),
+        ApiException(status=410),
+        pod_page(["a", "b"], "token2"),
+        pod_page(["b2", "c"]),
+    ]
+    items = K8sClient().iterate(resource_api(), "namespace", page_size=2)
+    assert [item.metadata.name for item in items] == ["a", "b", "b2", "c"]
+    assert mock_request.call_args_list[2].kwargs["_continue"] is None
+
+
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_k8s_client_iterate_expired_raise(mock_request: MagicMock, prefetch: int):
+    mock_request.side_effect = [pod_page(["a"], "token"), ApiException(status=410)]
+    items = K8sClient().iterate(resource_api(), "namespace", on_expired="raise", prefetch=prefetch)
+    assert next(items).metadata.name == "a"
+    with pytest.raises(ApiException):
+        next(items)
+
+    with pytest.raises(InvalidParameter):
+        next(K8sClient().iterate(resource_api(), "namespace", on_expired="invalid"))
+
+
+def test_k8s_client_read_paginated(mock_request: MagicMock):
+    mock_request.side_effect = [pod_page(["a", "b"], "token"), pod_page(["c"])]
+    items = K8sClient().read(resource_api(), namespace="namespace", page_size=2, prefetch=1)
+    assert [item.metadata.name for item in items] == ["a", "b", "c"]
+    assert items.metadata.resourceVersion == "10"
+
+
+@pytest.mark.parametrize("trusted, lazy", [(False, False), (True, False), (False, True)])
+def test_serialize_object(trusted: bool, lazy: bool, mocker):
+    from_trusted = mocker.spy(V1Pod, "from_trusted")
+    data = {"kind": "PodList", "apiVersion": "v1", "metadata": {}, "items": [{"metadata": {"name": "pod-name"}}]}
+    items = serialize_object(data, trusted=trusted, lazy=lazy)
+    assert items == fake_pods()
+    assert isinstance(items[0], V1Pod)
+    assert from_trusted.called == (trusted or lazy)
+    assert (items[0].to_dict() is data["items"][0]) == lazy
+
+    pod_data = {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": "pod-name"}}
+    pod = serialize_object(pod_data, trusted=trusted, lazy=lazy)
+    assert pod == fake_pods()[0]
+
+
+def test_k8s_client_trusted(mocker):
+    serialize = mocker.patch("kubernetes_dynamic.client.serialize_object")
+    cl = K8sClient(trusted=True)
+    cl.client.call_api.return_value = MagicMock(data="{}")
+    cl.request("get", "path")
+    assert serialize.call_args.args[2] is True
+    cl.request("get", "path", trusted=False)
+    assert serialize.call_args.args[2] is False
+    assert serialize.call_args.args[3] is False
+    cl.request("get", "path", lazy=True)
+    assert serialize.call_args.args[3] is True
+    assert serialize.call_args.args[4] == "keep"
+    cl.request("get", "path", managed_fields="drop")
+    assert serialize.call_args.args[4] == "drop"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_serialize_object_managed_fields(lazy: bool):
+    def pod_list():
+        entry = {"manager": "kubelet", "operation": "Update", "fieldsType": "FieldsV1", "fieldsV1": {"f:status": {}}}
+        metadata = {"name": "pod-name", "managedFields": [entry]}
+        return {"kind": "PodList", "apiVersion": "v1", "metadata": {}, "items": [{"metadata": metadata}]}
+
+    kept = serialize_object(pod_list(), lazy=lazy)
+    assert kept[0].metadata.managedFields[0].manager == "kubelet"
+
+    dropped = serialize_object(pod_list(), lazy=lazy, managed_fields="drop")
+    assert dropped[0].metadata.managedFields == []
+    assert not dropped[0].to_dict()["metadata"].get("managedFields")
+
+    deferred = serialize_object(pod_list(), lazy=lazy, managed_fields="defer")
+    assert "managedFields" not in deferred[0].metadata.__dict__
+    assert deferred[0].to_dict() == kept[0].to_dict()
+    deferred = serialize_object(pod_list(), lazy=lazy, managed_fields="defer")
+    assert deferred[0].metadata.managedFields == kept[0].metadata.managedFields
+    assert deferred[0] == kept[0]
+
+    with pytest.raises(InvalidParameter):
+        serialize_object(pod_list(), managed_fields="other")
+    with pytest.raises(InvalidParameter):
+        K8sClient(managed_fields="other")
+
+
+@pytest.mark.parametrize("per_call", [False, True])
+@pytest.mark.parametrize("managed_fields", ["keep", "drop", "defer"])
+def test_k8s_client_watch_managed_fields(managed_fields: str, per_call: bool):
+    entry = {"manager": "kubelet", "operation": "Update", "fieldsType": "FieldsV1", "fieldsV1": {"f:status": {}}}
+    obj = pod("a", "11")
+    obj["metadata"]["managedFields"] = [entry]
+    api = pods_api()
+    api.get.return_value = watch_response(obj)
+    if per_call:
+        cl, kwargs = K8sClient(), {"managed_fields": managed_fields}
+    else:
+        cl, kwargs = K8sClient(managed_fields=managed_fields), {}
+
+    event = next(iter(cl.watch(api, "ns", timeout=1, **kwargs)))
+    assert ("managedFields" in event.raw_object["metadata"]) == (managed_fields == "keep")
+    # deferred fields are decoded on first access
+    assert ("managedFields" in event.object.metadata.__dict__) != (managed_fields == "defer")
+    if managed_fields == "drop":
+        assert event.object.metadata.managedFields == []
+    else:
+        assert event.object.metadata.managedFields[0].manager == "kubelet"
+
+
+def test_k8s_client_read_metadata_only():
+    cl = K8sClient()
+    data = {
+        "kind": "PartialObjectMetadataList",
+        "apiVersion": "meta.k8s.io/v1",
+        "metadata": {"resourceVersion": "1"},
+        "items": [{"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1", "metadata": {"name": "a"}}],
+    }
+    cl.client.call_api.return_value = MagicMock(data=json.dumps(data))
+    items = cl.read(resource_api(), namespace="namespace", metadata_only=True)
+    assert isinstance(items[0], V1PartialObjectMetadata)
+    assert items[0].metadata.name == "a"
+    assert items[0].apiVersion == "meta.k8s.io/v1"
+    headers = cl.client.call_api.call_args.args[4]
+    assert headers["Accept"].startswith("application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1")
+
+    data = {"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1", "metadata": {"name": "a"}}
+    cl.client.call_api.return_value = MagicMock(data=json.dumps(data))
+    item = cl.get(resource_api(), "a", "namespace", metadata_only=True)
+    assert isinstance(item, V1PartialObjectMetadata)
+    headers = cl.client.call_api.call_args.args[4]
+    assert headers["Accept"].startswith("application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1")
+
+
+def test_k8s_client_watch_metadata_only():
+    resp = MagicMock()
+    resp.__iter__.return_value = [
+        '{"type": "ADDED", "object": {"apiVersion": "meta.k8s.io/v1", "kind": "PartialObjectMetadata"}}',
+    ]
+    api = resource_api(obj_type=V1Pod)
+    api.get.return_value = resp
+    events = list(K8sClient().watch(api, "namespace", timeout=1, metadata_only=True))
+    assert isinstance(events[0].object, V1PartialObjectMetadata)
+    assert api.get.call_args.kwargs["header_params"]["Accept"].startswith("application/json;as=PartialObjectMetadata;")
+
+
+def test_k8s_client_watch_predicates_with_watcher():
+    cl = K8sClient()
+    api = pods_api()
+    with pytest.raises(InvalidParameter):
+        cl.watch(api, "ns", watcher=Watch(cl.client, V1Pod), predicates=[GENERATION_CHANGED])
+    assert not api.get.called
+
+
+def table_page(names, token=None):
+    data = {
+        "kind": "Table",
+        "apiVersion": "meta.k8s.io/v1",
+        "metadata": {"continue": token, "resourceVersion": "1"} if token else {"resourceVersion": "2"},
+        "columnDefinitions": [
+            {"name": "Name", "type": "string", "format": "name", "priority": 0},
+            {"name": "Status", "type": "string", "priority": 0},
+            {"name": "IP", "type": "string", "priority": 1},
+        ],
+        "rows": [{"cells": [name, "Running", "10.0.0.1"], "object": None} for name in names],
+    }
+    return MagicMock(data=json.dumps(data))
+
+
+def test_k8s_client_table():
+    cl = K8sClient()
+    cl.client.call_api.side_effect = [table_page(["a", "b"], "token"), table_page(["c"])]
+    table = cl.table(resource_api(), namespace="namespace", label_selector={"app": "name"}, page_size=2)
+    assert isinstance(table, V1Table)
+    assert table.columns == ["Name", "Status", "IP"]
+    assert [row.cells[0] for row in table.rows] == ["a", "b", "c"]
+    assert table.metadata.resourceVersion == "2"
+    assert table.records(priority=0)[0] == {"Name": "a", "Status": "Running"}
+    assert table.records()[2] == {"Name": "c", "Status": "Running", "IP": "10.0.0.1"}
+
+    first, second = cl.client.call_api.call_args_list
+    assert first.args[4]["Accept"] == "application/json;as=Table;g=meta.k8s.io;v=v1"
+    assert ("includeObject", "None") in first.args[3]
+    assert ("labelSelector", "app=name") in first.args[3]
+    assert ("continue", "token") in second.args[3]
+    assert ("continue", "token") not in first.args[3]
+
+
+def test_k8s_client_wait_until_all():
+    cl = K8sClient()
+    api = pods_api()
+    cl.client.call_api.side_effect = lambda *args, **kwargs: pod_list(
+        pod("a", ready=True), pod("b", ready=False), pod("c", ready=False)
+    )
+    api.get.return_value = watch_response(pod("c", "11", ready=True), pod("b", "12", ready=True))
+
+    passed = cl.wait_until_all(api, ["a", "b"], namespace="ns", timeout=5)
+    assert list(passed) == ["ns/a", "ns/b"]
+    assert passed["ns/a"].type == "ADDED"
+    assert passed["ns/b"].object.metadata.resourceVersion == "12"
+    assert api.get.call_count == 1
+    assert api.get.call_args.kwargs["resource_version"] == "10"
+
+    event = cl.wait_until_any(api, label_selector={"app": "web"}, namespace="ns", timeout=5)
+    assert event.object.metadata.name == "a"
+    assert cl.client.call_api.call_args[0][3] == [("labelSelector", "app=web")]
+
+
+def test_k8s_client_wait_until_any_first_passed():
+    cl = K8sClient()
+    api = pods_api()
+    cl.client.call_api.return_value = pod_list(pod("b", ready=True), pod("a", ready=True))
+
+    event = cl.wait_until_any(api, namespace="ns", timeout=5)
+    assert event.object.metadata.name == "b"
+
+
+def test_k8s_client_wait_until_all_gone():
+    cl = K8sClient()
+    api = pods_api()
+    lists = [
+        pod_list(pod("a", ready=False), pod("b", ready=False)),
+        pod_list(pod("a", ready=True), resource_version="20"),
+    ]
+    cl.client.call_api.side_effect = lambda *args, **kwargs: lists.pop(0)
+    responses = [ApiException(status=410), watch_response()]
+
+    def watch(*args, **kwargs):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    api.get.side_effect = watch
+
+    # the transitions while the watch was gone are caught up with by listing again, b was deleted meanwhile
+    passed = cl.wait_until_all(api, namespace="ns", timeout=5)
+    assert list(passed) == ["ns/a"]
+    assert passed["ns/a"].type == "ADDED"
+    assert api.get.call_count == 1
+
+
+def test_k8s_client_wait_until_all_namespaces():
+    cl = K8sClient()
+    api = pods_api()
+    cl.client.call_api.side_effect = lambda *args, **kwargs: pod_list()
+    api.get.side_effect = lambda *args, namespace, **kwargs: watch_response(pod("a", namespace=namespace, ready=True))
+    items = [V1Pod.parse_obj(pod("a", namespace=namespace, ready=True)) for namespace in ("ns", "other")]
+
+    passed = cl.wait_until_all(api, items, timeout=5)
+    assert list(passed) == ["ns/a", "other/a"]
+    assert {call.kwargs["namespace"] for call in api.get.call_args_list} == {"ns", "other"}
+
+
+def test_k8s_client_wait_until_all_timeout():
+    cl = K8sClient()
+    api = pods_api()
+    cl.client.call_api.side_effect = lambda *args, **kwargs: pod_list(pod("a", ready=False))
+    api.get.side_effect = lambda *args, **kwargs: watch_response()
+
+    with pytest.raises(EventTimeoutError) as error:
+        cl.wait_until_all(api, ["a", "b"], namespace="ns", timeout=0.2)
+    assert not error.value.results["ns/a"]
+    assert error.value.results["ns/b"].message == "Pod ns/b not found."
+    assert error.value.last.object.metadata.name == "a"
+
+
+def test_k8s_client_watch_in_background():
+    cl = K8sClient()
+    api = pods_api()
+    api.get.return_value = watch_response(pod("a", "11"), pod("a", "12"))
+
+    events = cl.watch_in_background(api, "ns", timeout=5, overflow="coalesce")
+    assert [event.object.metadata.resourceVersion for event in events][-1] == "12"
+    assert api.get.call_args.kwargs["namespace"] == "ns"
+
+    received = []
+    events = cl.watch_in_background(api, "ns", timeout=5, callback=received.append)
+    wait_for(lambda: events.closed and len(received) == 2)
+    assert [event.object.metadata.resourceVersion for event in received] == ["11", "12"]
+
+
+def test_k8s_client_watch_in_background_close():
+    cl = K8sClient()
+    api = pods_api()
+    shut_down = threading.Event()
+
+    def lines():
+        yield json.dumps({"type": "MODIFIED", "object": pod("a", "11")})
+        # blocks like reading the socket, until the response is shut down
+        shut_down.wait(5)
+
+    resp = MagicMock()
+    resp.__iter__.side_effect = lines
+    resp.shutdown.side_effect = shut_down.set
+    api.get.return_value = resp
+    events = cl.watch_in_background(api, "ns", reconnect=True, metadata_only=True)
+    assert next(events).object.metadata.name == "a"
+    events.close()
+    assert shut_down.wait(1)
+    wait_for(lambda: resp.release_conn.called)
+    time.sleep(0.05)
+    assert api.get.call_count == 1
+
+    # closed right away
+    shut_down.clear()
+    api.get.reset_mock()
+    events = cl.watch_in_background(api, "ns", reconnect=True)
+    events.close()
+    time.sleep(0.1)
+    assert api.get.call_count <= 1
+    # events queued before can still be read, then the iteration ends
+    assert len(list(events)) <= 1
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from kubernetes_dynamic.concurrency import merge, prefetch
+
+
+def test_prefetch():
+    assert list(prefetch(range(10), depth=3)) == list(range(10))
+
+
+def test_prefetch_error():
+    def items():
+        yield 1
+        raise RuntimeError("failed")
+
+    iterator = prefetch(items())
+    assert next(iterator) == 1
+    with pytest.raises(RuntimeError, match="failed"):
+        next(iterator)
+
+
+def test_prefetch_depth():
+    produced = []
+    def items():
+        for item in range(10):
+            produced.append(item)
+            yield item
+
+    iterator = prefetch(items(), depth=2)
+    assert next(iterator) == 0
+    time.sleep(0.3)
+    # one consumed, two queued and one waiting to be queued
+    assert len(produced) <= 4
+    iterator.close()
+
+    with pytest.raises(ValueError):
+        next(prefetch([], depth=0))
+
+
+def test_merge():
+    assert sorted(merge([range(3), range(10, 13), []])) == [0, 1, 2, 10, 11, 12]
+    assert list(merge([range(3)])) == [0, 1, 2]
+
+    def failing():
+        yield 1
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError, match="failed"):
+        list(merge([failing(), range(3)]))
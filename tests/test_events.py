@@ -0,0 +1,203 @@
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from urllib3.exceptions import ProtocolError
+
+from kubernetes_dynamic.backoff import Backoff
+from kubernetes_dynamic.events import GENERATION_CHANGED, LABELS_CHANGED, Event, EventBuffer, Watch, field_changed
+from kubernetes_dynamic.exceptions import ApiException, ForbiddenError, InvalidParameter, WatchOverflowError
+from kubernetes_dynamic.models.pod import V1Pod
+
+
+def response(*resource_versions, error=None):
+    objects = [{"kind": "Pod", "apiVersion": "v1", "metadata": {"resourceVersion": rv}} for rv in resource_versions]
+    lines = [json.dumps({"type": "ADDED", "object": obj}) for obj in objects]
+
+    def iterate():
+        yield from lines
+        if error:
+            raise error
+
+    resp = MagicMock()
+    resp.__iter__.side_effect = iterate
+    return resp
+
+
+def test_watch_reconnect():
+    watcher = Watch(None, V1Pod)
+    last = response("4")
+    func = MagicMock(
+        side_effect=[
+            ApiException(http_resp=MagicMock(status=503, reason="", data=b"", getheaders=lambda: {"Retry-After": "0"})),
+            response("2", error=ProtocolError("Connection reset")),
+            ApiException(status=429),
+            response(),
+            last,
+        ]
+    )
+    backoff = Backoff(initial=0, jitter=0)
+    events = []
+    for event in watcher.stream(func, resource_version="1", timeout_seconds=10, reconnect=True, backoff=backoff):
+        events.append(event.object.metadata.resourceVersion)
+        if len(events) == 2:
+            watcher.stop()
+    assert events == ["2", "4"]
+    # resumed from the last seen resource version, each request with the request timeout
+    assert [call.kwargs["resource_version"] for call in func.call_args_list] == ["1", "1", "2", "2", "2"]
+    assert {call.kwargs["timeout_seconds"] for call in func.call_args_list} == {10}
+    assert backoff.failures == 0
+    last.close.assert_called_once()
+
+
+def test_watch_resumes_after_every_gone():
+    def current(resource_version):
+        return MagicMock(metadata=MagicMock(resourceVersion=resource_version))
+
+    # every 410 Gone is followed by the list of the current resource version
+    func = MagicMock(
+        side_effect=[
+            ApiException(status=410),
+            current("4"),
+            response("5", "6"),
+            ApiException(status=410),
+            current("9"),
+            response("10"),
+        ]
+    )
+    watcher = Watch(None, V1Pod)
+    events = []
+    for event in watcher.stream(func, resource_version="1", reconnect=True, backoff=Backoff(initial=0)):
+        events.append(event.object.metadata.resourceVersion)
+        if len(events) == 3:
+            watcher.stop()
+    assert events == ["5", "6", "10"]
+    assert [call.kwargs["resource_version"] for call in func.call_args_list if "watch" in call.kwargs] == [
+        "1",
+        "4",
+        "6",
+        "9",
+    ]
+
+
+def test_watch_reconnect_not_retriable():
+    func = MagicMock(side_effect=[ApiException(status=503), ApiException(status=403)])
+    with pytest.raises(ForbiddenError):
+        list(Watch(None, V1Pod).stream(func, reconnect=True, backoff=Backoff(initial=0)))
+    assert func.call_count == 2
+
+
+def test_watch_without_reconnect():
+    func = MagicMock(side_effect=[response("2", error=ProtocolError("Connection reset"))])
+    with pytest.raises(ProtocolError):
+        list(Watch(None, V1Pod).stream(func, resource_version="1"))
+
+
+def test_watch_deadline(mocker):
+    clock = mocker.patch("kubernetes_dynamic.events.time.monotonic")
+    clock.side_effect = [0, 0, 30, 61]
+    func = MagicMock(side_effect=lambda *args, **kwargs: response())
+    watcher = Watch(None, V1Pod)
+    assert list(watcher.stream(func, resource_version="1", timeout_seconds=300, reconnect=True, deadline=60)) == []
+    # the request timeouts are limited by the deadline
+    assert [call.kwargs["timeout_seconds"] for call in func.call_args_list] == [60, 30]
+
+
+@pytest.mark.parametrize("options", [{}, {"trusted": True}, {"lazy": True}])
+def test_watch_decodes_object_once(options):
+    obj = {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": "a", "resourceVersion": "3"}}
+    lines = [json.dumps({"type": "MODIFIED", "object": obj})]
+    watcher = Watch(None, V1Pod, **options)
+    (event,) = watcher._parse_response_iter(lines)
+    assert event.type == "MODIFIED"
+    assert isinstance(event.object, V1Pod)
+    assert event.object.metadata.name == "a"
+    assert event.raw_object == obj
+    assert watcher.resource_version == "3"
+
+
+def event(name, resource_version):
+    obj = {"kind": "Pod", "apiVersion": "v1", "metadata": {"name": name, "resourceVersion": resource_version}}
+    return Event.construct(type="MODIFIED", object=V1Pod.parse_obj(obj), raw_object=obj)
+
+
+def versions(events):
+    return [(item.raw_object["metadata"]["name"], item.raw_object["metadata"]["resourceVersion"]) for item in events]
+
+
+def test_event_buffer_overflow():
+    buffer = EventBuffer(2, "drop_oldest")
+    for resource_version in "123":
+        assert buffer.put(event("a", resource_version))
+    buffer.close()
+    assert not buffer.put(event("a", "4"))
+    assert versions(buffer) == [("a", "2"), ("a", "3")]
+    assert buffer.dropped == 1
+
+    buffer = EventBuffer(2, "coalesce")
+    for name, resource_version in [("a", "1"), ("b", "2"), ("a", "3")]:
+        buffer.put(event(name, resource_version))
+    assert versions([next(buffer)]) == [("a", "3")]
+    buffer.put(event("c", "4"))
+    buffer.close()
+    assert versions(buffer) == [("b", "2"), ("c", "4")]
+
+    buffer = EventBuffer(1, "error")
+    assert buffer.put(event("a", "1"))
+    assert not buffer.put(event("b", "2"))
+    assert versions([next(buffer)]) == [("a", "1")]
+    with pytest.raises(WatchOverflowError):
+        next(buffer)
+
+    with pytest.raises(InvalidParameter):
+        EventBuffer(overflow="unknown")
+
+
+def test_event_buffer_block():
+    buffer = EventBuffer(1)
+    buffer.read(event("a", resource_version) for resource_version in "123")
+    time.sleep(0.1)
+    assert len(buffer) == 1
+    assert versions(buffer) == [("a", "1"), ("a", "2"), ("a", "3")]
+
+    def failing():
+        yield event("a", "1")
+        raise ProtocolError("Connection reset")
+
+    buffer = EventBuffer().read(failing())
+    assert versions([next(buffer)]) == [("a", "1")]
+    with pytest.raises(ProtocolError):
+        next(buffer)
+
+
+def test_watch_predicates():
+    def line(type_, name, resource_version, generation=1, labels=None, replicas=1):
+        metadata = {"name": name, "resourceVersion": resource_version, "generation": generation, "labels": labels or {}}
+        obj = {"kind": "Pod", "apiVersion": "v1", "metadata": metadata, "spec": {"replicas": replicas}}
+        return json.dumps({"type": type_, "object": obj})
+
+    lines = [
+        line("ADDED", "a", "1"),
+        line("MODIFIED", "a", "2"),
+        line("MODIFIED", "a", "3", generation=2),
+        line("MODIFIED", "a", "4", generation=2, labels={"app": "web"}),
+        line("MODIFIED", "b", "5"),
+        line("MODIFIED", "b", "6", replicas=2),
+        line("DELETED", "a", "7", generation=2, labels={"app": "web"}),
+        line("MODIFIED", "b", "8", replicas=2),
+    ]
+    return_type = MagicMock(side_effect=V1Pod)
+    watcher = Watch(None, return_type, predicates=[GENERATION_CHANGED])
+    assert [event.raw_object["metadata"]["resourceVersion"] for event in watcher._parse_response_iter(lines)] == [
+        "1",
+        "3",
+        "5",
+        "7",
+    ]
+    assert return_type.call_count == 4
+    assert watcher.resource_version == "8"
+
+    watcher = Watch(None, V1Pod, predicates=[LABELS_CHANGED, field_changed("spec.replicas")])
+    events = watcher._parse_response_iter(lines)
+    assert [event.raw_object["metadata"]["resourceVersion"] for event in events] == ["1", "4", "5", "6", "7"]
@@ -0,0 +1,259 @@
+import threading
+
+import pytest
+
+from kubernetes_dynamic.client import K8sClient
+from kubernetes_dynamic.exceptions import ApiException, InvalidParameter, NotFoundError
+from kubernetes_dynamic.informer import (
+    WATCH_LIST_ATTEMPTS,
+    Store,
+    index_by_labels,
+    index_by_namespace,
+    index_by_node_name,
+    index_by_owner_uid,
+)
+from kubernetes_dynamic.models.pod import V1Pod
+from tests.factories import pod, pod_list, pods_api, watch_response
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def add_to(self, informer, stop_on_delete=None):
+        def on_delete(obj):
+            self.events.append(("delete", obj.metadata.name))
+            if obj.metadata.name == stop_on_delete:
+                informer.stop()
+
+        informer.add_handler(
+            lambda obj: self.events.append(("add", obj.metadata.name)),
+            lambda old, new: self.events.append(("update", old.metadata.name, new.metadata.resourceVersion)),
+            on_delete,
+        )
+
+
+def test_store_replace():
+    store = Store()
+    a, b, c = (V1Pod.parse_obj(pod(name, "1")) for name in "abc")
+    assert store.update(a) is None
+    assert store.update(b) is None
+    b2 = V1Pod.parse_obj(pod("b", "2"))
+    added, updated, deleted = store.replace([b2, c], "5")
+    assert added == [c]
+    assert updated == [(b, b2)]
+    assert deleted == [a]
+    assert store.keys() == ["ns/b", "ns/c"]
+    assert store.get("ns/b") is b2
+    assert store.resource_version == "5"
+
+
+def indexed_pod(name, node=None, labels=None, owner=None, namespace="ns"):
+    data = pod(name, "1")
+    data["metadata"].update(namespace=namespace, labels=labels or {})
+    if owner:
+        data["metadata"]["ownerReferences"] = [{"kind": "ReplicaSet", "name": owner, "uid": f"uid-{owner}"}]
+    if node:
+        data["spec"] = {"nodeName": node, "containers": []}
+    return V1Pod.parse_obj(data)
+
+
+def names(items):
+    return sorted(item.metadata.name for item in items)
+
+
+def test_store_indexers():
+    store = Store({"node": index_by_node_name, "labels": index_by_labels})
+    store.update(indexed_pod("a", node="node-1", labels={"app": "web"}))
+    store.update(indexed_pod("b", node="node-1", labels={"app": "db"}))
+    store.update(indexed_pod("c", labels={"app": "web"}, owner="rs"))
+    assert names(store.by_index("node", "node-1")) == ["a", "b"]
+    assert names(store.by_index("labels", "app=web")) == ["a", "c"]
+
+    store.update(indexed_pod("a", node="node-2", labels={"app": "web"}))
+    assert names(store.by_index("node", "node-1")) == ["b"]
+    assert names(store.by_index("node", "node-2")) == ["a"]
+    store.delete(indexed_pod("b"))
+    assert store.by_index("node", "node-1") == []
+    assert sorted(store.index_values("node")) == ["node-2"]
+
+    # added later indexes the cached objects
+    store.add_indexers({"owner": index_by_owner_uid, "namespace": index_by_namespace})
+    assert names(store.by_index("owner", "uid-rs")) == ["c"]
+    assert names(store.by_index("namespace", "ns")) == ["a", "c"]
+    store.add_indexers({"owner": index_by_owner_uid})
+    with pytest.raises(InvalidParameter):
+        store.add_indexers({"owner": index_by_node_name})
+    with pytest.raises(InvalidParameter):
+        store.by_index("missing", "value")
+
+    store.replace([indexed_pod("d", namespace="other", node="node-1")], "2")
+    assert names(store.by_index("node", "node-1")) == ["d"]
+    assert store.by_index("namespace", "ns") == []
+    assert store.by_index("owner", "uid-rs") == []
+
+
+def test_informer_list_and_watch():
+    cl = K8sClient()
+    api = pods_api()
+    cl.client.call_api.return_value = pod_list(pod("a", "1"), pod("b", "2"))
+    api.get.return_value = watch_response(
+        ("MODIFIED", pod("a", "11")),
+        ("ADDED", pod("c", "12")),
+        ("BOOKMARK", {"kind": "Pod", "apiVersion": "v1", "metadata": {"resourceVersion": "12"}}),
+        ("DELETED", pod("b", "13")),
+    )
+    informer = cl.informer(api, "ns", start=False, indexers={"namespace": index_by_namespace})
+    recorder = Recorder()
+    recorder.add_to(informer, stop_on_delete="b")
+    informer.start()._thread.join(5)
+
+    assert informer.has_synced
+    assert names(informer.by_index("namespace", "ns")) == ["a", "c"]
+    assert recorder.events == [("add", "a"), ("add", "b"), ("update", "a", "11"), ("add", "c"), ("delete", "b")]
+    assert sorted(item.metadata.name for item in informer.list()) == ["a", "c"]
+    assert isinstance(informer.get("a", "ns"), V1Pod)
+    assert informer.resource_version == "13"
+    assert api.get.call_args.kwargs["resource_version"] == "10"
+    # the collection is listed in pages, not read as a single object
+    assert api.path.call_args.kwargs == {"namespace": "ns"}
+    assert ("limit", 500) in cl.client.call_api.call_args[0][3]
+
+    late = Recorder()
+    late.add_to(informer)
+    assert sorted(late.events) == [("add", "a"), ("add", "c")]
+
+
+def test_informer_relist_on_gone():
+    cl = K8sClient()
+    api = pods_api()
+    cl.client.call_api.side_effect = [
+        pod_list(pod("a", "1"), pod("b", "2")),
+        pod_list(pod("b", "3"), resource_version="20"),
+    ]
+    api.get.return_value = watch_response(("ERROR", {"kind": "Status", "apiVersion": "v1", "code": 410}))
+    informer = cl.informer(api, "ns", start=False)
+    recorder = Recorder()
+    recorder.add_to(informer, stop_on_delete="a")
+    informer.start()._thread.join(5)
+
+    assert recorder.events == [("add", "a"), ("add", "b"), ("update", "b", "3"), ("delete", "a")]
+    assert informer.resource_version == "20"
+
+
+def initial_events_end(resource_version):
+    metadata = {"resourceVersion": resource_version, "annotations": {"k8s.io/initial-events-end": "true"}}
+    return ("BOOKMARK", {"kind": "Pod", "apiVersion": "v1", "metadata": metadata})
+
+
+def test_informer_watch_list():
+    cl = K8sClient()
+    api = pods_api()
+    api.get.return_value = watch_response(
+        ("ADDED", pod("a", "1")),
+        ("ADDED", pod("b", "2")),
+        initial_events_end("10"),
+        ("MODIFIED", pod("a", "11")),
+        ("DELETED", pod("b", "12")),
+    )
+    informer = cl.informer(api, "ns", start=False, watch_list=True)
+    recorder = Recorder()
+    recorder.add_to(informer, stop_on_delete="b")
+    informer.start()._thread.join(5)
+
+    assert informer.has_synced
+    assert recorder.events == [("add", "a"), ("add", "b"), ("update", "a", "11"), ("delete", "b")]
+    assert informer.resource_version == "12"
+    assert not cl.client.call_api.called
+    kwargs = api.get.call_args.kwargs
+    assert kwargs["send_initial_events"] is True
+    assert kwargs["resource_version_match"] == "NotOlderThan"
+    assert kwargs["allow_watch_bookmarks"] is True
+
+
+def test_informer_watch_list_fallback():
+    cl = K8sClient()
+    api = pods_api()
+    cl.client.call_api.return_value = pod_list(pod("a", "1"), pod("b", "2"))
+    api.get.side_effect = [ApiException(status=422), watch_response(("DELETED", pod("b", "11")))]
+    informer = cl.informer(api, "ns", start=False, watch_list=True)
+    recorder = Recorder()
+    recorder.add_to(informer, stop_on_delete="b")
+    informer.start()._thread.join(5)
+
+    assert not informer.watch_list
+    assert recorder.events == [("add", "a"), ("add", "b"), ("delete", "b")]
+    assert "send_initial_events" not in api.get.call_args.kwargs
+
+
+def test_informer_watch_list_without_initial_events_end():
+    cl = K8sClient()
+    api = pods_api()
+    cl.client.call_api.return_value = pod_list(pod("a", "1"), pod("b", "2"))
+    responses = [watch_response(("ADDED", pod("a", "1"))) for _ in range(WATCH_LIST_ATTEMPTS)]
+    api.get.side_effect = responses + [watch_response(("DELETED", pod("b", "11")))]
+    informer = cl.informer(api, "ns", start=False, watch_list=True)
+    recorder = Recorder()
+    recorder.add_to(informer, stop_on_delete="b")
+    informer.start()._thread.join(5)
+
+    assert not informer.watch_list
+    assert informer.has_synced
+    assert recorder.events == [("add", "a"), ("add", "b"), ("delete", "b")]
+    assert api.get.call_count == WATCH_LIST_ATTEMPTS + 1
+    assert "send_initial_events" not in api.get.call_args.kwargs
+
+
+def test_informer_shared():
+    cl = K8sClient()
+    api = pods_api()
+    informer = cl.informer(api, "ns", label_selector={"app": "a"}, start=False)
+    assert cl.informer(api, "ns", label_selector="app=a", start=False) is informer
+    assert cl.informer(api, "other", label_selector="app=a", start=False) is not informer
+    assert cl.informer(api, "ns", start=False) is not informer
+    assert informer.label_selector == "app=a"
+
+    cl.stop_informers()
+    assert informer.stopped
+    assert cl.informer(api, "ns", label_selector="app=a", start=False) is not informer
+
+
+def test_lister():
+    cl = K8sClient()
+    api = pods_api()
+    cl.client.call_api.return_value = pod_list(pod("a", "1"), pod("b", "2"))
+    release = threading.Event()
+
+    def watch(*args, **kwargs):
+        release.wait(5)
+        return watch_response()
+
+    api.get.side_effect = watch
+    informer = cl.enable_lister(api, "ns", timeout=5)
+    assert informer.has_synced
+    assert cl.wait_for_sync(api, timeout=0)
+    calls = cl.client.call_api.call_count
+
+    assert cl.get(api, "a", "ns") is informer.get("a", "ns")
+    assert cl.get(api, "missing", "ns") is None
+    with pytest.raises(NotFoundError):
+        cl.read(api, "missing", "ns")
+    items = cl.read(api, namespace="ns")
+    assert names(items) == ["a", "b"]
+    assert items.metadata.resourceVersion == "10"
+    assert names(cl.find(api, "^a", "ns")) == ["a"]
+    assert cl.client.call_api.call_count == calls
+
+    # reads the cache cannot answer go to the server
+    cl.read(api, namespace="other")
+    cl.read(api, namespace="ns", label_selector="app=a")
+    cl.read(api, namespace="ns", page_size=10)
+    assert cl.client.call_api.call_count == calls + 3
+
+    cl.disable_lister(api)
+    cl.read(api, namespace="ns")
+    assert cl.client.call_api.call_count == calls + 4
+    with pytest.raises(InvalidParameter):
+        cl.wait_for_sync(api)
+    release.set()
+    cl.stop_informers()
@@ -0,0 +1,39 @@
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from kubernetes_dynamic import json_codec
+from kubernetes_dynamic.models.resource_value import ResourceValue
+
+
+@pytest.fixture
+def restore_backend():
+    previous = json_codec.backend()
+    yield
+    json_codec.set_backend(previous)
+
+
+@pytest.mark.parametrize("backend", json_codec.BACKENDS)
+def test_json_codec(backend: str, restore_backend):
+    try:
+        assert json_codec.set_backend(backend) == backend
+    except ImportError:
+        pytest.skip(f"{backend} is not installed")
+    assert json_codec.backend() == backend
+    assert json_codec.loads(b'{"a": [1, "b"]}') == {"a": [1, "b"]}
+    assert json_codec.loads('{"a": null}') == {"a": None}
+    data = {"time": datetime(2023, 1, 2, 3, 4, 5), "value": ResourceValue(key="value")}
+    assert json_codec.loads(json_codec.dumps(data)) == {"time": "2023-01-02T03:04:05", "value": {"key": "value"}}
+    with pytest.raises(TypeError):
+        json_codec.dumps({"value": object()})
+
+
+def test_json_codec_fallback(restore_backend):
+    missing = Mock(side_effect=ImportError)
+    with patch.dict(json_codec._loaders, {"orjson": missing, "msgspec": missing}):
+        assert json_codec.set_backend() == "json"
+        with pytest.raises(ImportError):
+            json_codec.set_backend("orjson")
+    with pytest.raises(ValueError):
+        json_codec.set_backend("invalid")
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pytest
+
+import kubernetes_dynamic.models as models
+from kubernetes_dynamic.models.common import get_default, get_type
+from kubernetes_dynamic.models.groups import KINDS, MODELS, load_kind, load_model
+from kubernetes_dynamic.models.pod import V1Pod
+
+
+def loaded_groups(code: str) -> set:
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{code}\n"
+            "prefix = 'kubernetes_dynamic.models.groups.'\n"
+            "print(','.join(m[len(prefix):] for m in sys.modules if m.startswith(prefix)))",
+        ],
+        text=True,
+    )
+    return set(filter(None, output.strip().split(",")))
+
+
+def test_import_loads_no_groups():
+    assert loaded_groups("import kubernetes_dynamic") == set()
+
+
+def test_get_type_loads_single_group():
+    assert loaded_groups("from kubernetes_dynamic.models.common import get_type; get_type('Deployment', 'v1')") == {
+        "apps_v1",
+        "core_v1",
+    }
+    assert loaded_groups("import kubernetes_dynamic.models as m; m.V1Lease") == {"coordination_v1"}
+
+
+def test_models_getattr():
+    assert models.V1Pod is V1Pod
+    assert models.V1PodSpec.__name__ == "V1PodSpec"
+    assert "V1Deployment" in dir(models)
+    with pytest.raises(AttributeError):
+        models.V1NotExisting
+
+
+def test_get_type():
+    assert get_type("Pod", "v1") is V1Pod
+    assert get_type("Deployment", "v1") is models.V1Deployment
+    assert get_type("FlowSchema", "v1beta3") is models.V1beta3FlowSchema
+    assert get_type("Pod", "v2", "default") == "default"
+    assert get_type("NotExisting", "v1") is None
+
+
+def test_get_default():
+    assert get_default("V1PodSpec") == models.V1PodSpec()
+
+
+def test_index_consistent():
+    for name in MODELS:
+        assert load_model(name).__name__ == name
+    for kind, versions in KINDS.items():
+        for version in versions:
+            assert load_kind(kind, version) is not None
+
+
+def test_forward_refs_resolved():
+    pod = V1Pod.parse_obj({"spec": {"containers": [{"name": "container", "ports": [{"containerPort": 80}]}]}})
+    assert pod.spec.containers[0].ports[0].containerPort == 80
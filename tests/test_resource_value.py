@@ -1,3 +1,7 @@
+from datetime import datetime
+
+from kubernetes_dynamic.models.groups.core_v1 import V1Container, V1ContainerPort
+from kubernetes_dynamic.models.pod import V1Pod
 from kubernetes_dynamic.models.resource_value import ResourceValue
 
 
@@ -18,3 +22,78 @@ def test_resource_dict_methods():
     assert item.get("key6") is None
     item["key5"] = "newval"
     assert item["key5"] == "newval"
+
+
+def test_resource_from_trusted():
+    data = dict(key1="val1", key2={"subkey1": 3}, key3=[{"subl1": 4}], key4=None)
+    item = ResourceValue.from_trusted(data)
+    assert item == ResourceValue(data)
+    assert isinstance(item.key2, ResourceValue)
+    assert isinstance(item.key3[0], ResourceValue)
+
+
+def test_resource_from_trusted_typed():
+    definition = {
+        "metadata": {
+            "name": "name",
+            "creationTimestamp": "2023-01-01T00:00:00Z",
+            "labels": {"app": "name"},
+            "ownerReferences": [{"name": "owner", "uid": "1"}],
+            "managedFields": [{"manager": "manager", "fieldsV1": {"f:metadata": {}}}],
+        },
+        "spec": {"containers": [{"name": "container", "ports": [{"containerPort": 80}]}]},
+        "status": {"phase": "Running", "extra": {"key": "value"}},
+    }
+    pod = V1Pod.from_trusted(definition)
+    assert pod == V1Pod.parse_obj(definition)
+    assert pod.kind == "Pod"
+    assert pod.apiVersion == "v1"
+    assert isinstance(pod.metadata.creationTimestamp, datetime)
+    assert isinstance(pod.spec.containers[0].ports[0], V1ContainerPort)
+    assert isinstance(pod.status.extra, ResourceValue)
+
+
+def test_resource_from_trusted_lazy():
+    definition = {
+        "kind": "Pod",
+        "apiVersion": "v1",
+        "metadata": {"name": "name", "labels": {"app": "name"}, "creationTimestamp": "2023-01-01T00:00:00Z"},
+        "spec": {"containers": [{"name": "container"}]},
+        "extra": {"key": "value"},
+    }
+    pod = V1Pod.from_trusted(definition, lazy=True)
+    assert pod.__dict__ == {}
+    assert pod.metadata.name == "name"
+    assert list(pod.__dict__) == ["metadata"]
+    assert pod.to_dict() is definition
+    assert pod == V1Pod.parse_obj(definition)
+    assert repr(pod) == repr(V1Pod.parse_obj(definition))
+    assert isinstance(pod.extra, ResourceValue)
+    assert pod.notexisting is None
+    assert "spec" in pod and "notexisting" not in pod
+
+
+def test_resource_from_trusted_lazy_modified():
+    definition = {
+        "kind": "Pod",
+        "apiVersion": "v1",
+        "metadata": {"name": "name", "labels": {}},
+        "spec": {"containers": [{"name": "container"}]},
+    }
+    pod = V1Pod.from_trusted(definition, lazy=True)
+    pod.metadata.labels["app"] = "name"
+    assert pod.to_dict() is definition
+    assert definition["metadata"]["labels"] == {"app": "name"}
+
+    pod.metadata.name = "other"
+    assert pod.to_dict() is not definition
+    assert pod.to_dict()["metadata"]["name"] == "other"
+
+    pod = V1Pod.from_trusted(definition, lazy=True)
+    pod.spec.containers.append(V1Container(name="other"))
+    assert [container["name"] for container in pod.to_dict()["spec"]["containers"]] == ["container", "other"]
+
+    pod = V1Pod.from_trusted(definition, lazy=True)
+    pod.status.phase = "Running"
+    assert pod.to_dict()["status"]["phase"] == "Running"
+    assert pod.copy().to_dict() is not definition
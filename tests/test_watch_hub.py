@@ -0,0 +1,144 @@
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from kubernetes_dynamic.client import K8sClient
+from kubernetes_dynamic.exceptions import ApiException, ForbiddenError, WatchOverflowError
+from tests.factories import pod, pod_list, pods_api, wait_for, watch_response
+
+
+def client():
+    cl = K8sClient()
+    cl.client.call_api.return_value = pod_list()
+    return cl
+
+
+def gated_watch(api, *pods):
+    """The first watch request waits for `gate` and yields `pods`, the next ones wait for `release`."""
+    gate, release = threading.Event(), threading.Event()
+    responses = [watch_response(*pods)]
+
+    def watch(*args, **kwargs):
+        if responses:
+            gate.wait(5)
+            return responses.pop()
+        release.wait(5)
+        return MagicMock()
+
+    api.get.side_effect = watch
+    return gate, release
+
+
+def test_watch_hub_fan_out():
+    cl = client()
+    api = pods_api()
+    gate, release = gated_watch(api, pod("a", "11"), pod("b", "12"))
+    first = cl.subscribe(api, "ns")
+    second = cl.subscribe(api, "ns", max_queued=10)
+    received = []
+    done = threading.Event()
+
+    def callback(event):
+        received.append(event.object.metadata.name)
+        if len(received) == 2:
+            done.set()
+
+    third = cl.subscribe(api, "ns", callback=callback)
+    hub = first.hub
+    assert second.hub is hub and third.hub is hub
+    assert hub.subscribers == 3
+    gate.set()
+
+    events = [next(first), next(first)]
+    assert [event.object.metadata.name for event in events] == ["a", "b"]
+    # decoded once and shared
+    assert all(a is b for a, b in zip(events, [next(second), next(second)]))
+    assert done.wait(5) and received == ["a", "b"]
+    assert api.get.call_args_list[0].kwargs["resource_version"] == "10"
+
+    first.close()
+    second.close()
+    assert list(first) == []
+    assert not hub.stopped
+    third.close()
+    assert hub.stopped
+    with cl.subscribe(api, "ns") as subscription:
+        assert subscription.hub is not hub
+    with cl.subscribe(api, "other") as subscription:
+        assert subscription.hub.namespace == "other"
+    release.set()
+
+
+def test_watch_hub_overflow():
+    cl = client()
+    api = pods_api()
+    gate, release = gated_watch(api, pod("a", "11"), pod("b", "12"), pod("c", "13"))
+    slow = cl.subscribe(api, "ns", max_queued=1)
+    other = cl.subscribe(api, "ns")
+    gate.set()
+
+    wait_for(lambda: slow.closed)
+    assert next(slow).object.metadata.name == "a"
+    with pytest.raises(WatchOverflowError):
+        next(slow)
+    assert [next(other).object.metadata.name for _ in range(3)] == ["a", "b", "c"]
+    assert slow.hub.subscribers == 1
+    other.close()
+    release.set()
+
+
+def test_watch_hub_slow_coalesce_subscriber():
+    cl = client()
+    api = pods_api()
+    gate, release = gated_watch(api, pod("a", "11"), pod("b", "12"), pod("c", "13"))
+    slow = cl.subscribe(api, "ns", max_queued=1, overflow="coalesce")
+    fast = cl.subscribe(api, "ns")
+    gate.set()
+
+    assert [next(fast).object.metadata.name for _ in range(3)] == ["a", "b", "c"]
+    wait_for(lambda: slow.closed)
+    assert next(slow).object.metadata.name == "a"
+    with pytest.raises(WatchOverflowError):
+        next(slow)
+    # the hub is not held up by the slow subscriber
+    late = cl.subscribe(api, "ns")
+    assert slow.hub.subscribers == 2
+    late.close()
+    fast.close()
+    release.set()
+
+
+def test_watch_hub_error():
+    cl = client()
+    api = pods_api()
+    api.get.side_effect = ApiException(status=403)
+    subscription = cl.subscribe(api, "ns")
+
+    with pytest.raises(ForbiddenError):
+        next(subscription)
+    assert subscription.hub.stopped
+
+
+def test_watch_hub_releases_connection():
+    cl = client()
+    api = pods_api()
+    shut_down = threading.Event()
+
+    def lines():
+        yield json.dumps({"type": "MODIFIED", "object": pod("a", "11")})
+        # blocks like reading the socket, until the response is shut down
+        shut_down.wait(5)
+
+    resp = MagicMock()
+    resp.__iter__.side_effect = lines
+    resp.shutdown.side_effect = shut_down.set
+    api.get.return_value = resp
+    subscription = cl.subscribe(api, "ns")
+    assert next(subscription).object.metadata.name == "a"
+
+    subscription.close()
+    assert shut_down.wait(1)
+    wait_for(lambda: resp.release_conn.called)
+    assert api.get.call_count == 1
@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+from kubernetes_dynamic.backoff import Backoff
+from kubernetes_dynamic.events import Event
+from kubernetes_dynamic.models.pod import V1Pod
+from kubernetes_dynamic.workqueue import RateLimiter, TokenBucket, WorkQueue, key_of, run_workers
+
+
+def pod(name):
+    return V1Pod.parse_obj({"kind": "Pod", "apiVersion": "v1", "metadata": {"name": name, "namespace": "ns"}})
+
+
+def test_key_of():
+    obj = pod("a")
+    assert key_of(obj) == "ns/a"
+    assert key_of(Event.construct(type="MODIFIED", object=obj, raw_object={})) == "ns/a"
+    assert key_of("ns/a") == "ns/a"
+
+
+def test_work_queue_coalesces():
+    queue = WorkQueue()
+    for _ in range(3):
+        queue.add(pod("a"))
+    queue.add("ns/b")
+    assert len(queue) == 2
+
+    key = queue.get()
+    assert key == "ns/a"
+    # added while processing, queued again once done
+    queue.add("ns/a")
+    assert queue.get() == "ns/b"
+    assert queue.get(timeout=0.01) is None
+    queue.done(key)
+    assert queue.get(timeout=0.01) == "ns/a"
+    queue.done("ns/a")
+    queue.done("ns/b")
+
+    metrics = queue.metrics()
+    assert metrics["depth"] == 0
+    assert metrics["adds"] == 3
+    assert metrics["work_duration_seconds_max"] > 0
+
+    queue.add("ns/c")
+    queue.shut_down()
+    queue.add("ns/d")
+    assert queue.get() == "ns/c"
+    assert queue.get() is None
+
+
+def test_work_queue_delays():
+    queue = WorkQueue(RateLimiter(Backoff(initial=0.05, jitter=0), TokenBucket(rate=1000, burst=1)))
+    start = time.monotonic()
+    queue.add_after("ns/a", 0.05)
+    assert queue.get() == "ns/a"
+    assert time.monotonic() - start >= 0.05
+    queue.done("ns/a")
+
+    assert queue.rate_limiter.when("ns/b") == 0.05
+    assert queue.rate_limiter.when("ns/b") == 0.1
+    assert queue.retries("ns/b") == 2
+    queue.forget("ns/b")
+    assert queue.retries("ns/b") == 0
+
+    queue.add_rate_limited("ns/c")
+    assert queue.metrics()["waiting"] == 1
+    assert queue.get(timeout=5) == "ns/c"
+    assert queue.metrics()["retries"] == 1
+
+
+def test_work_queue_delays_once():
+    queue = WorkQueue()
+    for _ in range(100):
+        queue.add_after("ns/a", 60)
+    queue.add_after("ns/b", 60)
+    assert len(queue._waiting) == 2
+    # an earlier time replaces the waiting one
+    queue.add_after("ns/a", 0.01)
+    assert queue.metrics()["waiting"] == 2
+    assert queue.get(timeout=5) == "ns/a"
+    queue.done("ns/a")
+    assert queue.metrics()["waiting"] == 1
+    assert queue.get(timeout=0.05) is None
+    queue.shut_down()
+    assert queue.metrics()["waiting"] == 0
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_run_workers():
+    queue = WorkQueue(RateLimiter(Backoff(initial=0.01, jitter=0)))
+    reconciled = []
+
+    def reconcile(key):
+        reconciled.append(key)
+        if key == "ns/failing":
+            raise RuntimeError("failed")
+
+    queue.add("ns/failing")
+    queue.add("ns/a")
+    threads = run_workers(queue, reconcile, workers=2, max_retries=2)
+    for _ in range(100):
+        if reconciled.count("ns/failing") == 3:
+            break
+        time.sleep(0.01)
+    time.sleep(0.05)
+    queue.shut_down()
+    for thread in threads:
+        thread.join(5)
+
+    assert reconciled.count("ns/failing") == 3
+    assert reconciled.count("ns/a") == 1
+    assert queue.retries("ns/failing") == 0